@@ -11,7 +11,13 @@ from pathlib import Path
 
 # Harness root directory - where beads_config.py lives
 # This is the Linear-Coding-Agent-Harness directory
-HARNESS_ROOT = Path(__file__).parent.resolve()
+# os.path.abspath() is a pure string operation; Path.resolve() walks the tree
+# with realpath. Set BEADS_RESOLVE_SYMLINKS=1 when the harness is reached
+# through a symlink and the canonical path is needed.
+if os.environ.get("BEADS_RESOLVE_SYMLINKS"):
+    HARNESS_ROOT = Path(__file__).parent.resolve()
+else:
+    HARNESS_ROOT = Path(os.path.abspath(os.path.dirname(__file__)))
 
 # Beads root directory - where .beads/ database lives
 # Currently same as HARNESS_ROOT. Can be overridden via BEADS_ROOT environment variable
@@ -61,6 +67,10 @@ PRIORITY_LOW = 3
 # Local marker file to track Beads project initialization
 BEADS_PROJECT_MARKER = ".beads_project.json"
 
+# Precomputed root-level paths (avoid rebuilding them on every validation call)
+BEADS_MARKER_PATH = BEADS_ROOT / BEADS_PROJECT_MARKER
+BEADS_DB_DIR = BEADS_ROOT / ".beads"
+
 # Meta issue title for project tracking and session handoff
 META_ISSUE_TITLE = "[META] Project Progress Tracker"
 
@@ -93,7 +103,6 @@ def validate_beads_location() -> bool:
         True if .beads/ location is valid, False if rogue directories exist
     """
     # Import here to avoid circular dependency
-    from progress import detect_rogue_beads_dirs
+    from progress import has_rogue_beads_dirs
 
-    rogue_dirs = detect_rogue_beads_dirs()
-    return len(rogue_dirs) == 0
+    return not has_rogue_beads_dirs()
@@ -6,10 +6,99 @@ Functions for tracking and displaying progress of the autonomous coding agent.
 Progress is tracked via Beads issues at the project root level.
 """
 
+import functools
 import json
+import os
+import sys
+import time
 from pathlib import Path
 
-from beads_config import BEADS_PROJECT_MARKER, BEADS_ROOT, SPECS_DIR
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from beads_config import (
+    BEADS_DB_DIR,
+    BEADS_MARKER_PATH,
+    BEADS_PROJECT_MARKER,
+    BEADS_ROOT,
+    SPECS_DIR,
+)
+
+# Parse whole-buffer JSON with orjson when installed, stdlib json otherwise.
+# Both raise ValueError subclasses on malformed input.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Parsed marker files keyed by path. Each entry stores the file's
+# (st_mtime_ns, st_size) at parse time so edits are picked up on the next
+# call without explicit invalidation.
+_STATE_CACHE: dict[str, tuple[int, int, dict | None]] = {}
+
+# Directories never descended into when scanning specs for rogue .beads/.
+# Hidden directories (leading ".") are skipped as well.
+_ROGUE_SCAN_SKIP_DIRS = frozenset({"node_modules", "__pycache__"})
+
+# Result of the last complete rogue scan: (specs_dir, fingerprint, rogue_dirs).
+# The fingerprint holds (path, st_mtime_ns) for every directory the walk
+# listed, so creating or removing a .beads/ anywhere in the scanned tree
+# invalidates it. Revalidating costs one stat per directory instead of a
+# full listing.
+_rogue_scan_cache: tuple[Path, tuple[tuple[str, int], ...], list[Path]] | None = None
+
+# Directories modified this recently are not cached: filesystem timestamps
+# are coarse, so a second change within the same tick would not bump mtime.
+_RACY_MTIME_WINDOW_NS = 1_000_000_000
+
+
+# Root-level paths derived from BEADS_ROOT. Seeded from the beads_config
+# constants and only rebuilt if BEADS_ROOT is rebound (e.g. patched in tests).
+# Stored as str so os.stat()/open() skip PurePath.__fspath__ on every call.
+_root_paths: tuple[Path, str, str] = (
+    BEADS_ROOT,
+    os.fspath(BEADS_MARKER_PATH),
+    os.fspath(BEADS_DB_DIR),
+)
+
+
+def _get_root_paths() -> tuple[str, str]:
+    """
+    Return (marker_path, beads_dir) for the current BEADS_ROOT.
+
+    Returns:
+        Tuple of the root marker file and the root .beads/ directory as
+        strings, reused across calls while BEADS_ROOT is unchanged.
+    """
+    global _root_paths
+    if _root_paths[0] is not BEADS_ROOT:
+        _root_paths = (
+            BEADS_ROOT,
+            os.path.join(BEADS_ROOT, BEADS_PROJECT_MARKER),
+            os.path.join(BEADS_ROOT, ".beads"),
+        )
+    return _root_paths[1], _root_paths[2]
+
+
+def invalidate_rogue_scan_cache() -> None:
+    """
+    Drop the cached rogue .beads/ scan result.
+
+    Call after creating or removing .beads/ directories in-process (e.g. the
+    migration script) to force the next detection to rescan.
+    """
+    global _rogue_scan_cache
+    _rogue_scan_cache = None
+
+
+def invalidate_beads_state_cache() -> None:
+    """
+    Drop all cached marker state (root and spec markers).
+
+    Writers that may rewrite a marker file with identical size within the
+    filesystem's timestamp granularity should call this after writing.
+    """
+    _STATE_CACHE.clear()
+    _read_spec_marker.cache_clear()
 
 
 def load_beads_project_state(project_dir: Path = None) -> dict | None:
@@ -20,19 +109,29 @@ def load_beads_project_state(project_dir: Path = None) -> dict | None:
         project_dir: Ignored - always uses BEADS_ROOT for single-database architecture
 
     Returns:
-        Project state dict or None if not initialized
+        Project state dict or None if not initialized. The dict is shared
+        with the in-process cache and must be treated as read-only.
     """
     # Always check project root for beads marker (single database architecture)
-    marker_file = BEADS_ROOT / BEADS_PROJECT_MARKER
+    marker_file, _ = _get_root_paths()
 
-    if not marker_file.exists():
+    try:
+        st = os.stat(marker_file)
+    except OSError:
         return None
 
+    cached = _STATE_CACHE.get(marker_file)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
     try:
-        with open(marker_file, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
-        return None
+        with open(marker_file, "rb") as f:
+            state = _json_loads(f.read())
+    except (ValueError, OSError):
+        state = None
+
+    _STATE_CACHE[marker_file] = (st.st_mtime_ns, st.st_size, state)
+    return state
 
 
 def is_beads_initialized(project_dir: Path = None) -> bool:
@@ -45,12 +144,12 @@ def is_beads_initialized(project_dir: Path = None) -> bool:
     Returns:
         True if .beads/ exists at project root with valid marker
     """
-    # Check for .beads directory at root
-    beads_dir = BEADS_ROOT / ".beads"
-    if not beads_dir.exists():
+    # Check for .beads directory at root (single stat, no Path allocation)
+    _, beads_dir = _get_root_paths()
+    if not os.path.isdir(beads_dir):
         return False
 
-    # Check for marker file
+    # Check for marker file (missing marker is handled by the stat in the loader)
     state = load_beads_project_state()
     return state is not None and state.get("initialized", False)
 
@@ -72,18 +171,140 @@ def is_spec_initialized(project_dir: Path) -> bool:
     if project_dir is None:
         return False
 
-    spec_marker = project_dir / BEADS_PROJECT_MARKER
-    if not spec_marker.exists():
+    spec_marker = os.path.join(project_dir, BEADS_PROJECT_MARKER)
+    try:
+        st = os.stat(spec_marker)
+    except OSError:
         return False
 
+    return _read_spec_marker(spec_marker, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=256)
+def _read_spec_marker(marker_path: str, mtime_ns: int, size: int) -> bool:
+    """
+    Parse a spec marker and report whether it records a META issue ID.
+
+    Memoized on (path, mtime, size) so repeated checks of an unchanged
+    marker skip the read and parse; a rewrite changes the key.
+
+    Args:
+        marker_path: Path to the spec's .beads_project.json
+        mtime_ns: Marker st_mtime_ns (cache key only)
+        size: Marker st_size (cache key only)
+
+    Returns:
+        True if the marker has a non-null meta_issue_id
+    """
     try:
-        with open(spec_marker, "r") as f:
-            state = json.load(f)
-            # A spec is initialized if it has a META issue ID
-            return state.get("meta_issue_id") is not None
-    except (json.JSONDecodeError, IOError):
+        with open(marker_path, "rb") as f:
+            state = _json_loads(f.read())
+    except (ValueError, OSError):
         return False
 
+    # A spec is initialized if it has a META issue ID
+    return state.get("meta_issue_id") is not None
+
+
+def _rogue_scan_cache_is_valid(specs_dir: Path) -> bool:
+    """
+    Check whether the cached rogue scan still describes specs_dir.
+
+    Args:
+        specs_dir: Specs directory the caller is about to scan
+
+    Returns:
+        True if every directory listed by the cached scan still has the
+        same mtime, False if the cache is empty, for another root, or stale
+    """
+    if _rogue_scan_cache is None or _rogue_scan_cache[0] != specs_dir:
+        return False
+
+    for path, mtime_ns in _rogue_scan_cache[1]:
+        try:
+            if os.stat(path).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+
+    return True
+
+
+def _scan_rogue_beads_dirs(specs_dir: Path) -> tuple[list[Path], list[tuple[str, int]]]:
+    """
+    Walk specs_dir with os.scandir() looking for spec-level .beads/.
+
+    Directory checks use the d_type cached on each DirEntry (no per-entry
+    stat), symlinks are not followed, and hidden/vendored directories listed
+    in _ROGUE_SCAN_SKIP_DIRS are never descended into.
+
+    Args:
+        specs_dir: Root of the specs tree to scan
+
+    Returns:
+        Tuple of (rogue .beads/ paths, (path, st_mtime_ns) for every
+        directory listed during the walk)
+    """
+    rogue_dirs = []
+    fingerprint = []
+
+    # Walk the specs tree looking for .beads/ (e.g., spec/.beads or
+    # spec/implementation/.beads). The name is a fixed string, so a plain
+    # equality check replaces rglob's per-entry fnmatch.
+    stack = [os.fspath(specs_dir)]
+    while stack:
+        current = stack.pop()
+        try:
+            # The mtime is taken before listing so a concurrent change is
+            # seen as stale on the next call
+            fingerprint.append((current, os.stat(current).st_mtime_ns))
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    name = entry.name
+                    if name == ".beads":
+                        # Record the violation; its contents are irrelevant
+                        rogue_dirs.append(Path(entry.path))
+                    elif not name.startswith(".") and name not in _ROGUE_SCAN_SKIP_DIRS:
+                        stack.append(entry.path)
+        except OSError:
+            # Unreadable or concurrently removed directory - skip it
+            continue
+
+    return rogue_dirs, fingerprint
+
+
+def _current_rogue_beads_dirs() -> list[Path]:
+    """
+    Return the rogue .beads/ list for SPECS_DIR, served from the scan cache
+    when every fingerprinted directory is unchanged.
+
+    Returns:
+        List of violating .beads/ paths. On a cache hit this is the cached
+        list itself and must not be mutated.
+    """
+    global _rogue_scan_cache
+
+    # Only scan if SPECS_DIR exists
+    if not os.path.isdir(SPECS_DIR):
+        return []
+
+    if _rogue_scan_cache_is_valid(SPECS_DIR):
+        return _rogue_scan_cache[2]
+
+    scan_started_ns = time.time_ns()
+    rogue_dirs, fingerprint = _scan_rogue_beads_dirs(SPECS_DIR)
+
+    # Only cache when no listed directory changed within the racy window
+    racy_cutoff_ns = scan_started_ns - _RACY_MTIME_WINDOW_NS
+    if all(mtime_ns < racy_cutoff_ns for _, mtime_ns in fingerprint):
+        _rogue_scan_cache = (SPECS_DIR, tuple(fingerprint), rogue_dirs)
+    else:
+        _rogue_scan_cache = None
+
+    return rogue_dirs
+
 
 def detect_rogue_beads_dirs() -> list[Path]:
     """
@@ -93,32 +314,28 @@ def detect_rogue_beads_dirs() -> list[Path]:
     architecture. Beads should only exist at BEADS_ROOT, not inside individual
     spec directories.
 
+    The result of a full walk is cached and reused while none of the scanned
+    directories has changed (see _rogue_scan_cache).
+
     Returns:
         List of Path objects pointing to violating .beads/ directories.
         Empty list if architecture is correct.
     """
-    rogue_dirs = []
+    # Callers own the returned list; never hand out the cached one
+    return list(_current_rogue_beads_dirs())
 
-    # Only scan if SPECS_DIR exists
-    if not SPECS_DIR.exists():
-        return rogue_dirs
-
-    # Walk through all spec directories looking for .beads/
-    for spec_dir in SPECS_DIR.iterdir():
-        if not spec_dir.is_dir():
-            continue
 
-        # Check for .beads/ at spec level
-        potential_rogue = spec_dir / ".beads"
-        if potential_rogue.exists() and potential_rogue.is_dir():
-            rogue_dirs.append(potential_rogue)
+def has_rogue_beads_dirs() -> bool:
+    """
+    Check whether any .beads/ directories exist inside spec folders.
 
-        # Also check nested directories (e.g., spec/implementation/.beads)
-        for subdir in spec_dir.rglob(".beads"):
-            if subdir.is_dir() and subdir not in rogue_dirs:
-                rogue_dirs.append(subdir)
+    Same scan and cache as detect_rogue_beads_dirs(), for callers that only
+    need a yes/no answer: no result list is copied.
 
-    return rogue_dirs
+    Returns:
+        True if at least one spec-level .beads/ directory exists
+    """
+    return bool(_current_rogue_beads_dirs())
 
 
 def enforce_single_beads_database() -> None:
@@ -132,7 +349,8 @@ def enforce_single_beads_database() -> None:
         RuntimeError: If any spec-level .beads/ directories are detected,
                      with a message listing all violating paths.
     """
-    rogue_dirs = detect_rogue_beads_dirs()
+    # Read-only use, so skip the defensive copy on the (common) empty path
+    rogue_dirs = _current_rogue_beads_dirs()
 
     if rogue_dirs:
         paths_str = "\n  - ".join(str(p) for p in rogue_dirs)
@@ -148,10 +366,9 @@ def print_session_header(session_num: int, is_initializer: bool) -> None:
     """Print a formatted header for the session."""
     session_type = "INITIALIZER" if is_initializer else "CODING AGENT"
 
-    print("\n" + "=" * 70)
-    print(f"  SESSION {session_num}: {session_type}")
-    print("=" * 70)
-    print()
+    rule = "=" * 70
+    # One write instead of four print() calls
+    sys.stdout.write(f"\n{rule}\n  SESSION {session_num}: {session_type}\n{rule}\n\n")
 
 
 def print_progress_summary(project_dir: Path = None) -> None:
@@ -171,7 +388,9 @@ def print_progress_summary(project_dir: Path = None) -> None:
     total = state.get("total_issues", 0)
     meta_issue = state.get("meta_issue_id", "unknown")
 
-    print(f"\nBeads Project Status:")
-    print(f"  Total issues created: {total}")
-    print(f"  META issue ID: {meta_issue}")
-    print(f"  (Run 'bd info' for current issue counts)")
+    sys.stdout.write(
+        "\nBeads Project Status:\n"
+        f"  Total issues created: {total}\n"
+        f"  META issue ID: {meta_issue}\n"
+        "  (Run 'bd info' for current issue counts)\n"
+    )
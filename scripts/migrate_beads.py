@@ -7,45 +7,68 @@ Migrates spec-level .beads/ directories to the root-level database.
 This enforces the single-database architecture for Phase 5.
 
 Usage:
-    python scripts/migrate_beads.py [--dry-run]
+    python scripts/migrate_beads.py [--dry-run] [--jobs N]
 
 Options:
     --dry-run   Show what would be migrated without making changes
+    --jobs N    Maximum parallel export/delete jobs (default: 8)
 """
 
 import argparse
+import os
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from beads_config import BEADS_ROOT, SPECS_DIR
-from progress import detect_rogue_beads_dirs
+from beads_config import BEADS_DB_DIR, BEADS_ROOT, SPECS_DIR
+from progress import detect_rogue_beads_dirs, invalidate_rogue_scan_cache
 
+# Default cap on concurrent export/delete workers (override with --jobs)
+DEFAULT_JOBS = 8
 
-def run_bd_command(cmd: list[str], cwd: Path) -> tuple[bool, str]:
+
+def run_bd_command(
+    cmd: list[str], cwd: Path, stdout_path: Path | None = None
+) -> tuple[bool, str]:
     """
     Run a beads CLI command and return (success, output).
 
     Args:
         cmd: Command arguments (e.g., ["bd", "export"])
         cwd: Working directory for the command
+        stdout_path: Optional file to stream stdout into. When given, stdout
+            is written straight to disk without being buffered or decoded,
+            and only stderr is returned as output.
 
     Returns:
         Tuple of (success: bool, output: str)
     """
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-        output = result.stdout + result.stderr
+        if stdout_path is None:
+            result = subprocess.run(
+                cmd,
+                cwd=cwd,
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+            output = result.stdout + result.stderr
+        else:
+            with open(stdout_path, "wb") as stdout_file:
+                result = subprocess.run(
+                    cmd,
+                    cwd=cwd,
+                    stdout=stdout_file,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    timeout=60,
+                )
+            output = result.stderr
         return result.returncode == 0, output.strip()
     except subprocess.TimeoutExpired:
         return False, "Command timed out after 60 seconds"
@@ -70,14 +93,16 @@ def export_issues_from_dir(beads_dir: Path, dry_run: bool = False) -> tuple[bool
     if dry_run:
         return True, f"Would export to {export_file}"
 
-    # bd export outputs to stdout, we need to capture and save
-    success, output = run_bd_command(["bd", "export"], cwd=parent_dir)
+    # bd export outputs to stdout - stream it straight into the export file
+    success, output = run_bd_command(
+        ["bd", "export"], cwd=parent_dir, stdout_path=export_file
+    )
 
     if success:
-        # Write the export to a file
-        export_file.write_text(output)
         return True, str(export_file)
     else:
+        # Don't leave a partial export behind
+        export_file.unlink(missing_ok=True)
         return False, f"Export failed: {output}"
 
 
@@ -106,6 +131,28 @@ def import_issues_to_root(export_file: Path, dry_run: bool = False) -> tuple[boo
     return success, output
 
 
+def _fast_rmtree(path: Path | str) -> None:
+    """
+    Recursively delete a directory tree using os.scandir() and os.unlink().
+
+    Directory checks use the d_type cached on each DirEntry, so no per-entry
+    lstat is issued. Symlinks are unlinked, never followed.
+
+    Args:
+        path: Directory to remove
+
+    Raises:
+        OSError: If any entry cannot be removed
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
 def delete_beads_dir(beads_dir: Path, dry_run: bool = False) -> tuple[bool, str]:
     """
     Delete a .beads/ directory after successful migration.
@@ -121,18 +168,27 @@ def delete_beads_dir(beads_dir: Path, dry_run: bool = False) -> tuple[bool, str]
         return True, f"Would delete {beads_dir}"
 
     try:
-        shutil.rmtree(beads_dir)
+        try:
+            _fast_rmtree(beads_dir)
+        except OSError:
+            # Fall back to shutil for anything the fast path can't handle
+            shutil.rmtree(beads_dir)
         return True, f"Deleted {beads_dir}"
     except Exception as e:
         return False, f"Failed to delete {beads_dir}: {e}"
 
 
-def migrate_beads(dry_run: bool = False) -> int:
+def migrate_beads(dry_run: bool = False, jobs: int = DEFAULT_JOBS) -> int:
     """
     Main migration function.
 
+    Runs in three passes: exports and deletions are parallelized across
+    rogue directories, while imports into the shared root database are
+    serialized.
+
     Args:
         dry_run: If True, show what would happen without making changes
+        jobs: Maximum number of concurrent export/delete workers
 
     Returns:
         Exit code (0 for success, 1 for failure)
@@ -157,7 +213,7 @@ def migrate_beads(dry_run: bool = False) -> int:
         print(f"  - {d}")
 
     # Verify root database exists
-    root_beads = BEADS_ROOT / ".beads"
+    root_beads = BEADS_DB_DIR
     if not root_beads.exists():
         print(f"\nError: Root .beads/ directory not found at {root_beads}")
         print("Please initialize beads at root level first: bd init")
@@ -165,50 +221,68 @@ def migrate_beads(dry_run: bool = False) -> int:
 
     print(f"\nMigrating to root database at: {root_beads}\n")
 
-    # Process each rogue directory
-    success_count = 0
-    fail_count = 0
+    workers = max(1, min(jobs, len(rogue_dirs)))
+    failed: list[Path] = []
 
-    for beads_dir in rogue_dirs:
-        print(f"\nProcessing: {beads_dir}")
-        print("-" * 40)
+    # Step 1: Export every rogue database concurrently. Each export runs
+    # `bd` in its own spec directory, so they are independent.
+    print(f"[1/3] Exporting issues ({workers} parallel jobs)...")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        export_results = list(
+            pool.map(lambda d: export_issues_from_dir(d, dry_run), rogue_dirs)
+        )
 
-        # Step 1: Export
-        print("  [1/3] Exporting issues...")
-        success, result = export_issues_from_dir(beads_dir, dry_run)
+    exported: list[tuple[Path, Path | None]] = []
+    for beads_dir, (success, result) in zip(rogue_dirs, export_results):
         if not success:
-            print(f"  ERROR: {result}")
-            fail_count += 1
+            print(f"  ERROR {beads_dir}: {result}")
+            failed.append(beads_dir)
             continue
         print(f"  OK: {result}")
-        export_file = Path(result) if not dry_run else None
-
-        # Step 2: Import to root
-        if not dry_run and export_file:
-            print("  [2/3] Importing to root database...")
-            success, result = import_issues_to_root(export_file, dry_run)
-            if not success:
-                print(f"  ERROR: {result}")
-                fail_count += 1
-                continue
-            print(f"  OK: {result}")
-
-            # Clean up export file
-            export_file.unlink()
-        else:
-            print("  [2/3] Would import to root database...")
+        exported.append((beads_dir, Path(result) if not dry_run else None))
+
+    # Step 2: Import sequentially - the root database is a single sqlite file
+    print("\n[2/3] Importing to root database...")
+    imported: list[Path] = []
+    for beads_dir, export_file in exported:
+        if dry_run or export_file is None:
+            print(f"  Would import issues from {beads_dir}")
+            imported.append(beads_dir)
+            continue
 
-        # Step 3: Delete old directory
-        print("  [3/3] Removing old .beads/ directory...")
-        success, result = delete_beads_dir(beads_dir, dry_run)
+        success, result = import_issues_to_root(export_file, dry_run)
+        if not success:
+            print(f"  ERROR {beads_dir}: {result}")
+            failed.append(beads_dir)
+            continue
+        print(f"  OK {beads_dir}: {result}")
+
+        # Clean up export file
+        export_file.unlink()
+        imported.append(beads_dir)
+
+    # Step 3: Remove the migrated directories concurrently
+    print("\n[3/3] Removing old .beads/ directories...")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        delete_results = list(
+            pool.map(lambda d: delete_beads_dir(d, dry_run), imported)
+        )
+
+    success_count = 0
+    for beads_dir, (success, result) in zip(imported, delete_results):
         if not success:
             print(f"  ERROR: {result}")
-            fail_count += 1
+            failed.append(beads_dir)
             continue
         print(f"  OK: {result}")
-
         success_count += 1
 
+    fail_count = len(failed)
+
+    # Rogue directories were removed in-process; force the next scan to re-walk
+    if not dry_run:
+        invalidate_rogue_scan_cache()
+
     # Summary
     print("\n" + "=" * 60)
     print("Migration Summary")
@@ -232,9 +306,16 @@ def main():
         action="store_true",
         help="Show what would be migrated without making changes",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        metavar="N",
+        help=f"Maximum parallel export/delete jobs (default: {DEFAULT_JOBS})",
+    )
     args = parser.parse_args()
 
-    sys.exit(migrate_beads(dry_run=args.dry_run))
+    sys.exit(migrate_beads(dry_run=args.dry_run, jobs=args.jobs))
 
 
 if __name__ == "__main__":
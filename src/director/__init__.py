@@ -8,57 +8,59 @@ git conflict resolution, BV robot plan querying, metrics persistence,
 and improvement tracking.
 """
 
-from .utils import (
-    resolve_absolute_path,
-    validate_path_is_absolute,
-    get_harness_root,
-    format_command_for_logging,
-)
+import importlib
 
-from .timeout_atoms import (
-    DEFAULT_SUBAGENT_TIMEOUT_SECONDS,
-    VERIFICATION_TIMEOUT_SECONDS,
-    CLI_QUERY_TIMEOUT_SECONDS,
-    CLEANUP_GRACE_PERIOD_SECONDS,
-)
-
-from .timeout_organisms import (
-    run_with_timeout,
-    run_with_timeout_and_cancel,
-    TimeoutError,
-    TimeoutResult,
-)
-
-from .conflict_handler import (
-    MergeStatus,
-    MergeResult,
-    attempt_automatic_merge,
-    detect_merge_conflicts,
-)
-
-from .bv_robot_plan import (
-    BVRobotPlan,
-    query_bv_robot_plan,
-    parse_bv_plan_output,
-)
-
-from .cwd_guard import (
-    WorkingDirectoryGuard,
-    validate_cwd,
-)
-
-from .metrics_molecules import (
-    MetricsData,
-    save_metrics,
-    load_metrics,
-    append_metrics,
-)
-
-from .improvement_tracker import (
-    record_execution,
-    get_success_rate,
-    recommend_parallelism,
-)
+# Exported name -> submodule that defines it. Submodules are imported on
+# first attribute access (PEP 562) so CLI startup does not pay for
+# subprocess/logging/re imports it never uses.
+_LAZY_EXPORTS = {
+    # Path utilities
+    "resolve_absolute_path": "utils",
+    "validate_path_is_absolute": "utils",
+    "get_harness_root": "utils",
+    "format_command_for_logging": "utils",
+    # Timeout constants (atoms)
+    "DEFAULT_SUBAGENT_TIMEOUT_SECONDS": "timeout_atoms",
+    "VERIFICATION_TIMEOUT_SECONDS": "timeout_atoms",
+    "CLI_QUERY_TIMEOUT_SECONDS": "timeout_atoms",
+    "CLEANUP_GRACE_PERIOD_SECONDS": "timeout_atoms",
+    # Timeout handling (organisms)
+    "run_with_timeout": "timeout_organisms",
+    "run_with_timeout_and_cancel": "timeout_organisms",
+    "TimeoutError": "timeout_organisms",
+    "TimeoutResult": "timeout_organisms",
+    # Conflict handling (molecules)
+    "MergeStatus": "conflict_handler",
+    "MergeResult": "conflict_handler",
+    "attempt_automatic_merge": "conflict_handler",
+    "detect_merge_conflicts": "conflict_handler",
+    "attempt_automatic_merge_async": "conflict_handler",
+    "detect_merge_conflicts_async": "conflict_handler",
+    "merge_many": "conflict_handler",
+    # BV robot plan (molecules)
+    "BVRobotPlan": "bv_robot_plan",
+    "BVPlanPhase": "bv_robot_plan",
+    "query_bv_robot_plan": "bv_robot_plan",
+    "parse_bv_plan_output": "bv_robot_plan",
+    # CWD guard (molecules)
+    "WorkingDirectoryGuard": "cwd_guard",
+    "validate_cwd": "cwd_guard",
+    # Metrics persistence (molecules)
+    "MetricsData": "metrics_molecules",
+    "save_metrics": "metrics_molecules",
+    "load_metrics": "metrics_molecules",
+    "append_metrics": "metrics_molecules",
+    "MetricsSummary": "metrics_molecules",
+    "load_metrics_summary": "metrics_molecules",
+    "load_metrics_since": "metrics_molecules",
+    "count_metrics_since": "metrics_molecules",
+    "enqueue_metrics": "metrics_molecules",
+    "flush_metrics_queue": "metrics_molecules",
+    # Improvement tracker (organisms)
+    "record_execution": "improvement_tracker",
+    "get_success_rate": "improvement_tracker",
+    "recommend_parallelism": "improvement_tracker",
+}
 
 __all__ = [
     # Path utilities
@@ -81,8 +83,12 @@ __all__ = [
     "MergeResult",
     "attempt_automatic_merge",
     "detect_merge_conflicts",
+    "attempt_automatic_merge_async",
+    "detect_merge_conflicts_async",
+    "merge_many",
     # BV robot plan (molecules)
     "BVRobotPlan",
+    "BVPlanPhase",
     "query_bv_robot_plan",
     "parse_bv_plan_output",
     # CWD guard (molecules)
@@ -93,8 +99,28 @@ __all__ = [
     "save_metrics",
     "load_metrics",
     "append_metrics",
+    "MetricsSummary",
+    "load_metrics_summary",
+    "load_metrics_since",
+    "count_metrics_since",
+    "enqueue_metrics",
+    "flush_metrics_queue",
     # Improvement tracker (organisms)
     "record_execution",
     "get_success_rate",
     "recommend_parallelism",
 ]
+
+
+def __getattr__(name: str):
+    """Import the submodule defining ``name`` on first access and cache it."""
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -10,7 +10,9 @@ showing phases and tasks in dependency order. This module queries that plan
 and parses the output for use by the Director.
 """
 
+import functools
 import logging
+import os
 import re
 import shutil
 import subprocess
@@ -27,6 +29,30 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
+@dataclass(slots=True)
+class BVPlanPhase:
+    """
+    A single phase of a BV robot execution plan.
+
+    Slotted to keep per-phase allocation small. Supports ``phase["name"]``
+    and ``phase["tasks"]`` for callers written against the old dict shape.
+
+    Attributes:
+        name: Phase header, e.g. "Phase 1: Database Layer"
+        tasks: Task descriptions listed under the phase, in order
+    """
+
+    name: str
+    tasks: List[str] = field(default_factory=list)
+
+    def __getitem__(self, key: str):
+        if key == "name":
+            return self.name
+        if key == "tasks":
+            return self.tasks
+        raise KeyError(key)
+
+
 @dataclass
 class BVRobotPlan:
     """
@@ -38,22 +64,39 @@ class BVRobotPlan:
     Attributes:
         success: Whether the CLI query succeeded
         raw_output: Raw stdout from bv robot --plan (empty string if failed)
-        phases: List of parsed phase dictionaries (empty if failed or unparseable)
+        phases: List of parsed phases (empty if failed or unparseable)
         error_message: Human-readable error description (None if success)
     """
 
     success: bool
     raw_output: str = ""
-    phases: List[dict] = field(default_factory=list)
+    phases: List[BVPlanPhase] = field(default_factory=list)
     error_message: Optional[str] = None
 
 
+# One pass over the whole output, one match per interesting line:
+#   group 1 - phase headers like "Phase 1: Database Layer"
+#   group 2 - task lines starting with "- "
+# [^\S\n] is "whitespace except newline", so no match spans lines.
+# MULTILINE is required because the pattern runs over the whole buffer.
+# Only the literal "phase" is case-insensitive, so it is spelled out as
+# character classes instead of applying IGNORECASE to every character.
+_PLAN_LINE_RE = re.compile(
+    r"^[^\S\n]*([Pp][Hh][Aa][Ss][Ee][^\S\n]+\d+:[^\n]*)$"
+    r"|^[^\S\n]*-[^\S\n]+([^\n]+)$",
+    re.MULTILINE,
+)
+# Cheap prefilter: output without the word "phase" can't contain a header.
+# Matches the same case-insensitive word, without lowercasing the buffer.
+_PHASE_WORD_RE = re.compile(r"phase", re.IGNORECASE)
+
+
 # =============================================================================
 # ATOMS - Pure parsing functions
 # =============================================================================
 
 
-def parse_bv_plan_output(raw_output: Optional[str]) -> List[dict]:
+def parse_bv_plan_output(raw_output: Optional[str]) -> List[BVPlanPhase]:
     """
     Parse raw BV robot plan output into structured phases.
 
@@ -64,47 +107,36 @@ def parse_bv_plan_output(raw_output: Optional[str]) -> List[dict]:
         raw_output: Raw stdout from bv robot --plan command
 
     Returns:
-        List of phase dictionaries, each with 'name' and 'tasks' keys.
+        List of BVPlanPhase objects, each with 'name' and 'tasks'.
         Returns empty list if input is None, empty, or cannot be parsed.
 
     Example output structure:
         [
-            {"name": "Phase 1: Database Layer", "tasks": ["Task A", "Task B"]},
-            {"name": "Phase 2: API Layer", "tasks": ["Task C"]},
+            BVPlanPhase(name="Phase 1: Database Layer", tasks=["Task A", "Task B"]),
+            BVPlanPhase(name="Phase 2: API Layer", tasks=["Task C"]),
         ]
     """
     if raw_output is None or raw_output.strip() == "":
         return []
 
+    # Help banners and error text have no phases - skip the full sweep
+    if _PHASE_WORD_RE.search(raw_output) is None:
+        return []
+
     phases = []
     current_phase = None
 
-    # Pattern to match phase headers like "Phase 1: Database Layer"
-    phase_pattern = re.compile(r"^(Phase\s+\d+:.*?)$", re.IGNORECASE | re.MULTILINE)
-    # Pattern to match task lines starting with "- "
-    task_pattern = re.compile(r"^\s*-\s+(.+)$")
-
-    lines = raw_output.split("\n")
-
-    for line in lines:
-        # Check for phase header
-        phase_match = phase_pattern.match(line.strip())
-        if phase_match:
+    for match in _PLAN_LINE_RE.finditer(raw_output):
+        phase_name, task = match.groups()
+        if phase_name is not None:
             # Save previous phase if exists
             if current_phase is not None:
                 phases.append(current_phase)
             # Start new phase
-            current_phase = {
-                "name": phase_match.group(1).strip(),
-                "tasks": [],
-            }
-            continue
-
-        # Check for task line (only if we're in a phase)
-        if current_phase is not None:
-            task_match = task_pattern.match(line)
-            if task_match:
-                current_phase["tasks"].append(task_match.group(1).strip())
+            current_phase = BVPlanPhase(name=phase_name.strip())
+        elif current_phase is not None:
+            # Task lines only count once we're inside a phase
+            current_phase.tasks.append(task.strip())
 
     # Don't forget the last phase
     if current_phase is not None:
@@ -113,6 +145,41 @@ def parse_bv_plan_output(raw_output: Optional[str]) -> List[dict]:
     return phases
 
 
+@functools.lru_cache(maxsize=8)
+def _resolve_bv(name: str, search_path: Optional[str]) -> Optional[str]:
+    """
+    Resolve a BV executable on PATH, memoized per (name, PATH).
+
+    shutil.which() stats every PATH entry; repeated plan queries reuse the
+    first answer. Keying on the PATH value means an updated PATH is honored.
+    Call _resolve_bv.cache_clear() after installing/removing bv in-process.
+
+    Args:
+        name: Executable name or path
+        search_path: Value of $PATH to search (None uses os.defpath)
+
+    Returns:
+        Full path to the executable, or None if not found
+    """
+    return shutil.which(name, path=search_path)
+
+
+def _bv_failure(error_message: str, raw_output: str = "") -> BVRobotPlan:
+    """
+    Build the failed-query result returned by query_bv_robot_plan().
+
+    A fresh object per call, since callers own (and may mutate) the result.
+
+    Args:
+        error_message: Human-readable failure description
+        raw_output: Any stdout captured before the failure
+
+    Returns:
+        BVRobotPlan with success=False and no phases
+    """
+    return BVRobotPlan(success=False, raw_output=raw_output, error_message=error_message)
+
+
 # =============================================================================
 # MOLECULES - Composed query functions
 # =============================================================================
@@ -144,47 +211,45 @@ def query_bv_robot_plan(
         plan = query_bv_robot_plan()
         if plan.success:
             for phase in plan.phases:
-                print(f"Phase: {phase['name']}")
+                print(f"Phase: {phase.name}")
         else:
             print(f"Could not get plan: {plan.error_message}")
     """
     # Check if BV executable exists
-    bv_path = shutil.which(bv_executable)
+    bv_path = _resolve_bv(bv_executable, os.environ.get("PATH"))
     if bv_path is None:
-        logger.warning(f"BV executable '{bv_executable}' not found in PATH")
-        return BVRobotPlan(
-            success=False,
-            error_message=f"BV CLI unavailable: '{bv_executable}' not found in PATH",
-        )
+        logger.warning("BV executable '%s' not found in PATH", bv_executable)
+        return _bv_failure(f"BV CLI unavailable: '{bv_executable}' not found in PATH")
 
     # Build command
     cmd = [bv_path, "robot", "--plan"]
-    logger.debug(f"Querying BV robot plan: {' '.join(cmd)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Querying BV robot plan: %s", " ".join(cmd))
 
     try:
         # Execute BV CLI (NO cwd parameter - forbidden pattern)
+        # Bytes mode: stdout is decoded once below, stderr only on failure
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=timeout_seconds,
         )
+        raw_output = result.stdout.decode("utf-8", errors="replace")
 
         # Check for non-zero exit code
         if result.returncode != 0:
-            error_detail = result.stderr.strip() or result.stdout.strip() or "Unknown error"
-            logger.warning(f"BV robot --plan failed with exit code {result.returncode}: {error_detail}")
-            return BVRobotPlan(
-                success=False,
-                raw_output=result.stdout,
-                error_message=f"BV CLI failed (exit {result.returncode}): {error_detail}",
+            stderr = result.stderr.decode("utf-8", errors="replace")
+            error_detail = stderr.strip() or raw_output.strip() or "Unknown error"
+            logger.warning("BV robot --plan failed with exit code %s: %s", result.returncode, error_detail)
+            return _bv_failure(
+                f"BV CLI failed (exit {result.returncode}): {error_detail}",
+                raw_output,
             )
 
         # Success - parse the output
-        raw_output = result.stdout
         phases = parse_bv_plan_output(raw_output)
 
-        logger.debug(f"BV robot plan query successful, found {len(phases)} phases")
+        logger.debug("BV robot plan query successful, found %s phases", len(phases))
         return BVRobotPlan(
             success=True,
             raw_output=raw_output,
@@ -194,30 +259,18 @@ def query_bv_robot_plan(
 
     except FileNotFoundError as e:
         # BV executable not found (different from shutil.which check)
-        logger.warning(f"BV executable not found: {e}")
-        return BVRobotPlan(
-            success=False,
-            error_message=f"BV CLI unavailable: executable not found",
-        )
+        logger.warning("BV executable not found: %s", e)
+        return _bv_failure("BV CLI unavailable: executable not found")
 
     except subprocess.TimeoutExpired:
-        logger.warning(f"BV robot --plan timed out after {timeout_seconds}s")
-        return BVRobotPlan(
-            success=False,
-            error_message=f"BV CLI timed out after {timeout_seconds} seconds",
-        )
+        logger.warning("BV robot --plan timed out after %ss", timeout_seconds)
+        return _bv_failure(f"BV CLI timed out after {timeout_seconds} seconds")
 
     except subprocess.SubprocessError as e:
-        logger.warning(f"BV subprocess error: {e}")
-        return BVRobotPlan(
-            success=False,
-            error_message=f"BV CLI subprocess error: {str(e)}",
-        )
+        logger.warning("BV subprocess error: %s", e)
+        return _bv_failure(f"BV CLI subprocess error: {str(e)}")
 
     except Exception as e:
         # Catch-all for unexpected errors (log at error level)
-        logger.error(f"Unexpected error querying BV robot plan: {e}", exc_info=True)
-        return BVRobotPlan(
-            success=False,
-            error_message=f"Unexpected error: {str(e)}",
-        )
+        logger.error("Unexpected error querying BV robot plan: %s", e, exc_info=True)
+        return _bv_failure(f"Unexpected error: {str(e)}")
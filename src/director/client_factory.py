@@ -13,10 +13,17 @@ This is a complex composition (organism) that:
 - Creates configured ClaudeSDKClient ready for sub-agent use
 """
 
+import hashlib
 import json
 import os
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from claude_code_sdk import ClaudeCodeOptions, ClaudeSDKClient
 from claude_code_sdk.types import HookMatcher
@@ -48,13 +55,23 @@ FILE_SCOPED_TOOLS = frozenset({
     "Grep",
 })
 
+# Permission entry per known tool, formatted once at import:
+# - File-scoped tools restricted to project directory
+# - Bash uses wildcard - actual validation via security hook
+# Unknown tools are passed through as-is.
+_TOOL_PERMISSIONS = {tool: f"{tool}(./**)" for tool in FILE_SCOPED_TOOLS}
+_TOOL_PERMISSIONS["Bash"] = "Bash(*)"
+
 # Default MCP servers for sub-agents
 DEFAULT_MCP_SERVERS = {
     "puppeteer": {"command": "npx", "args": ["puppeteer-mcp-server"]},
 }
 
+# MCP server config used when enable_mcp=False (shared, never mutated)
+_EMPTY_MCP_SERVERS: dict = {}
+
 # Puppeteer MCP tools for browser automation
-PUPPETEER_TOOLS = [
+PUPPETEER_TOOLS = (
     "mcp__puppeteer__puppeteer_navigate",
     "mcp__puppeteer__puppeteer_screenshot",
     "mcp__puppeteer__puppeteer_click",
@@ -62,7 +79,18 @@ PUPPETEER_TOOLS = [
     "mcp__puppeteer__puppeteer_select",
     "mcp__puppeteer__puppeteer_hover",
     "mcp__puppeteer__puppeteer_evaluate",
-]
+)
+
+
+# Last content written per settings file: path -> (digest, st_mtime_ns, st_size).
+# Spawning many sub-agents with the same frontmatter produces identical
+# settings, so the rewrite is skipped while the file on disk is untouched.
+_SETTINGS_HASH_CACHE: dict[Path, tuple[str, int, int]] = {}
+_SETTINGS_HASH_LOCK = threading.Lock()
+
+# OAuth token read from the environment on first successful lookup. The
+# token is set before the harness starts, so it is not re-read per spawn.
+_CACHED_TOKEN: Optional[str] = None
 
 
 # =============================================================================
@@ -70,9 +98,16 @@ PUPPETEER_TOOLS = [
 # =============================================================================
 
 
-def parse_tools_from_frontmatter(frontmatter: dict) -> list[str]:
+def _dumps_settings(settings: dict) -> bytes:
+    """Serialize settings as 2-space indented JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    return json.dumps(settings, indent=2).encode()
+
+
+def parse_tools_from_frontmatter(frontmatter: dict) -> tuple[str, ...]:
     """
-    Parse the 'tools' field from agent frontmatter into a list.
+    Parse the 'tools' field from agent frontmatter into a tuple.
 
     This is an atom - pure function with no side effects or dependencies.
 
@@ -80,25 +115,49 @@ def parse_tools_from_frontmatter(frontmatter: dict) -> list[str]:
         frontmatter: Dict parsed from agent file YAML frontmatter
 
     Returns:
-        List of tool name strings. Returns default tools if 'tools' key
-        is missing. Returns empty list if tools value is empty string.
+        Immutable tuple of tool name strings. Returns the shared
+        DEFAULT_TOOLS tuple if 'tools' key is missing. Returns an empty
+        tuple if tools value is empty string.
 
     Examples:
         >>> parse_tools_from_frontmatter({"tools": "Read, Write, Bash"})
-        ['Read', 'Write', 'Bash']
+        ('Read', 'Write', 'Bash')
         >>> parse_tools_from_frontmatter({"model": "sonnet"})  # No tools key
-        ['Read', 'Write', 'Edit', 'Glob', 'Grep', 'Bash']
+        ('Read', 'Write', 'Edit', 'Glob', 'Grep', 'Bash')
         >>> parse_tools_from_frontmatter({"tools": ""})
-        []
+        ()
     """
     if "tools" not in frontmatter:
-        return list(DEFAULT_TOOLS)
+        # Immutable, so the default can be shared without copying
+        return DEFAULT_TOOLS
 
     tools_str = frontmatter["tools"]
     if not tools_str or not tools_str.strip():
-        return []
+        return ()
+
+    return tuple(tool.strip() for tool in tools_str.split(",") if tool.strip())
+
 
-    return [tool.strip() for tool in tools_str.split(",") if tool.strip()]
+def _get_oauth_token() -> str:
+    """
+    Return CLAUDE_CODE_OAUTH_TOKEN, reading the environment only until found.
+
+    Returns:
+        The OAuth token
+
+    Raises:
+        ValueError: If CLAUDE_CODE_OAUTH_TOKEN is not set
+    """
+    global _CACHED_TOKEN
+    if _CACHED_TOKEN is None:
+        token = os.environ.get("CLAUDE_CODE_OAUTH_TOKEN")
+        if not token:
+            raise ValueError(
+                "CLAUDE_CODE_OAUTH_TOKEN environment variable not set.\n"
+                "Run 'claude setup-token' after installing the Claude Code CLI."
+            )
+        _CACHED_TOKEN = token
+    return _CACHED_TOKEN
 
 
 # =============================================================================
@@ -107,7 +166,7 @@ def parse_tools_from_frontmatter(frontmatter: dict) -> list[str]:
 
 
 def build_security_settings(
-    allowed_tools: list[str],
+    allowed_tools: Sequence[str],
     project_dir: Path,
     enable_mcp: bool = True
 ) -> dict:
@@ -118,7 +177,7 @@ def build_security_settings(
     to create the complete security settings structure.
 
     Args:
-        allowed_tools: List of tool names the sub-agent can use
+        allowed_tools: Tool names the sub-agent can use (only iterated)
         project_dir: Directory to restrict file operations to
         enable_mcp: Whether to include MCP (puppeteer) tool permissions
 
@@ -131,18 +190,7 @@ def build_security_settings(
     - MCP tools are optionally included for browser automation
     """
     # Build permission allow list based on provided tools
-    allow_list = []
-
-    for tool in allowed_tools:
-        if tool in FILE_SCOPED_TOOLS:
-            # File-scoped tools restricted to project directory
-            allow_list.append(f"{tool}(./**)")
-        elif tool == "Bash":
-            # Bash uses wildcard - actual validation via security hook
-            allow_list.append("Bash(*)")
-        else:
-            # Unknown tools passed through as-is
-            allow_list.append(tool)
+    allow_list = [_TOOL_PERMISSIONS.get(tool, tool) for tool in allowed_tools]
 
     # Include MCP tools if enabled
     if enable_mcp:
@@ -170,13 +218,33 @@ def write_settings_file(settings: dict, project_dir: Path) -> Path:
 
     Returns:
         Path to the written settings file
-    """
-    # Ensure directory exists
-    project_dir.mkdir(parents=True, exist_ok=True)
 
+    The write is skipped when the same content was already written to the
+    file by this process and the file's mtime/size are unchanged since.
+    """
     settings_file = project_dir / ".claude_subagent_settings.json"
-    with open(settings_file, "w") as f:
-        json.dump(settings, f, indent=2)
+    data = _dumps_settings(settings)
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    with _SETTINGS_HASH_LOCK:
+        cached = _SETTINGS_HASH_CACHE.get(settings_file)
+        if cached is not None and cached[0] == digest:
+            try:
+                st = os.stat(settings_file)
+            except OSError:
+                st = None
+            if st is not None and (st.st_mtime_ns, st.st_size) == cached[1:]:
+                return settings_file
+
+        try:
+            settings_file.write_bytes(data)
+        except FileNotFoundError:
+            # Directory doesn't exist yet (first spawn) - create and retry
+            project_dir.mkdir(parents=True, exist_ok=True)
+            settings_file.write_bytes(data)
+
+        st = os.stat(settings_file)
+        _SETTINGS_HASH_CACHE[settings_file] = (digest, st.st_mtime_ns, st.st_size)
 
     return settings_file
 
@@ -240,6 +308,9 @@ def create_subagent_client(
     # Step 3: Parse allowed tools from frontmatter
     allowed_tools = parse_tools_from_frontmatter(frontmatter)
 
+    # Resolve once; reused for the settings file and the client cwd
+    project_dir_resolved = project_dir.resolve()
+
     # Step 4: Build security settings
     security_settings = build_security_settings(
         allowed_tools=allowed_tools,
@@ -248,7 +319,8 @@ def create_subagent_client(
     )
 
     # Step 5: Write settings to file (required for ClaudeCodeOptions)
-    settings_file = write_settings_file(security_settings, project_dir)
+    # (absolute, since it is built from the resolved directory)
+    settings_file = write_settings_file(security_settings, project_dir_resolved)
 
     # Step 6: Build system prompt
     if system_prompt_prefix:
@@ -256,16 +328,11 @@ def create_subagent_client(
     else:
         full_prompt = agent_prompt
 
-    # Step 7: Get API key
-    api_key = os.environ.get("CLAUDE_CODE_OAUTH_TOKEN")
-    if not api_key:
-        raise ValueError(
-            "CLAUDE_CODE_OAUTH_TOKEN environment variable not set.\n"
-            "Run 'claude setup-token' after installing the Claude Code CLI."
-        )
+    # Step 7: Verify API key is available (raises ValueError if not)
+    _get_oauth_token()
 
     # Step 8: Build MCP servers config
-    mcp_servers = DEFAULT_MCP_SERVERS if enable_mcp else {}
+    mcp_servers = DEFAULT_MCP_SERVERS if enable_mcp else _EMPTY_MCP_SERVERS
 
     # Step 9: Build hooks (Bash security validation)
     hooks = {}
@@ -279,12 +346,12 @@ def create_subagent_client(
         options=ClaudeCodeOptions(
             model=effective_model,
             system_prompt=full_prompt,
-            allowed_tools=allowed_tools,
+            allowed_tools=list(allowed_tools),
             mcp_servers=mcp_servers,
             hooks=hooks,
             max_turns=max_turns,
-            cwd=str(project_dir.resolve()),
-            settings=str(settings_file.resolve()),
+            cwd=os.fspath(project_dir_resolved),
+            settings=os.fspath(settings_file),
         )
     )
 
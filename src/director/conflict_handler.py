@@ -6,12 +6,14 @@ Molecules for handling git merge operations and detecting conflicts.
 These compose git command atoms into cohesive merge handling units.
 """
 
+import asyncio
 import logging
+import os
 import subprocess
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 from .utils import resolve_absolute_path, format_command_for_logging
 
@@ -47,6 +49,91 @@ class MergeResult:
     conflicted_files: Optional[List[str]] = None
 
 
+# =============================================================================
+# ATOMS - Command builders and output parsers
+# =============================================================================
+
+
+def _git_merge_cmd(branch_name: str, repo: str) -> List[str]:
+    """
+    Build the git merge command for a resolved repository path.
+
+    --no-edit avoids spawning an editor for the merge commit message and
+    --no-verify skips pre-merge-commit/commit-msg hooks.
+    """
+    return [
+        "git",
+        "-C",
+        repo,
+        "merge",
+        "--no-edit",
+        "--no-verify",
+        branch_name,
+    ]
+
+
+def _git_unmerged_files_cmd(repo: str) -> List[str]:
+    """Build the git diff command listing unmerged (conflicted) files."""
+    # Use git diff with --diff-filter=U to find unmerged (conflicted) files
+    return [
+        "git",
+        "-C",
+        repo,
+        "diff",
+        "--name-only",
+        "--diff-filter=U",
+    ]
+
+
+def _git_dir_cmd(repo: str) -> List[str]:
+    """Build the git rev-parse command printing the repository's git dir."""
+    return [
+        "git",
+        "-C",
+        repo,
+        "rev-parse",
+        "--absolute-git-dir",
+    ]
+
+
+def _merge_error_message(stdout: bytes, stderr: bytes) -> str:
+    """
+    Build the error message for a failed git merge.
+
+    Args:
+        stdout: Raw stdout from git merge
+        stderr: Raw stderr from git merge
+
+    Returns:
+        Stripped stderr, or stdout if stderr is empty
+    """
+    return (
+        stderr.decode("utf-8", errors="replace").strip()
+        or stdout.decode("utf-8", errors="replace").strip()
+    )
+
+
+def _parse_conflicted_files(stdout: bytes) -> List[str]:
+    """
+    Parse `git diff --name-only` output into file paths.
+
+    One splitlines() pass over the raw bytes (handles CRLF and the trailing
+    newline); only the non-empty paths are decoded (fsdecode round-trips
+    undecodable names).
+
+    Args:
+        stdout: Raw stdout, one file per line
+
+    Returns:
+        List of file paths, whitespace-stripped, blanks dropped
+    """
+    return [
+        os.fsdecode(path)
+        for path in (line.strip() for line in stdout.splitlines())
+        if path
+    ]
+
+
 # =============================================================================
 # MOLECULES - Composed helpers for merge operations
 # =============================================================================
@@ -72,34 +159,37 @@ def attempt_automatic_merge(
         - CONFLICT: Merge has conflicts requiring manual resolution
         - ERROR: Git error (branch not found, not a repo, etc.)
     """
-    project_dir_resolved = resolve_absolute_path(project_dir)
+    # Resolve once; the conflict check below reuses the string
+    repo = os.fspath(resolve_absolute_path(project_dir, resolve_symlinks=False))
 
     # Build git merge command
-    cmd = ["git", "-C", str(project_dir_resolved), "merge", branch_name]
+    cmd = _git_merge_cmd(branch_name, repo)
 
-    logger.debug(f"Attempting merge: {format_command_for_logging(cmd)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Attempting merge: %s", format_command_for_logging(cmd))
 
     try:
+        # Bytes mode: a clean merge never needs its output decoded
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
         )
 
         # Analyze the result
         if result.returncode == 0:
             # Clean merge
-            logger.info(f"Successfully merged branch '{branch_name}'")
+            logger.info("Successfully merged branch '%s'", branch_name)
             return MergeResult(status=MergeStatus.MERGED)
 
-        # Check if this is a conflict vs other error
-        combined_output = f"{result.stdout}\n{result.stderr}".lower()
+        error_msg = _merge_error_message(result.stdout, result.stderr)
+
+        # Git's index is the source of truth: unmerged paths mean a conflict,
+        # anything else is an error (no locale-dependent output sniffing)
+        conflict_files = _detect_conflicts_in_repo(repo)
 
-        if "conflict" in combined_output:
+        if conflict_files:
             # Merge conflict detected
-            conflict_files = detect_merge_conflicts(project_dir_resolved)
-            error_msg = result.stderr.strip() or result.stdout.strip()
-            logger.warning(f"Merge conflict detected: {error_msg}")
+            logger.warning("Merge conflict detected: %s", error_msg)
             return MergeResult(
                 status=MergeStatus.CONFLICT,
                 error_message=error_msg,
@@ -107,15 +197,14 @@ def attempt_automatic_merge(
             )
 
         # Other git error (branch not found, etc.)
-        error_msg = result.stderr.strip() or result.stdout.strip()
-        logger.error(f"Git merge error: {error_msg}")
+        logger.error("Git merge error: %s", error_msg)
         return MergeResult(
             status=MergeStatus.ERROR,
             error_message=error_msg,
         )
 
     except subprocess.SubprocessError as e:
-        logger.error(f"Subprocess error during merge: {e}")
+        logger.error("Subprocess error during merge: %s", e)
         return MergeResult(
             status=MergeStatus.ERROR,
             error_message=str(e),
@@ -136,40 +225,216 @@ def detect_merge_conflicts(project_dir: Path) -> List[str]:
         List of file paths (relative to repo root) that have conflicts.
         Returns empty list if no conflicts or on error.
     """
-    project_dir_resolved = resolve_absolute_path(project_dir)
+    return _detect_conflicts_in_repo(
+        os.fspath(resolve_absolute_path(project_dir, resolve_symlinks=False))
+    )
 
-    # Use git diff with --diff-filter=U to find unmerged (conflicted) files
-    cmd = [
-        "git",
-        "-C",
-        str(project_dir_resolved),
-        "diff",
-        "--name-only",
-        "--diff-filter=U",
-    ]
 
-    logger.debug(f"Detecting conflicts: {format_command_for_logging(cmd)}")
+def _detect_conflicts_in_repo(repo: str) -> List[str]:
+    """detect_merge_conflicts() for an already-resolved repository path."""
+    cmd = _git_unmerged_files_cmd(repo)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Detecting conflicts: %s", format_command_for_logging(cmd))
 
     try:
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
         )
 
         if result.returncode != 0:
-            logger.warning(f"Git diff command failed: {result.stderr}")
+            stderr = result.stderr.decode("utf-8", errors="replace")
+            logger.warning("Git diff command failed: %s", stderr)
             return []
 
         # Parse output - one file per line
-        stdout = result.stdout.strip()
-        if not stdout:
+        conflicted_files = _parse_conflicted_files(result.stdout)
+        logger.debug("Found %s conflicted files", len(conflicted_files))
+        return conflicted_files
+
+    except subprocess.SubprocessError as e:
+        logger.error("Subprocess error detecting conflicts: %s", e)
+        return []
+
+
+# =============================================================================
+# ASYNC MOLECULES - Overlap git invocations across repositories
+# =============================================================================
+
+
+async def _run_git_async(cmd: List[str]) -> Tuple[int, bytes, bytes]:
+    """Run a git command without blocking the event loop."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    return proc.returncode, stdout, stderr
+
+
+async def attempt_automatic_merge_async(
+    branch_name: str,
+    project_dir: Path,
+) -> MergeResult:
+    """
+    Async variant of attempt_automatic_merge().
+
+    Runs git through asyncio subprocesses so merges in different
+    repositories/worktrees can overlap. Result analysis is identical.
+
+    Args:
+        branch_name: Name of the branch to merge
+        project_dir: Absolute path to the git repository
+
+    Returns:
+        MergeResult with status MERGED, CONFLICT or ERROR
+    """
+    return await _merge_in_repo_async(
+        branch_name,
+        os.fspath(resolve_absolute_path(project_dir, resolve_symlinks=False)),
+    )
+
+
+async def _merge_in_repo_async(branch_name: str, repo: str) -> MergeResult:
+    """attempt_automatic_merge_async() for an already-resolved repository path."""
+    cmd = _git_merge_cmd(branch_name, repo)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Attempting merge (async): %s", format_command_for_logging(cmd))
+
+    try:
+        returncode, stdout, stderr = await _run_git_async(cmd)
+
+        if returncode == 0:
+            logger.info("Successfully merged branch '%s'", branch_name)
+            return MergeResult(status=MergeStatus.MERGED)
+
+        error_msg = _merge_error_message(stdout, stderr)
+        conflict_files = await _detect_conflicts_in_repo_async(repo)
+
+        if conflict_files:
+            logger.warning("Merge conflict detected: %s", error_msg)
+            return MergeResult(
+                status=MergeStatus.CONFLICT,
+                error_message=error_msg,
+                conflicted_files=conflict_files,
+            )
+
+        logger.error("Git merge error: %s", error_msg)
+        return MergeResult(
+            status=MergeStatus.ERROR,
+            error_message=error_msg,
+        )
+
+    except subprocess.SubprocessError as e:
+        logger.error("Subprocess error during merge: %s", e)
+        return MergeResult(
+            status=MergeStatus.ERROR,
+            error_message=str(e),
+        )
+
+
+async def detect_merge_conflicts_async(project_dir: Path) -> List[str]:
+    """
+    Async variant of detect_merge_conflicts().
+
+    Args:
+        project_dir: Absolute path to the git repository
+
+    Returns:
+        List of conflicted file paths; empty list if none or on error.
+    """
+    return await _detect_conflicts_in_repo_async(
+        os.fspath(resolve_absolute_path(project_dir, resolve_symlinks=False))
+    )
+
+
+async def _detect_conflicts_in_repo_async(repo: str) -> List[str]:
+    """detect_merge_conflicts_async() for an already-resolved repository path."""
+    cmd = _git_unmerged_files_cmd(repo)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Detecting conflicts (async): %s", format_command_for_logging(cmd))
+
+    try:
+        returncode, stdout, stderr = await _run_git_async(cmd)
+
+        if returncode != 0:
+            logger.warning(
+                "Git diff command failed: %s", stderr.decode("utf-8", errors="replace")
+            )
             return []
 
-        conflicted_files = [line.strip() for line in stdout.split("\n") if line.strip()]
-        logger.debug(f"Found {len(conflicted_files)} conflicted files")
+        conflicted_files = _parse_conflicted_files(stdout)
+        logger.debug("Found %s conflicted files", len(conflicted_files))
         return conflicted_files
 
     except subprocess.SubprocessError as e:
-        logger.error(f"Subprocess error detecting conflicts: {e}")
+        logger.error("Subprocess error detecting conflicts: %s", e)
         return []
+
+
+async def _repository_key_async(repo: str) -> str:
+    """
+    Identify the repository that owns a resolved project directory.
+
+    Subdirectories and symlinked paths of one checkout share a git dir
+    (and so its index lock); separate worktrees have their own.
+
+    Args:
+        repo: Resolved project directory
+
+    Returns:
+        Real path of the git dir, or repo itself if git cannot report one
+    """
+    try:
+        returncode, stdout, _ = await _run_git_async(_git_dir_cmd(repo))
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug("Could not query git dir for %s: %s", repo, e)
+        return repo
+
+    if returncode != 0:
+        return repo
+    return os.path.realpath(stdout.decode("utf-8", errors="replace").strip())
+
+
+async def merge_many(merges: Sequence[Tuple[str, Path]]) -> List[MergeResult]:
+    """
+    Merge several (branch_name, project_dir) pairs concurrently.
+
+    Merges into the same repository must not overlap (git holds the index
+    lock), so pairs are grouped by repository - the git dir that owns each
+    project_dir, so subdirectories of one checkout share a group. Each
+    group runs sequentially in the given order, and distinct groups run
+    concurrently.
+
+    Args:
+        merges: (branch_name, project_dir) pairs, one per merge
+
+    Returns:
+        MergeResult per input pair, in input order
+    """
+    # Grouping needs real identity, so symlink aliases are resolved here
+    repos = [os.fspath(resolve_absolute_path(project_dir)) for _, project_dir in merges]
+
+    # One git rev-parse per distinct directory
+    distinct_repos = list(dict.fromkeys(repos))
+    keys = await asyncio.gather(
+        *(_repository_key_async(repo) for repo in distinct_repos)
+    )
+    key_by_repo = dict(zip(distinct_repos, keys))
+
+    groups: dict[str, List[int]] = {}
+    for index, repo in enumerate(repos):
+        groups.setdefault(key_by_repo[repo], []).append(index)
+
+    results: List[Optional[MergeResult]] = [None] * len(merges)
+
+    async def merge_group(indices: List[int]) -> None:
+        for index in indices:
+            results[index] = await _merge_in_repo_async(merges[index][0], repos[index])
+
+    await asyncio.gather(*(merge_group(indices) for indices in groups.values()))
+    return results
@@ -17,6 +17,24 @@ from src.director.utils import resolve_absolute_path
 logger = logging.getLogger(__name__)
 
 
+def _current_cwd(resolve_symlinks: bool = False) -> Path:
+    """
+    Return the current working directory as an absolute Path.
+
+    os.getcwd() already returns the kernel's canonical, symlink-free path
+    on POSIX, so the extra resolve() is skipped unless requested (e.g. on
+    platforms where cwd may be reached through a junction or subst drive).
+
+    Args:
+        resolve_symlinks: Also run Path.resolve() on the result
+
+    Returns:
+        Absolute Path of the current working directory
+    """
+    cwd = Path(os.getcwd())
+    return cwd.resolve() if resolve_symlinks else cwd
+
+
 class WorkingDirectoryGuard:
     """
     Context manager that validates and protects the working directory.
@@ -40,15 +58,18 @@ class WorkingDirectoryGuard:
         - Logs cwd at entry and exit for debugging
     """
 
-    def __init__(self, expected_cwd: Path):
+    def __init__(self, expected_cwd: Path, resolve_symlinks: bool = False):
         """
         Initialize the guard with the expected working directory.
 
         Args:
             expected_cwd: The directory that cwd MUST be when entering context
+            resolve_symlinks: Resolve the live cwd before comparing. Only
+                needed where os.getcwd() may not be canonical.
         """
         self._expected_cwd = resolve_absolute_path(expected_cwd)
         self._original_cwd: Optional[Path] = None
+        self._resolve_symlinks = resolve_symlinks
 
     def __enter__(self) -> "WorkingDirectoryGuard":
         """
@@ -57,10 +78,10 @@ class WorkingDirectoryGuard:
         Raises:
             RuntimeError: If current cwd does not match expected_cwd
         """
-        actual_cwd = resolve_absolute_path(Path.cwd())
+        actual_cwd = _current_cwd(self._resolve_symlinks)
         self._original_cwd = actual_cwd
 
-        logger.debug(f"WorkingDirectoryGuard: entering with cwd={actual_cwd}")
+        logger.debug("WorkingDirectoryGuard: entering with cwd=%s", actual_cwd)
 
         if actual_cwd != self._expected_cwd:
             raise RuntimeError(
@@ -76,21 +97,22 @@ class WorkingDirectoryGuard:
 
         Always restores cwd to what it was on entry, regardless of exceptions.
         """
-        current_cwd = resolve_absolute_path(Path.cwd())
+        current_cwd = _current_cwd(self._resolve_symlinks)
 
-        logger.debug(f"WorkingDirectoryGuard: exiting with cwd={current_cwd}")
+        logger.debug("WorkingDirectoryGuard: exiting with cwd=%s", current_cwd)
 
         if self._original_cwd is not None and current_cwd != self._original_cwd:
             logger.warning(
-                f"WorkingDirectoryGuard: cwd changed during context. "
-                f"Restoring from {current_cwd} to {self._original_cwd}"
+                "WorkingDirectoryGuard: cwd changed during context. "
+                "Restoring from %s to %s",
+                current_cwd,
+                self._original_cwd,
             )
             os.chdir(self._original_cwd)
-
-        logger.debug(f"WorkingDirectoryGuard: cwd after exit={Path.cwd().resolve()}")
+            logger.debug("WorkingDirectoryGuard: cwd after exit=%s", os.getcwd())
 
 
-def validate_cwd(expected: Path) -> None:
+def validate_cwd(expected: Path, resolve_symlinks: bool = False) -> None:
     """
     Validate that current working directory matches expected.
 
@@ -99,6 +121,7 @@ def validate_cwd(expected: Path) -> None:
 
     Args:
         expected: The expected current working directory
+        resolve_symlinks: Resolve the live cwd before comparing
 
     Raises:
         RuntimeError: If actual cwd does not match expected, with clear
@@ -109,7 +132,7 @@ def validate_cwd(expected: Path) -> None:
         run_my_command()  # Safe to proceed
     """
     expected_resolved = resolve_absolute_path(expected)
-    actual_cwd = resolve_absolute_path(Path.cwd())
+    actual_cwd = _current_cwd(resolve_symlinks)
 
     if actual_cwd != expected_resolved:
         raise RuntimeError(
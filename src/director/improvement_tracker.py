@@ -17,7 +17,13 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
-from .metrics_molecules import MetricsData, append_metrics, load_metrics
+from .metrics_molecules import (
+    MetricsData,
+    append_metrics,
+    count_metrics_since,
+    load_metrics_summary,
+)
+from .parallel_atoms import recommend_parallelism as _recommend_parallelism
 from .utils import get_harness_root
 
 # Configure module logger
@@ -111,41 +117,27 @@ def get_success_rate(
     if metrics_file is None:
         metrics_file = DEFAULT_METRICS_FILE
 
-    # Load all metrics
-    metrics_list = load_metrics(metrics_file)
+    # Without a time window the running counts answer directly - no scan
+    if time_window_hours is None:
+        return _success_rate_from_summary(agent_type, metrics_file)
 
-    if metrics_list is None or len(metrics_list) == 0:
+    # Count entries inside the time window from the cached columns
+    cutoff_time = datetime.now() - timedelta(hours=time_window_hours)
+    counts = count_metrics_since(metrics_file, cutoff_time, agent_type)
+
+    if counts is None:
         logger.debug("No metrics data available for success rate calculation")
         return None
 
-    # Apply time window filter if specified
-    if time_window_hours is not None:
-        cutoff_time = datetime.now() - timedelta(hours=time_window_hours)
-        filtered_by_time = []
-        for m in metrics_list:
-            try:
-                entry_time = datetime.fromisoformat(m.start_time)
-                if entry_time >= cutoff_time:
-                    filtered_by_time.append(m)
-            except ValueError as e:
-                logger.warning(f"Invalid timestamp format in metrics: {m.start_time}, {e}")
-                continue
-        metrics_list = filtered_by_time
-
-    # Apply agent type filter if specified
-    if agent_type is not None:
-        metrics_list = [m for m in metrics_list if m.agent_type == agent_type]
-
     # Calculate success rate
-    if len(metrics_list) == 0:
+    total, successful = counts
+    if total == 0:
         logger.debug(
             f"No metrics match filters: agent_type={agent_type}, "
             f"time_window_hours={time_window_hours}"
         )
         return None
 
-    successful = sum(1 for m in metrics_list if m.status == "success")
-    total = len(metrics_list)
     rate = successful / total
 
     logger.debug(
@@ -156,6 +148,42 @@ def get_success_rate(
     return rate
 
 
+def _success_rate_from_summary(agent_type: Optional[str], metrics_file: Path) -> Optional[float]:
+    """
+    Success rate over all entries (optionally one agent type) from the
+    running counts kept by the metrics cache.
+
+    Args:
+        agent_type: Optional filter for specific agent type
+        metrics_file: Path to the metrics file
+
+    Returns:
+        Success rate between 0.0 and 1.0, or None if no data matches
+    """
+    summary = load_metrics_summary(metrics_file)
+    if summary is None or summary.total == 0:
+        logger.debug("No metrics data available for success rate calculation")
+        return None
+
+    if agent_type is None:
+        total, successful = summary.total, summary.successful
+    else:
+        total, successful = summary.by_agent.get(agent_type, (0, 0))
+
+    if total == 0:
+        logger.debug(
+            f"No metrics match filters: agent_type={agent_type}, time_window_hours=None"
+        )
+        return None
+
+    rate = successful / total
+    logger.debug(
+        f"Success rate: {rate:.2%} ({successful}/{total}) "
+        f"[agent_type={agent_type}, time_window=None]"
+    )
+    return rate
+
+
 def recommend_parallelism(current_load: int, success_rate: float) -> int:
     """
     Recommend optimal number of parallel agents based on current metrics.
@@ -176,33 +204,19 @@ def recommend_parallelism(current_load: int, success_rate: float) -> int:
         - If success_rate < 0.5: decrease by 1 (struggling, reduce load)
         - Otherwise: maintain current load (stable performance)
     """
-    # Clamp success_rate to valid range
-    success_rate = max(0.0, min(1.0, success_rate))
-
-    # Determine recommendation
-    if success_rate > 0.8 and current_load < 3:
-        # High success rate with low load - can increase
-        recommended = current_load + 1
-        logger.debug(
-            f"Recommending increase: success_rate={success_rate:.2%} > 80%, "
-            f"load={current_load} < 3 -> {recommended}"
-        )
-    elif success_rate < 0.5:
-        # Low success rate - reduce load
-        recommended = max(1, current_load - 1)
-        logger.debug(
-            f"Recommending decrease: success_rate={success_rate:.2%} < 50% "
-            f"-> {recommended}"
-        )
-    else:
-        # Maintain current load
-        recommended = current_load
-        logger.debug(
-            f"Recommending maintain: success_rate={success_rate:.2%}, "
-            f"load={current_load} -> {recommended}"
-        )
+    recommended = _recommend_parallelism(
+        success_rate,
+        current_load,
+        up_threshold=0.8,
+        down_threshold=0.5,
+        max_p=5,
+        grow_below=3,
+        strict_up=True,
+    )
 
-    # Clamp to valid range (1-5)
-    recommended = max(1, min(5, recommended))
+    logger.debug(
+        f"Recommending parallelism: success_rate={success_rate:.2%}, "
+        f"load={current_load} -> {recommended}"
+    )
 
     return recommended
@@ -5,35 +5,82 @@ Director Metrics Molecules - Execution Metrics Persistence
 Molecules for persisting and loading sub-agent execution metrics.
 These compose JSON I/O atoms into cohesive metrics handling units.
 
+Metrics are stored as newline-delimited JSON (one entry per line) so that
+recording an execution is a single append rather than a full rewrite.
+
 The metrics system tracks:
 - Execution timing (start, end, duration)
 - Agent type and issue assignment
 - Success/failure status
 """
 
+import atexit
+import bisect
 import json
 import logging
-from dataclasses import dataclass, asdict
+import os
+import queue
+import stat
+import sys
+import tempfile
+import threading
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are still O_APPEND, just unlocked
+    fcntl = None
 
 from .utils import resolve_absolute_path
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Parse with orjson when installed, stdlib json otherwise. Both accept bytes
+# and raise ValueError subclasses on malformed input.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Parsed metrics files keyed by path. Each entry stores the file's
+# (st_mtime_ns, st_size) at parse time; a mismatch on the next load means the
+# file changed and is re-read. save drops the entry for its path; append
+# extends a fresh entry in place so the next load does not reparse.
+_METRICS_CACHE: dict[str, tuple[int, int, "_ParsedMetrics"]] = {}
+
+# Guards the cached _ParsedMetrics objects: the background writer extends
+# them in place while callers read them on their own threads.
+_METRICS_CACHE_LOCK = threading.Lock()
+
+# Background append queue used by enqueue_metrics(): (resolved path, entry)
+# pairs drained by a single daemon writer thread started on first use.
+_write_queue: "queue.Queue[tuple[Path, MetricsData]]" = queue.Queue()
+_writer_thread: Optional[threading.Thread] = None
+_writer_start_lock = threading.Lock()
+
+# How long the writer waits for more entries before writing a batch
+_WRITE_BATCH_LINGER_SECONDS = 0.05
+
 
 # =============================================================================
 # ATOMS - Data Classes
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricsData:
     """
     Data class for storing sub-agent execution metrics.
 
+    Slotted: a metrics log holds one instance per recorded execution, so
+    dropping the per-instance __dict__ keeps large logs small in memory.
+
     Attributes:
         start_time: ISO format timestamp when execution started
         end_time: ISO format timestamp when execution completed
@@ -51,6 +98,196 @@ class MetricsData:
     issue_id: str
 
 
+@dataclass
+class MetricsSummary:
+    """
+    Running success/total counts over a metrics file.
+
+    Built once when the file is parsed and updated per appended entry, so
+    success-rate queries without a time window need no scan.
+
+    Attributes:
+        total: Number of entries
+        successful: Number of entries with status "success"
+        by_agent: agent_type -> [total, successful] for that agent
+    """
+
+    total: int = 0
+    successful: int = 0
+    by_agent: Dict[str, List[int]] = field(default_factory=dict)
+
+    def add(self, metrics: MetricsData) -> None:
+        """Count one more entry."""
+        ok = metrics.status == "success"
+        self.total += 1
+        self.successful += ok
+        counts = self.by_agent.get(metrics.agent_type)
+        if counts is None:
+            counts = self.by_agent[metrics.agent_type] = [0, 0]
+        counts[0] += 1
+        counts[1] += ok
+
+    def copy(self) -> "MetricsSummary":
+        """Return an independent snapshot of these counts."""
+        return MetricsSummary(
+            total=self.total,
+            successful=self.successful,
+            by_agent={agent: list(counts) for agent, counts in self.by_agent.items()},
+        )
+
+
+def _to_epoch_ns(moment: datetime) -> int:
+    """
+    Convert a datetime to integer nanoseconds since the epoch.
+
+    Naive datetimes are taken as local time, matching datetime.now().
+
+    Args:
+        moment: Naive or timezone-aware datetime
+
+    Returns:
+        Epoch nanoseconds (microsecond precision)
+    """
+    return round(moment.timestamp() * 1_000_000) * 1_000
+
+
+def _start_time_ns(metrics: MetricsData) -> Optional[int]:
+    """
+    Parse an entry's ISO start_time to epoch nanoseconds.
+
+    Args:
+        metrics: Entry whose start_time to parse
+
+    Returns:
+        Epoch nanoseconds, or None if the timestamp is malformed
+    """
+    try:
+        return _to_epoch_ns(datetime.fromisoformat(metrics.start_time))
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(slots=True)
+class _ParsedMetrics:
+    """
+    In-memory form of one metrics file, as held by _METRICS_CACHE.
+
+    Besides the entries themselves this keeps column-wise views built once
+    per entry: start_time as epoch nanoseconds (parsed once, compared as
+    ints) and a running count of successes. While start times are in order,
+    a time-window count is two binary searches and a prefix-sum difference.
+
+    Attributes:
+        entries: MetricsData entries in file order
+        summary: Running success/total counts over entries
+        start_ns: Epoch start time per entry (None if malformed)
+        success_prefix: success_prefix[i] = successes among entries[:i]
+        by_agent: agent_type -> (start_ns, success_prefix) over that agent's entries
+        start_sorted: True while start_ns is non-decreasing with no None
+    """
+
+    entries: List[MetricsData] = field(default_factory=list)
+    summary: MetricsSummary = field(default_factory=MetricsSummary)
+    start_ns: List[Optional[int]] = field(default_factory=list)
+    success_prefix: List[int] = field(default_factory=lambda: [0])
+    by_agent: Dict[str, tuple[List[Optional[int]], List[int]]] = field(default_factory=dict)
+    start_sorted: bool = True
+
+    def add(self, metrics: MetricsData) -> None:
+        """Append one entry and update the derived columns."""
+        start_ns = _start_time_ns(metrics)
+        if start_ns is None:
+            logger.warning(f"Invalid timestamp format in metrics: {metrics.start_time}")
+            self.start_sorted = False
+        elif self.start_sorted and self.start_ns and start_ns < self.start_ns[-1]:
+            self.start_sorted = False
+        ok = metrics.status == "success"
+
+        self.entries.append(metrics)
+        self.summary.add(metrics)
+        self.start_ns.append(start_ns)
+        self.success_prefix.append(self.success_prefix[-1] + ok)
+
+        column = self.by_agent.get(metrics.agent_type)
+        if column is None:
+            column = self.by_agent[metrics.agent_type] = ([], [0])
+        column[0].append(start_ns)
+        column[1].append(column[1][-1] + ok)
+
+
+def _parse_entries(metrics_list: List[MetricsData]) -> _ParsedMetrics:
+    """Build a _ParsedMetrics over metrics_list."""
+    parsed = _ParsedMetrics()
+    for m in metrics_list:
+        parsed.add(m)
+    return parsed
+
+
+# =============================================================================
+# ATOMS - NDJSON line codec
+# =============================================================================
+
+
+# Field names in declaration order, for building the JSON object directly
+_METRICS_FIELDS = tuple(f.name for f in fields(MetricsData))
+
+
+def _encode_metrics_line(metrics: MetricsData) -> bytes:
+    """
+    Serialize one metrics entry as a single compact NDJSON line.
+
+    orjson serializes dataclass instances natively; the stdlib fallback
+    reads the fields into a flat dict. Either way the recursive deep copy
+    of dataclasses.asdict() is skipped.
+
+    Args:
+        metrics: Entry to serialize
+
+    Returns:
+        UTF-8 JSON object terminated by a newline
+    """
+    if orjson is not None:
+        return orjson.dumps(metrics, option=orjson.OPT_APPEND_NEWLINE)
+    data = {name: getattr(metrics, name) for name in _METRICS_FIELDS}
+    return (json.dumps(data, separators=(",", ":")) + "\n").encode()
+
+
+def _intern(value):
+    """sys.intern() for str values; anything else is returned unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _metrics_from_entry(entry) -> Optional[MetricsData]:
+    """
+    Rebuild a MetricsData from a decoded JSON value.
+
+    Args:
+        entry: Decoded JSON value for one record
+
+    Returns:
+        MetricsData, or None if the value is not a complete metrics object
+    """
+    if not isinstance(entry, dict):
+        logger.warning(f"Skipping invalid metrics entry: {entry}")
+        return None
+
+    try:
+        # status/agent_type come from a handful of values; interning makes
+        # every loaded entry share one string object per value, and ==
+        # against an interned constant short-circuits on identity
+        return MetricsData(
+            start_time=entry["start_time"],
+            end_time=entry["end_time"],
+            duration=entry["duration"],
+            status=_intern(entry["status"]),
+            agent_type=_intern(entry["agent_type"]),
+            issue_id=entry["issue_id"],
+        )
+    except KeyError as e:
+        logger.warning(f"Skipping metrics entry missing field: {e}")
+        return None
+
+
 # =============================================================================
 # MOLECULES - Composed helpers for metrics persistence
 # =============================================================================
@@ -58,29 +295,29 @@ class MetricsData:
 
 def save_metrics(metrics_list: List[MetricsData], file_path: Path) -> bool:
     """
-    Save a list of metrics entries to a JSON file.
+    Save a list of metrics entries to an NDJSON file.
 
-    This molecule writes metrics data to disk in JSON format. It overwrites
-    any existing file at the target path.
+    This molecule writes one compact JSON object per line. It overwrites
+    any existing file at the target path; an empty list yields an empty file.
 
     Args:
         metrics_list: List of MetricsData entries to save
-        file_path: Absolute path to the JSON file to write
+        file_path: Absolute path to the metrics file to write
 
     Returns:
         True if save succeeded, False on error
     """
-    file_path_resolved = resolve_absolute_path(file_path)
+    file_path_resolved = resolve_absolute_path(file_path, resolve_symlinks=False)
+    _METRICS_CACHE.pop(os.fspath(file_path_resolved), None)
 
     try:
         # Ensure parent directory exists
         file_path_resolved.parent.mkdir(parents=True, exist_ok=True)
 
-        # Convert dataclasses to dicts for JSON serialization
-        data = [asdict(m) for m in metrics_list]
+        data = b"".join(_encode_metrics_line(m) for m in metrics_list)
 
-        with open(file_path_resolved, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        with open(file_path_resolved, "wb") as f:
+            f.write(data)
 
         logger.debug(f"Saved {len(metrics_list)} metrics entries to {file_path_resolved}")
         return True
@@ -90,94 +327,517 @@ def save_metrics(metrics_list: List[MetricsData], file_path: Path) -> bool:
         return False
 
 
-def load_metrics(file_path: Path) -> Optional[List[MetricsData]]:
+def _parse_legacy_array(file_path_resolved: Path, content: bytes) -> Optional[List[MetricsData]]:
+    """
+    Parse a metrics file in the old single-JSON-array format.
+
+    Args:
+        file_path_resolved: Resolved path of the metrics file (for logging)
+        content: Full file content (starts with "[")
+
+    Returns:
+        List of MetricsData entries, or None if the array is malformed
+    """
+    try:
+        data = _json_loads(content)
+    except ValueError as e:
+        logger.error(f"Invalid JSON in metrics file {file_path_resolved}: {e}")
+        return None
+
+    if not isinstance(data, list):
+        logger.error(f"Invalid metrics format: expected list, got {type(data)}")
+        return None
+
+    return [m for m in map(_metrics_from_entry, data) if m is not None]
+
+
+def _load_legacy_array(file_path_resolved: Path, content: bytes) -> Optional[List[MetricsData]]:
+    """
+    Load a metrics file in the old single-JSON-array format and rewrite it
+    as NDJSON so later appends can go straight to the end of the file.
+
+    Args:
+        file_path_resolved: Resolved path of the metrics file
+        content: Full file content (starts with "[")
+
+    Returns:
+        List of MetricsData entries, or None if the array is malformed
+    """
+    metrics_list = _parse_legacy_array(file_path_resolved, content)
+    if metrics_list is None:
+        return None
+
+    # One-shot migration to the line-per-entry format
+    _migrate_legacy_file(file_path_resolved)
+
+    return metrics_list
+
+
+def _open_locked(file_path_resolved: Path, mode: str):
+    """
+    Open a metrics file and take an exclusive flock() on it.
+
+    Legacy migration swaps in a new file with os.replace() while holding
+    the lock, so a waiter can end up locking the old, unlinked file. After
+    locking, the path is checked to still name the open file, and is
+    reopened if it does not.
+
+    Args:
+        file_path_resolved: Resolved path of the metrics file
+        mode: open() mode ("a+b" to append, "rb" to migrate)
+
+    Returns:
+        Open file object holding the lock (closing it releases the lock)
+    """
+    while True:
+        f = open(file_path_resolved, mode)
+        if fcntl is None:
+            return f
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            held = os.fstat(f.fileno())
+            current = os.stat(file_path_resolved)
+        except FileNotFoundError:
+            # Removed while we waited; open() recreates it or raises
+            f.close()
+            continue
+        except BaseException:
+            f.close()
+            raise
+        if (held.st_dev, held.st_ino) == (current.st_dev, current.st_ino):
+            return f
+        f.close()
+
+
+def _rewrite_legacy_locked(f, file_path_resolved: Path, content: bytes, tail: bytes = b"") -> bool:
+    """
+    Replace a locked legacy single-array file with its NDJSON form.
+
+    The NDJSON (plus tail) is written to a temporary file next to the
+    original and swapped in with os.replace() while the caller still holds
+    the lock, so no appender can write between the rewrite and the swap.
+
+    Args:
+        f: The legacy file, opened and locked with _open_locked()
+        file_path_resolved: Resolved path of the metrics file
+        content: Full file content (starts with "[")
+        tail: Already-encoded NDJSON lines to add after the migrated entries
+
+    Returns:
+        True if the file was replaced, False if the array is malformed
+        (the file is then left as it was)
+
+    Raises:
+        OSError: If the temporary file cannot be written or swapped in
     """
-    Load metrics entries from a JSON file.
+    metrics_list = _parse_legacy_array(file_path_resolved, content)
+    if metrics_list is None:
+        return False
 
-    This molecule reads metrics data from disk and reconstructs MetricsData
-    objects. Returns None if the file doesn't exist or contains invalid data.
+    data = b"".join(_encode_metrics_line(m) for m in metrics_list) + tail
+    fd, tmp_path = tempfile.mkstemp(
+        dir=file_path_resolved.parent, prefix=f".{file_path_resolved.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        # mkstemp creates 0600; keep the original file's permissions
+        os.chmod(tmp_path, stat.S_IMODE(os.fstat(f.fileno()).st_mode))
+        os.replace(tmp_path, file_path_resolved)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    logger.info(f"Migrated legacy metrics file to NDJSON: {file_path_resolved}")
+    return True
+
+
+def _migrate_legacy_file(file_path_resolved: Path) -> bool:
+    """
+    Rewrite a legacy single-array metrics file as NDJSON, under the lock.
 
     Args:
-        file_path: Absolute path to the JSON file to read
+        file_path_resolved: Resolved path of the metrics file
 
     Returns:
-        List of MetricsData entries, or None if file missing or invalid
+        True if the file is now NDJSON (including when another process
+        migrated it first), False if the array is malformed or the
+        rewrite failed (the file is then left as it was)
     """
-    file_path_resolved = resolve_absolute_path(file_path)
+    try:
+        with _open_locked(file_path_resolved, "rb") as f:
+            content = f.read()
+            if not content.lstrip().startswith(b"["):
+                return True
+            return _rewrite_legacy_locked(f, file_path_resolved, content)
+    except OSError as e:
+        logger.error(f"Failed to migrate legacy metrics file {file_path_resolved}: {e}")
+        return False
+
 
-    if not file_path_resolved.exists():
+def _load_metrics_cached(file_path_resolved: Path) -> Optional[_ParsedMetrics]:
+    """
+    Load a metrics file through _METRICS_CACHE.
+
+    Args:
+        file_path_resolved: Resolved path of the metrics file
+
+    Returns:
+        The parsed file (shared with the cache - do not mutate), or None
+        if the file is missing or contains no parseable line at all
+    """
+    cache_key = os.fspath(file_path_resolved)
+
+    try:
+        st = os.stat(cache_key)
+    except FileNotFoundError:
         logger.debug(f"Metrics file not found: {file_path_resolved}")
         return None
+    except OSError as e:
+        logger.error(f"Failed to load metrics from {file_path_resolved}: {e}")
+        return None
 
+    cached = _METRICS_CACHE.get(cache_key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    # Stream the file line by line: peak memory is one line plus the parsed
+    # entries, not the whole file and a split copy of it
+    parsed = _ParsedMetrics()
+    legacy_content = None
+    parsed_lines = 0
+    bad_lines = 0
     try:
-        with open(file_path_resolved, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(file_path_resolved, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                if parsed_lines == 0 and bad_lines == 0 and line.lstrip().startswith(b"["):
+                    # Old single-array format: needs the whole document
+                    legacy_content = line + f.read()
+                    break
+                try:
+                    entry = _json_loads(line)
+                except ValueError:
+                    bad_lines += 1
+                    continue
+                parsed_lines += 1
+                metrics = _metrics_from_entry(entry)
+                if metrics is not None:
+                    parsed.add(metrics)
+    except OSError as e:
+        logger.error(f"Failed to load metrics from {file_path_resolved}: {e}")
+        return None
 
-        if not isinstance(data, list):
-            logger.error(f"Invalid metrics format: expected list, got {type(data)}")
+    if legacy_content is not None:
+        metrics_list = _load_legacy_array(file_path_resolved, legacy_content)
+        if metrics_list is None:
             return None
+        return _parse_entries(metrics_list)
 
-        # Reconstruct MetricsData objects from dicts
-        metrics_list = []
-        for entry in data:
-            if not isinstance(entry, dict):
-                logger.warning(f"Skipping invalid metrics entry: {entry}")
-                continue
+    if bad_lines:
+        if parsed_lines == 0:
+            logger.error(f"Invalid JSON in metrics file {file_path_resolved}")
+            return None
+        logger.warning(f"Skipped {bad_lines} malformed lines in {file_path_resolved}")
 
-            try:
-                metrics = MetricsData(
-                    start_time=entry["start_time"],
-                    end_time=entry["end_time"],
-                    duration=entry["duration"],
-                    status=entry["status"],
-                    agent_type=entry["agent_type"],
-                    issue_id=entry["issue_id"],
-                )
-                metrics_list.append(metrics)
-            except KeyError as e:
-                logger.warning(f"Skipping metrics entry missing field: {e}")
-                continue
-
-        logger.debug(f"Loaded {len(metrics_list)} metrics entries from {file_path_resolved}")
-        return metrics_list
-
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in metrics file {file_path_resolved}: {e}")
+    _METRICS_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, parsed)
+    logger.debug(f"Loaded {len(parsed.entries)} metrics entries from {file_path_resolved}")
+    return parsed
+
+
+def load_metrics(file_path: Path) -> Optional[List[MetricsData]]:
+    """
+    Load metrics entries from an NDJSON file.
+
+    This molecule reads one JSON object per line and reconstructs MetricsData
+    objects. Malformed lines (e.g. a torn write) are skipped. Files in the
+    legacy single-array format are converted to NDJSON on first load.
+    Parsed results are cached until the file's mtime or size changes.
+
+    Args:
+        file_path: Absolute path to the metrics file to read
+
+    Returns:
+        List of MetricsData entries, or None if the file is missing or
+        contains no parseable line at all
+    """
+    loaded = _load_metrics_cached(resolve_absolute_path(file_path, resolve_symlinks=False))
+    if loaded is None:
         return None
-    except (OSError, TypeError) as e:
-        logger.error(f"Failed to load metrics from {file_path_resolved}: {e}")
+
+    # Callers may mutate the list they get back, so hand out a copy
+    with _METRICS_CACHE_LOCK:
+        return list(loaded.entries)
+
+
+def load_metrics_summary(file_path: Path) -> Optional[MetricsSummary]:
+    """
+    Load success/total counts for a metrics file.
+
+    Served from the same cache as load_metrics(), so repeated calls on an
+    unchanged (or only appended-to) file cost a stat.
+
+    Args:
+        file_path: Absolute path to the metrics file to read
+
+    Returns:
+        Snapshot of the cached MetricsSummary (later appends do not change
+        it), or None if the file is missing or contains no parseable line
+    """
+    loaded = _load_metrics_cached(resolve_absolute_path(file_path, resolve_symlinks=False))
+    if loaded is None:
+        return None
+    with _METRICS_CACHE_LOCK:
+        return loaded.summary.copy()
+
+
+def load_metrics_since(file_path: Path, cutoff_time: datetime) -> Optional[List[MetricsData]]:
+    """
+    Load the metrics entries that started at or after cutoff_time.
+
+    Start times are compared as cached epoch integers. When they are in
+    order (the normal append-only case) the first in-window entry is found
+    by binary search. Entries with malformed timestamps are excluded.
+
+    Args:
+        file_path: Absolute path to the metrics file to read
+        cutoff_time: Oldest start time to include (naive = local time)
+
+    Returns:
+        List of matching MetricsData entries, or None if the file is missing
+        or contains no parseable line at all
+    """
+    loaded = _load_metrics_cached(resolve_absolute_path(file_path, resolve_symlinks=False))
+    if loaded is None:
+        return None
+
+    cutoff_ns = _to_epoch_ns(cutoff_time)
+    with _METRICS_CACHE_LOCK:
+        if loaded.start_sorted:
+            return loaded.entries[bisect.bisect_left(loaded.start_ns, cutoff_ns):]
+
+        return [
+            m
+            for m, start_ns in zip(loaded.entries, loaded.start_ns)
+            if start_ns is not None and start_ns >= cutoff_ns
+        ]
+
+
+def _count_since(
+    loaded: _ParsedMetrics,
+    cutoff_ns: int,
+    agent_type: Optional[str],
+) -> tuple[int, int]:
+    """count_metrics_since() over an already-loaded file; caller holds _METRICS_CACHE_LOCK."""
+    if loaded.start_sorted:
+        if agent_type is None:
+            starts, success_prefix = loaded.start_ns, loaded.success_prefix
+        else:
+            column = loaded.by_agent.get(agent_type)
+            if column is None:
+                return 0, 0
+            starts, success_prefix = column
+        first = bisect.bisect_left(starts, cutoff_ns)
+        return len(starts) - first, success_prefix[-1] - success_prefix[first]
+
+    total = successful = 0
+    for m, start_ns in zip(loaded.entries, loaded.start_ns):
+        if start_ns is None or start_ns < cutoff_ns:
+            continue
+        if agent_type is not None and m.agent_type != agent_type:
+            continue
+        total += 1
+        successful += m.status == "success"
+    return total, successful
+
+
+def count_metrics_since(
+    file_path: Path,
+    cutoff_time: datetime,
+    agent_type: Optional[str] = None,
+) -> Optional[tuple[int, int]]:
+    """
+    Count entries, and successful entries, that started at or after cutoff_time.
+
+    For files in time order (the normal append-only case) this is two binary
+    searches over cached columns and needs no per-entry work. Otherwise it
+    falls back to one integer-compare pass. Entries with malformed
+    timestamps are not counted.
+
+    Args:
+        file_path: Absolute path to the metrics file to read
+        cutoff_time: Oldest start time to include (naive = local time)
+        agent_type: Optional filter for specific agent type
+
+    Returns:
+        (total, successful) for the matching entries, or None if the file is
+        missing or contains no parseable line at all
+    """
+    loaded = _load_metrics_cached(resolve_absolute_path(file_path, resolve_symlinks=False))
+    if loaded is None:
         return None
 
+    cutoff_ns = _to_epoch_ns(cutoff_time)
+
+    # The writer thread may be extending these columns; read them as one state
+    with _METRICS_CACHE_LOCK:
+        return _count_since(loaded, cutoff_ns, agent_type)
+
+
+def _append_entries(file_path_resolved: Path, entries: List[MetricsData]) -> bool:
+    """
+    Append entries to a metrics file with a single locked write.
+
+    Args:
+        file_path_resolved: Resolved path of the metrics file
+        entries: Entries to append, in order
+
+    Returns:
+        True if the write succeeded, False on error
+    """
+    cache_key = os.fspath(file_path_resolved)
+    cached = _METRICS_CACHE.pop(cache_key, None)
+
+    try:
+        file_path_resolved.parent.mkdir(parents=True, exist_ok=True)
+        data = b"".join(_encode_metrics_line(m) for m in entries)
+
+        # Parallel agents append to the same file; hold an exclusive lock
+        # across the format checks and the write. Closing the file releases it.
+        with _open_locked(file_path_resolved, "a+b") as f:
+            before = os.fstat(f.fileno())
+            size = before.st_size
+            if size > 0:
+                f.seek(0)
+                head = f.read(1)
+                if head == b"[":
+                    # Convert the old array file with the new entries on the
+                    # end. A malformed array is left alone and nothing is
+                    # appended: NDJSON lines after it would make every later
+                    # load fail.
+                    if not _rewrite_legacy_locked(f, file_path_resolved, head + f.read(), data):
+                        logger.error(f"Not appending to malformed legacy metrics file {file_path_resolved}")
+                        return False
+                    return True
+                # Keep the new entries on their own lines after a torn write
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    data = b"\n" + data
+            # Append mode: the write always lands at end of file
+            f.write(data)
+            f.flush()
+            after = os.fstat(f.fileno())
+
+        if (
+            cached is not None
+            and cached[0] == before.st_mtime_ns
+            and cached[1] == size
+            and after.st_size == size + len(data)
+        ):
+            # The cache described the file right up to our write and nobody
+            # else wrote in between: extend it rather than reparse later
+            with _METRICS_CACHE_LOCK:
+                for m in entries:
+                    cached[2].add(m)
+            _METRICS_CACHE[cache_key] = (after.st_mtime_ns, after.st_size, cached[2])
+
+    except (OSError, TypeError, ValueError) as e:
+        logger.error(f"Failed to append metrics to {file_path_resolved}: {e}")
+        return False
+
+    return True
+
 
 def append_metrics(metrics: MetricsData, file_path: Path) -> bool:
     """
-    Append a single metrics entry to an existing file.
+    Append a single metrics entry to a metrics file.
 
-    This molecule loads existing metrics (if any), adds the new entry,
-    and saves the combined list. If the file doesn't exist, it creates
-    a new file with just this entry.
+    This molecule writes one NDJSON line to the end of the file without
+    reading or rewriting existing entries, so the cost is independent of
+    file size. Concurrent appenders are serialized with flock() where
+    available. If the file doesn't exist, it is created. A legacy
+    single-array file is migrated to NDJSON first. A cached parse of the
+    file is extended with the new entry instead of being discarded.
 
     Args:
         metrics: Single MetricsData entry to append
-        file_path: Absolute path to the JSON file
+        file_path: Absolute path to the metrics file
 
     Returns:
         True if append succeeded, False on error
     """
-    file_path_resolved = resolve_absolute_path(file_path)
+    if not _append_entries(resolve_absolute_path(file_path, resolve_symlinks=False), [metrics]):
+        return False
+
+    logger.debug(f"Appended metrics entry for issue {metrics.issue_id}")
+    return True
+
+
+# =============================================================================
+# MOLECULES - Batched background writes (opt-in)
+# =============================================================================
+
+
+def _metrics_writer() -> None:
+    """
+    Background writer loop: drain the queue and append each batch per file.
 
-    # Load existing metrics (or start with empty list if file doesn't exist)
-    existing = load_metrics(file_path_resolved)
-    if existing is None:
-        existing = []
+    Blocks for the first item, then keeps collecting until the queue has
+    been idle for _WRITE_BATCH_LINGER_SECONDS, so a burst of records from
+    parallel agents turns into one locked write per file.
+    """
+    while True:
+        batch = [_write_queue.get()]
+        while True:
+            try:
+                batch.append(_write_queue.get(timeout=_WRITE_BATCH_LINGER_SECONDS))
+            except queue.Empty:
+                break
 
-    # Append the new entry
-    existing.append(metrics)
+        by_file: Dict[Path, List[MetricsData]] = {}
+        for file_path_resolved, metrics in batch:
+            by_file.setdefault(file_path_resolved, []).append(metrics)
 
-    # Save the combined list
-    success = save_metrics(existing, file_path_resolved)
+        for file_path_resolved, entries in by_file.items():
+            if _append_entries(file_path_resolved, entries):
+                logger.debug(f"Appended {len(entries)} queued metrics entries to {file_path_resolved}")
 
-    if success:
-        logger.debug(f"Appended metrics entry for issue {metrics.issue_id}")
+        for _ in batch:
+            _write_queue.task_done()
 
-    return success
+
+def enqueue_metrics(metrics: MetricsData, file_path: Path) -> None:
+    """
+    Queue a metrics entry for a batched background append.
+
+    Unlike append_metrics(), this returns immediately; a daemon thread
+    (started on first use) coalesces queued entries into one write per file.
+    Call flush_metrics_queue() before reading the file back. Pending entries
+    are flushed at interpreter exit.
+
+    Args:
+        metrics: Single MetricsData entry to append
+        file_path: Absolute path to the metrics file
+    """
+    global _writer_thread
+
+    with _writer_start_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(
+                target=_metrics_writer, name="metrics-writer", daemon=True
+            )
+            _writer_thread.start()
+            atexit.register(flush_metrics_queue)
+
+    _write_queue.put((resolve_absolute_path(file_path, resolve_symlinks=False), metrics))
+
+
+def flush_metrics_queue() -> None:
+    """
+    Block until every entry queued by enqueue_metrics() has been written.
+    """
+    _write_queue.join()
@@ -6,8 +6,14 @@ Pure functions for parallel execution logic with zero dependencies.
 These atoms support the ParallelMetrics class and parallel orchestration.
 """
 
+import functools
+import heapq
+import statistics
+import time
+from collections import deque
 from datetime import datetime
-from typing import Any
+from itertools import islice
+from typing import Any, Iterable, Iterator, Optional
 
 
 # =============================================================================
@@ -15,6 +21,11 @@ from typing import Any
 # =============================================================================
 
 
+# Use 5 as default for missing priority (lower than P4=3)
+# This ensures issues without priority sort last
+_MISSING_PRIORITY = 5
+
+
 def sort_by_priority(issues: list[dict]) -> list[dict]:
     """
     Sort issues by Beads priority (P0-P4, lower number = higher priority).
@@ -36,28 +47,121 @@ def sort_by_priority(issues: list[dict]) -> list[dict]:
         >>> sort_by_priority([{'id': 'x'}])  # No priority = treated as 5
         [{'id': 'x'}]
     """
-    # Use 5 as default for missing priority (lower than P4=3)
-    # This ensures issues without priority sort last
-    return sorted(issues, key=lambda issue: issue.get("priority", 5))
+    # Decorate with (priority, index): tuple comparison then runs in C with
+    # no key callback, and the unique index keeps the sort stable without
+    # ever comparing the issue dicts themselves
+    decorated = _decorate_by_priority(issues)
+    decorated.sort()
+    return [issue for _, _, issue in decorated]
+
+
+def top_k_by_priority(issues: list[dict], k: int) -> list[dict]:
+    """
+    Return the k highest-priority issues, in sort_by_priority() order.
+
+    This atom is for schedulers that only need the next few ready issues:
+    heapq.nsmallest is O(n log k) instead of a full O(n log n) sort.
+
+    Args:
+        issues: List of issue dicts, each may have a 'priority' key (0-4)
+        k: Number of issues to return
+
+    Returns:
+        New list of at most k issues, highest priority (0) first; ties keep
+        their original order
+
+    Examples:
+        >>> top_k_by_priority([{'id': 'a', 'priority': 2}, {'id': 'b', 'priority': 0}], 1)
+        [{'id': 'b', 'priority': 0}]
+    """
+    return [issue for _, _, issue in heapq.nsmallest(k, _decorate_by_priority(issues))]
+
+
+def merge_sorted_by_priority(*streams: Iterable[dict]) -> Iterator[dict]:
+    """
+    Lazily merge issue streams that are each already sorted by priority.
+
+    This atom is for combining queues that arrive pre-sorted (e.g. the ready
+    queue and newly unblocked issues) without copying and re-sorting them:
+    issues are yielded as soon as they are known to come next.
+
+    Args:
+        *streams: Iterables of issue dicts, each in sort_by_priority() order
+
+    Returns:
+        Iterator over all issues, highest priority (0) first; ties come from
+        earlier streams first, then in their original order
+
+    Examples:
+        >>> ready = [{'id': 'a', 'priority': 0}, {'id': 'b', 'priority': 2}]
+        >>> unblocked = [{'id': 'c', 'priority': 1}]
+        >>> [i['id'] for i in merge_sorted_by_priority(ready, unblocked)]
+        ['a', 'c', 'b']
+    """
+    return heapq.merge(*streams, key=_priority_key)
+
+
+def _priority_key(issue: dict) -> Any:
+    """Sort key for one issue: its priority, or _MISSING_PRIORITY."""
+    return issue.get("priority", _MISSING_PRIORITY)
+
+
+def _decorate_by_priority(issues: list[dict]) -> list[tuple[Any, int, dict]]:
+    """
+    Build (priority, index, issue) tuples for priority ordering.
 
+    Issues without priority are treated as lowest priority (priority 5).
+
+    Args:
+        issues: List of issue dicts
 
-def recommend_parallelism(success_rate: float, current_parallel: int = 2) -> int:
+    Returns:
+        List of (priority, original_index, issue) tuples
+    """
+    return [
+        (issue.get("priority", _MISSING_PRIORITY), index, issue)
+        for index, issue in enumerate(issues)
+    ]
+
+
+def recommend_parallelism(
+    success_rate: float,
+    current_parallel: int = 2,
+    *,
+    up_threshold: float = 0.90,
+    down_threshold: float = 0.70,
+    min_p: int = 1,
+    max_p: int = 4,
+    grow_below: Optional[int] = None,
+    strict_up: bool = False,
+) -> int:
     """
     Recommend max parallel count based on success rate.
 
-    This atom implements the scaling logic for parallel execution:
-    - Scale up (add 1) if success rate >= 90%
-    - Scale down (subtract 1) if success rate < 70%
+    This atom implements the scaling logic for parallel execution, and is
+    the single implementation behind every parallelism recommendation (the
+    improvement tracker organism calls it with its own thresholds):
+    - Scale up (add 1) if success rate >= up_threshold (> with strict_up)
+      (and current_parallel < grow_below, when given)
+    - Scale down (subtract 1) if success rate < down_threshold
     - Maintain current level otherwise
 
-    Bounds: minimum 1, maximum 4
+    Bounds: minimum min_p, maximum max_p
 
     Args:
         success_rate: Success rate as float 0.0-1.0 (e.g., 0.85 = 85%)
         current_parallel: Current parallel count (default 2)
+        up_threshold: Lowest success rate that scales up (default 0.90)
+        down_threshold: Success rates below this scale down (default 0.70)
+        min_p: Lower bound of the recommendation (default 1)
+        max_p: Upper bound of the recommendation (default 4)
+        grow_below: Only scale up while current_parallel is below this
+            (default None, no limit besides max_p)
+        strict_up: Scale up only when success_rate is strictly above
+            up_threshold (default False, scale up at the threshold)
 
     Returns:
-        Recommended max_parallel value (1-4)
+        Recommended max_parallel value (min_p-max_p)
 
     Examples:
         >>> recommend_parallelism(0.95, 2)  # High success, scale up
@@ -69,18 +173,145 @@ def recommend_parallelism(success_rate: float, current_parallel: int = 2) -> int
         >>> recommend_parallelism(0.80, 2)  # Medium success, maintain
         2
     """
-    if success_rate >= 0.90:
-        # High success rate - scale up
-        new_parallel = current_parallel + 1
-    elif success_rate < 0.70:
-        # Low success rate - scale down
-        new_parallel = current_parallel - 1
-    else:
-        # Acceptable success rate - maintain
-        new_parallel = current_parallel
+    # Step from the two thresholds as bool arithmetic, no branches:
+    # < down -> -1, down..up -> 0, >= up (with room to grow) -> +1
+    can_grow = grow_below is None or current_parallel < grow_below
+    above_up = success_rate > up_threshold if strict_up else success_rate >= up_threshold
+    step = (success_rate >= down_threshold) + (above_up & can_grow) - 1
+
+    # Enforce bounds
+    return max(min_p, min(max_p, current_parallel + step))
+
+
+class AdaptiveParallelismController:
+    """
+    AIMD controller for the parallel agent limit, with slow start.
+
+    Where recommend_parallelism() applies fixed thresholds to one success
+    rate, this controller adapts to the workload: outcomes are collected
+    in windows of `window_ops`, and at the end of each window
+
+    - stress (success rate below `success_target`, or p95 latency above
+      `latency_inflation_factor` times the best p95 seen so far) halves
+      the limit and ends slow start
+    - a healthy window doubles the limit during slow start, and adds 1
+      afterwards
+
+    The limit always stays within [min_limit, max_limit].
+
+    Attributes:
+        current_limit: Recommended max parallel count right now
+        in_slow_start: True until the first stressed window
+    """
+
+    __slots__ = (
+        "current_limit",
+        "in_slow_start",
+        "min_limit",
+        "max_limit",
+        "success_target",
+        "latency_inflation_factor",
+        "_baseline_p95",
+        "_successes",
+        "_latencies",
+        "_window_ops",
+    )
+
+    def __init__(
+        self,
+        initial_limit: int = 1,
+        min_limit: int = 1,
+        max_limit: int = 4,
+        window_ops: int = 20,
+        success_target: float = 0.9,
+        latency_inflation_factor: float = 1.5,
+    ):
+        """
+        Args:
+            initial_limit: Starting limit, clamped to [min_limit, max_limit]
+            min_limit: Lowest limit ever recommended (default 1)
+            max_limit: Highest limit ever recommended (default 4)
+            window_ops: Outcomes per decision window (default 20, minimum 2)
+            success_target: Lowest healthy success rate (default 0.9)
+            latency_inflation_factor: Allowed p95 growth over the best
+                window seen before it counts as stress (default 1.5)
+
+        Raises:
+            ValueError: If the bounds are inverted or window_ops < 2
+        """
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError(f"need 1 <= min_limit <= max_limit, got {min_limit}..{max_limit}")
+        if window_ops < 2:
+            raise ValueError(f"window_ops must be at least 2, got {window_ops}")
+
+        self.current_limit = max(min_limit, min(max_limit, initial_limit))
+        self.in_slow_start = True
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.success_target = success_target
+        self.latency_inflation_factor = latency_inflation_factor
+        self._baseline_p95: Optional[float] = None
+        self._successes = 0
+        self._latencies: list[float] = []
+        self._window_ops = window_ops
+
+    def record_outcome(self, success: bool, latency_seconds: float) -> int:
+        """
+        Record one execution and adjust the limit when a window completes.
+
+        Args:
+            success: Whether the execution succeeded
+            latency_seconds: How long the execution took
+
+        Returns:
+            The (possibly updated) current_limit
+        """
+        self._successes += bool(success)
+        self._latencies.append(latency_seconds)
+        if len(self._latencies) < self._window_ops:
+            return self.current_limit
+
+        success_rate = self._successes / len(self._latencies)
+        # Last of 19 cut points at n=20 is the 95th percentile
+        p95 = statistics.quantiles(self._latencies, n=20)[-1]
+        self._successes = 0
+        self._latencies = []
+
+        if self._baseline_p95 is None or p95 < self._baseline_p95:
+            self._baseline_p95 = p95
+        stressed = (
+            success_rate < self.success_target
+            or p95 > self._baseline_p95 * self.latency_inflation_factor
+        )
+
+        if stressed:
+            # Multiplicative decrease
+            self.in_slow_start = False
+            self.current_limit = max(self.min_limit, self.current_limit // 2)
+        elif self.in_slow_start:
+            self.current_limit = min(self.max_limit, self.current_limit * 2)
+        else:
+            # Additive increase
+            self.current_limit = min(self.max_limit, self.current_limit + 1)
+
+        return self.current_limit
+
+
+@functools.lru_cache(maxsize=4)
+def _iso_timestamp_for_second(epoch_seconds: int) -> str:
+    """
+    Format a Unix second as a local ISO timestamp, memoized.
+
+    Records created in bursts share one formatted string per second
+    instead of calling datetime.now().isoformat() for each.
+
+    Args:
+        epoch_seconds: Whole seconds since the epoch
 
-    # Enforce bounds: min 1, max 4
-    return max(1, min(4, new_parallel))
+    Returns:
+        Local time as "YYYY-MM-DDTHH:MM:SS"
+    """
+    return datetime.fromtimestamp(epoch_seconds).isoformat(timespec="seconds")
 
 
 def create_execution_record(
@@ -99,7 +330,8 @@ def create_execution_record(
         parallel_count: Number of parallel agents that were executed
         conflicts: Number of merge conflicts that occurred
         success: Whether the parallel execution succeeded overall
-        timestamp: Optional ISO format timestamp; if None, uses current time
+        timestamp: Optional ISO format timestamp; if None, uses the current
+            local time to the second
 
     Returns:
         Dict with keys: timestamp, parallel_count, conflicts, success
@@ -112,7 +344,7 @@ def create_execution_record(
         True
     """
     if timestamp is None:
-        timestamp = datetime.now().isoformat()
+        timestamp = _iso_timestamp_for_second(int(time.time()))
 
     return {
         "timestamp": timestamp,
@@ -143,11 +375,70 @@ def calculate_success_rate(executions: list[dict], window: int = 10) -> float:
     if not executions:
         return 0.0
 
-    # Take only the last `window` executions
-    recent = executions[-window:]
+    if 0 < window < len(executions):
+        # Walk the last `window` records in place instead of slicing a copy
+        recent = islice(reversed(executions), window)
+        return sum(1 for e in recent if e.get("success", False)) / window
+
+    # Window covers everything (or is <= 0, which keeps the slice semantics)
+    recent = executions if window > 0 else executions[-window:]
 
     if not recent:
         return 0.0
 
     successes = sum(1 for e in recent if e.get("success", False))
     return successes / len(recent)
+
+
+class SuccessRateTracker:
+    """
+    Running success rate over the last `window` executions.
+
+    The incremental counterpart of calculate_success_rate(): each record()
+    is O(1) and reading rate is a single division, instead of re-scanning
+    the window after every append. Memory is bounded by the window.
+
+    Examples:
+        >>> tracker = SuccessRateTracker(window=2)
+        >>> tracker.record(False); tracker.record(True); tracker.record(True)
+        >>> tracker.rate
+        1.0
+    """
+
+    __slots__ = ("_outcomes", "_successes")
+
+    def __init__(self, window: int = 10):
+        """
+        Args:
+            window: Number of recent executions to consider (default 10)
+
+        Raises:
+            ValueError: If window is less than 1
+        """
+        if window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._successes = 0
+
+    def record(self, success: bool) -> None:
+        """
+        Add one execution outcome, evicting the oldest once the window is full.
+
+        Args:
+            success: Whether the execution succeeded
+        """
+        outcomes = self._outcomes
+        success = bool(success)
+        if len(outcomes) == outcomes.maxlen:
+            self._successes -= outcomes[0]
+        outcomes.append(success)
+        self._successes += success
+
+    @property
+    def rate(self) -> float:
+        """Success rate 0.0-1.0 over the window; 0.0 before any record."""
+        count = len(self._outcomes)
+        return self._successes / count if count else 0.0
+
+    def __len__(self) -> int:
+        return len(self._outcomes)
@@ -7,9 +7,10 @@ These compose atoms from utils.py to provide git snapshot functionality.
 """
 
 import logging
+import os
 import subprocess
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from src.director.utils import resolve_absolute_path, format_command_for_logging
 
@@ -23,38 +24,101 @@ class GitSnapshotError(Exception):
     pass
 
 
-def _parse_porcelain_output(porcelain_output: str) -> List[str]:
+# Number of space-separated fields before the path in porcelain v2 entries:
+#   1 <XY> <sub> <mH> <mI> <mW> <hH> <hI> <path>
+#   2 <XY> <sub> <mH> <mI> <mW> <hH> <hI> <Xscore> <path>  (then NUL <orig>)
+#   u <XY> <sub> <m1> <m2> <m3> <mW> <h1> <h2> <h3> <path>
+_V2_FIELDS_BEFORE_PATH = {b"1": 8, b"2": 9, b"u": 10}
+
+# git's C-style path quoting (quote_c_style with core.quotePath=true), as
+# used by `git status --porcelain` v1: text for each byte of a quoted path
+_C_ESCAPES = {
+    0x07: "\\a", 0x08: "\\b", 0x09: "\\t", 0x0A: "\\n", 0x0B: "\\v",
+    0x0C: "\\f", 0x0D: "\\r", 0x22: '\\"', 0x5C: "\\\\",
+}
+_QUOTED_PATH_BYTES = tuple(
+    _C_ESCAPES.get(b) or (f"\\{b:03o}" if b < 0x20 or b >= 0x7F else chr(b))
+    for b in range(256)
+)
+# Bytes that make v1 quote a path: those escaped above, plus a space
+_PATH_QUOTE_TRIGGERS = frozenset(
+    b for b in range(256) if _QUOTED_PATH_BYTES[b] != chr(b)
+) | {0x20}
+
+
+def _parse_porcelain_v2_output(
+    output: bytes,
+) -> Tuple[Optional[str], List[Tuple[str, str, Optional[str]]]]:
     """
-    Parse git status --porcelain output into a list of modified files.
+    Parse `git status --porcelain=v2 --branch -z` output.
 
-    This is an internal helper that extracts file paths from porcelain format.
-    Porcelain format: XY filename (where XY is two status characters).
+    This is an internal helper. Records are NUL-terminated; paths are taken
+    verbatim (no quoting, no " -> " rename arrows) and decoded individually.
 
     Args:
-        porcelain_output: Raw output from git status --porcelain
+        output: Raw stdout bytes from git status --porcelain=v2 --branch -z
 
     Returns:
-        List of file paths that have modifications
+        Tuple of (HEAD commit SHA or None if the branch has no commits yet,
+        list of (v1-style XY status, path, original path for renames/copies
+        or None))
     """
-    if not porcelain_output.strip():
-        return []
-
-    modified_files = []
-    # Split on newlines but preserve leading characters (status codes)
-    # DO NOT strip the whole output as that removes leading space status chars
-    for line in porcelain_output.rstrip("\n").split("\n"):
-        if line:
-            # Porcelain format: XY filename
-            # First 2 chars are status codes, then a space, then filename
-            # e.g., " M src/file.py" or "?? new_file.py"
-            if len(line) > 3:
-                filename = line[3:].strip()
-                # Handle renamed files: "R  old -> new"
-                if " -> " in filename:
-                    filename = filename.split(" -> ")[-1]
-                modified_files.append(filename)
-
-    return modified_files
+    head_commit = None
+    entries = []
+
+    records = output.split(b"\0")
+    i = 0
+    while i < len(records):
+        record = records[i]
+        i += 1
+        if not record:
+            continue
+
+        kind = record[:1]
+        if kind == b"#":
+            if record.startswith(b"# branch.oid "):
+                oid = record[len(b"# branch.oid "):]
+                if oid != b"(initial)":
+                    head_commit = oid.decode("ascii")
+        elif kind == b"?":
+            entries.append(("??", os.fsdecode(record[2:]), None))
+        elif kind == b"!":
+            entries.append(("!!", os.fsdecode(record[2:]), None))
+        elif kind in _V2_FIELDS_BEFORE_PATH:
+            fields = record.split(b" ", _V2_FIELDS_BEFORE_PATH[kind])
+            # v2 writes "." for "unmodified"; v1 writes a space
+            xy = fields[1].decode("ascii").replace(".", " ")
+            path = os.fsdecode(fields[-1])
+            orig_path = None
+            if kind == b"2" and i < len(records):
+                # Renames/copies carry the original path as the next record
+                orig_path = os.fsdecode(records[i])
+                i += 1
+            entries.append((xy, path, orig_path))
+
+    return head_commit, entries
+
+
+def _quote_path_v1(path: str) -> str:
+    """
+    Quote a path the way `git status --porcelain` (v1) prints it.
+
+    This is an internal helper. Paths containing a space, double quote,
+    backslash, control character or non-ASCII byte are wrapped in double
+    quotes with C-style escapes (non-ASCII as octal bytes); others are
+    returned unchanged. Without this, a name containing a newline or
+    " -> " would break the line/rename layout of git_status.
+
+    Args:
+        path: Path as decoded by os.fsdecode()
+
+    Returns:
+        Path text as it appears in porcelain v1 output
+    """
+    raw = os.fsencode(path)
+    if _PATH_QUOTE_TRIGGERS.isdisjoint(raw):
+        return path
+    return '"' + "".join(_QUOTED_PATH_BYTES[b] for b in raw) + '"'
 
 
 def snapshot_file_tree(project_dir: Path) -> Dict[str, any]:
@@ -64,7 +128,7 @@ def snapshot_file_tree(project_dir: Path) -> Dict[str, any]:
     This molecule composes atoms to provide a complete git state snapshot:
     - Uses resolve_absolute_path() for path normalization
     - Uses format_command_for_logging() for debug output
-    - Executes git commands to capture state
+    - Runs a single `git status --porcelain=v2 --branch -z` for HEAD and files
 
     The snapshot is used before spawning parallel agents to enable
     rollback if merge conflicts occur.
@@ -74,7 +138,8 @@ def snapshot_file_tree(project_dir: Path) -> Dict[str, any]:
 
     Returns:
         Dict containing:
-        - git_status: Raw output from git status --porcelain
+        - git_status: Status text identical to `git status --porcelain`
+          (v1, with git's default path quoting)
         - head_commit: Current HEAD SHA (40 character hash)
         - modified_files: List of file paths with modifications
 
@@ -91,53 +156,43 @@ def snapshot_file_tree(project_dir: Path) -> Dict[str, any]:
     if not project_dir_resolved.is_dir():
         raise GitSnapshotError(f"Project path is not a directory: {project_dir_resolved}")
 
-    # Build git status command
-    status_cmd = ["git", "-C", str(project_dir_resolved), "status", "--porcelain"]
-    logger.debug(f"Executing: {format_command_for_logging(status_cmd)}")
+    # One git process for both the branch OID and the file status
+    status_cmd = [
+        "git", "-C", str(project_dir_resolved),
+        "status", "--porcelain=v2", "--branch", "-z",
+    ]
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Executing: %s", format_command_for_logging(status_cmd))
 
     try:
+        # Bytes mode: paths are decoded individually by the parser
         status_result = subprocess.run(
             status_cmd,
             capture_output=True,
-            text=True,
             check=False,  # Don't raise on non-zero, we'll check ourselves
         )
     except FileNotFoundError:
         raise GitSnapshotError("git command not found - is git installed?")
 
     if status_result.returncode != 0:
-        raise GitSnapshotError(
-            f"git status failed: {status_result.stderr.strip()}"
-        )
-
-    git_status = status_result.stdout
+        stderr = status_result.stderr.decode("utf-8", errors="replace")
+        raise GitSnapshotError(f"git status failed: {stderr.strip()}")
 
-    # Build git rev-parse HEAD command
-    head_cmd = ["git", "-C", str(project_dir_resolved), "rev-parse", "HEAD"]
-    logger.debug(f"Executing: {format_command_for_logging(head_cmd)}")
-
-    try:
-        head_result = subprocess.run(
-            head_cmd,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-    except FileNotFoundError:
-        raise GitSnapshotError("git command not found - is git installed?")
-
-    if head_result.returncode != 0:
-        raise GitSnapshotError(
-            f"git rev-parse HEAD failed: {head_result.stderr.strip()}"
-        )
+    head_commit, entries = _parse_porcelain_v2_output(status_result.stdout)
 
-    head_commit = head_result.stdout.strip()
+    if head_commit is None:
+        raise GitSnapshotError("git status reported no HEAD commit (repository has no commits)")
 
-    # Parse modified files from porcelain output
-    modified_files = _parse_porcelain_output(git_status)
+    # Same text as `git status --porcelain` (v1), including its path quoting
+    git_status = "".join(
+        f"{xy} {_quote_path_v1(path)}\n"
+        if orig_path is None
+        else f"{xy} {_quote_path_v1(orig_path)} -> {_quote_path_v1(path)}\n"
+        for xy, path, orig_path in entries
+    )
 
     return {
         "git_status": git_status,
         "head_commit": head_commit,
-        "modified_files": modified_files,
+        "modified_files": [path for _, path, _ in entries],
     }
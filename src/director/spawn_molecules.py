@@ -7,12 +7,27 @@ and building delegation context for sub-agents. These compose atoms
 for YAML parsing, path resolution, and context formatting.
 """
 
+import functools
 import json
+import logging
+import os
 import re
 import subprocess
 from pathlib import Path
 from typing import NamedTuple, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+# orjson parses bd output straight from bytes; its JSONDecodeError
+# subclasses json.JSONDecodeError, so one except clause covers both.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 # =============================================================================
 # Internal Atoms - Pure functions used by this module
@@ -32,10 +47,23 @@ _FRONTMATTER_PATTERN = re.compile(
     re.DOTALL
 )
 
-# Simple YAML line pattern: key: value (handles basic YAML only)
-_YAML_LINE_PATTERN = re.compile(
-    r'^([a-zA-Z_][a-zA-Z0-9_-]*)\s*:\s*(.*)$'
-)
+
+
+def _is_yaml_key(key: str) -> bool:
+    """
+    Check for a simple YAML key: [a-zA-Z_][a-zA-Z0-9_-]*.
+
+    Args:
+        key: Candidate key text (already stripped)
+
+    Returns:
+        True if key is a non-empty ASCII identifier that may contain dashes
+    """
+    return (
+        key.isascii()
+        and key[:1] != '-'
+        and key.replace('-', '_').isidentifier()
+    )
 
 
 def _extract_yaml_frontmatter(content: str) -> YAMLFrontmatter:
@@ -54,12 +82,22 @@ def _extract_yaml_frontmatter(content: str) -> YAMLFrontmatter:
     if not content or not content.strip():
         return YAMLFrontmatter(data={}, content=content or "", has_frontmatter=False)
 
-    match = _FRONTMATTER_PATTERN.match(content)
-    if not match:
-        return YAMLFrontmatter(data={}, content=content, has_frontmatter=False)
-
-    yaml_block = match.group(1)
-    remaining_content = content[match.end():]
+    if content.startswith('---\n') and content[4:5] and not content[4].isspace():
+        # Common case: "---\n" directly followed by the first key. Here the
+        # pattern's opening \s* can only match "", so plain find() gives the
+        # same block boundaries without running the regex engine.
+        end = content.find('\n---', 4)
+        if end < 0:
+            return YAMLFrontmatter(data={}, content=content, has_frontmatter=False)
+        yaml_block = content[4:end]
+        remaining_content = content[end + 4:].lstrip()
+    else:
+        match = _FRONTMATTER_PATTERN.match(content)
+        if not match:
+            return YAMLFrontmatter(data={}, content=content, has_frontmatter=False)
+
+        yaml_block = match.group(1)
+        remaining_content = content[match.end():]
 
     # Parse simple YAML key: value pairs
     data = {}
@@ -68,10 +106,10 @@ def _extract_yaml_frontmatter(content: str) -> YAMLFrontmatter:
         if not line or line.startswith('#'):
             continue
 
-        line_match = _YAML_LINE_PATTERN.match(line)
-        if line_match:
-            key = line_match.group(1)
-            value = line_match.group(2).strip()
+        key, sep, value = line.partition(':')
+        key = key.rstrip()
+        if sep and _is_yaml_key(key):
+            value = value.strip()
             # Remove surrounding quotes if present
             if (value.startswith('"') and value.endswith('"')) or \
                (value.startswith("'") and value.endswith("'")):
@@ -126,6 +164,50 @@ def _extract_agent_prompt(content: str) -> str:
     return result.content.strip()
 
 
+@functools.lru_cache(maxsize=128)
+def _load_agent_cached(path: str, mtime_ns: int, size: int) -> tuple[dict, str]:
+    """
+    Read and parse an agent file, memoized per file revision.
+
+    Spawning many agents of the same type re-reads the same markdown file;
+    keying on (path, mtime, size) serves repeats from memory while an
+    edited file misses the cache and is parsed again.
+
+    Args:
+        path: Agent file path
+        mtime_ns: File st_mtime_ns (cache key only)
+        size: File st_size (cache key only)
+
+    Returns:
+        Tuple of (frontmatter_dict, prompt_text). The dict is shared
+        between calls and must not be mutated.
+    """
+    with open(path) as f:
+        content = f.read()
+    return _parse_agent_content(content)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_agent_content(content: str) -> tuple[dict, str]:
+    """
+    Parse agent file content, memoized by the content itself.
+
+    Agents generated from one template share identical text, and a file
+    that is touched or re-checked-out gets a new mtime without new content;
+    both reuse the earlier parse instead of running the YAML parser again.
+
+    Args:
+        content: Full agent file content
+
+    Returns:
+        Tuple of (frontmatter_dict, prompt_text). The dict is shared
+        between calls and must not be mutated.
+    """
+    frontmatter_result = _extract_yaml_frontmatter(content)
+    # Same as _extract_agent_prompt(), without parsing the frontmatter twice
+    return frontmatter_result.data, frontmatter_result.content.strip()
+
+
 # =============================================================================
 # Molecules - Composed helpers
 # =============================================================================
@@ -177,24 +259,91 @@ def load_agent_file(
     local_fallback = _resolve_agent_path(DEFAULT_AGENT, project_dir)
     master_fallback = master_dir / "profiles" / "default" / "agents" / f"{DEFAULT_AGENT}.md"
 
-    # Try each location in order
-    search_paths = [local_path, master_path, local_fallback, master_fallback]
+    # Try each location in order. When the requested agent is the default
+    # one, the fallbacks repeat the first two paths; skip re-statting them.
+    search_paths = [local_path, master_path]
+    if agent_name != DEFAULT_AGENT:
+        search_paths += [local_fallback, master_fallback]
 
     for path in search_paths:
-        if path and path.exists():
-            content = path.read_text()
-            frontmatter_result = _extract_yaml_frontmatter(content)
-            prompt = _extract_agent_prompt(content)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
 
-            return (path, frontmatter_result.data, prompt)
+        frontmatter, prompt = _load_agent_cached(os.fspath(path), st.st_mtime_ns, st.st_size)
+        # The cached dict is shared; callers get their own copy
+        return (path, dict(frontmatter), prompt)
 
     # Nothing found
     raise FileNotFoundError(
         f"Agent '{agent_name}' not found and fallback '{DEFAULT_AGENT}' unavailable. "
-        f"Searched: {[str(p) for p in search_paths if p]}"
+        f"Searched: {[str(p) for p in search_paths]}"
     )
 
 
+def _normalize_issue(data: dict, issue_id: str) -> dict:
+    """
+    Normalize a bd issue JSON object to the fields sub-agents use.
+
+    Args:
+        data: Parsed issue object from bd --json output
+        issue_id: ID to use when the object has none
+
+    Returns:
+        Dict with id, title, description, tags, priority, assignee, status
+    """
+    return {
+        "id": data.get("id", issue_id),
+        "title": data.get("title", ""),
+        "description": data.get("description", ""),
+        "tags": data.get("tags", []),
+        "priority": data.get("priority", 2),
+        "assignee": data.get("assignee", ""),
+        "status": data.get("status", "open"),
+    }
+
+
+def _run_bd_json(
+    args: list[str],
+    project_dir: Path,
+    timeout_seconds: int
+) -> Optional[object]:
+    """
+    Run a bd subcommand with --json and parse its stdout.
+
+    Args:
+        args: bd arguments after "bd", without --json
+        project_dir: Project directory with .beads folder
+        timeout_seconds: Command timeout
+
+    Returns:
+        Parsed JSON value, or None if bd failed or printed invalid JSON
+    """
+    # Only stdout is parsed; stderr is piped just for the debug log
+    debug = logger.isEnabledFor(logging.DEBUG)
+    try:
+        result = subprocess.run(
+            ["bd", *args, "--json"],
+            cwd=project_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE if debug else subprocess.DEVNULL,
+            timeout=timeout_seconds
+        )
+        if result.returncode != 0:
+            if debug:
+                logger.debug(
+                    "bd %s failed (exit %s): %s",
+                    " ".join(args), result.returncode,
+                    (result.stderr or b"").decode("utf-8", errors="replace").strip(),
+                )
+            return None
+        # Bytes mode: the JSON is parsed without decoding to str first
+        return _json_loads(result.stdout)
+    except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
+        return None
+
+
 def load_issue_from_beads(
     issue_id: str,
     project_dir: Path,
@@ -213,37 +362,78 @@ def load_issue_from_beads(
     Returns:
         Dict with issue data or None on failure
     """
-    try:
-        result = subprocess.run(
-            ["bd", "show", issue_id, "--json"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            timeout=timeout_seconds
-        )
+    data = _run_bd_json(["show", issue_id], project_dir, timeout_seconds)
+    if data is None:
+        return None
 
-        if result.returncode != 0:
-            return None
+    return _normalize_issue(data, issue_id)
 
-        data = json.loads(result.stdout)
 
-        # Normalize field names
-        return {
-            "id": data.get("id", issue_id),
-            "title": data.get("title", ""),
-            "description": data.get("description", ""),
-            "tags": data.get("tags", []),
-            "priority": data.get("priority", 2),
-            "assignee": data.get("assignee", ""),
-            "status": data.get("status", "open"),
-        }
+def load_issues_from_beads(
+    issue_ids: list[str],
+    project_dir: Path,
+    timeout_seconds: int = 30
+) -> dict[str, dict]:
+    """
+    Load several issues from Beads with one bd CLI call.
 
-    except subprocess.TimeoutExpired:
-        return None
-    except json.JSONDecodeError:
-        return None
-    except FileNotFoundError:
-        return None
+    Executes `bd show id1 id2 ... --json` once instead of one
+    load_issue_from_beads() subprocess per issue. If that fails (e.g. an
+    older bd that shows one issue at a time), falls back to a single
+    `bd list --json` filtered to the requested IDs.
+
+    Args:
+        issue_ids: Beads issue IDs to load
+        project_dir: Project directory with .beads folder
+        timeout_seconds: Timeout for each bd command
+
+    Returns:
+        Dict mapping issue ID to normalized issue dict (same shape as
+        load_issue_from_beads()). IDs that could not be loaded are absent.
+    """
+    if not issue_ids:
+        return {}
+
+    wanted = set(issue_ids)
+    data = _run_bd_json(["show", *issue_ids], project_dir, timeout_seconds)
+    if data is None:
+        data = _run_bd_json(["list"], project_dir, timeout_seconds)
+        if data is None:
+            return {}
+
+    # A single issue may come back as a bare object rather than an array
+    records = [data] if isinstance(data, dict) else data
+    if not isinstance(records, list):
+        return {}
+
+    issues = {}
+    for record in records:
+        if isinstance(record, dict) and record.get("id") in wanted:
+            issues[record["id"]] = _normalize_issue(record, record["id"])
+    return issues
+
+
+# Delegation context layout, filled by build_delegation_context().
+# Only this template is parsed for {fields}; braces inside the
+# substituted prompt/instructions text are copied through verbatim.
+_CONTEXT_TEMPLATE = """## Issue Details
+- ID: {id}
+- Title: {title}
+- Description: {description}
+- Tags: {tags}
+- Priority: {priority}
+
+{agent_prompt}
+
+## Your Task
+{task_instructions}
+
+**Required Steps:**
+1. Claim this issue: `bd update {id} --status in_progress`
+2. Implement the solution
+3. Write tests for your implementation
+4. Close the issue: `bd close {id}`
+"""
 
 
 def build_delegation_context(
@@ -269,26 +459,48 @@ def build_delegation_context(
     tags = issue.get("tags", [])
     tags_str = ", ".join(tags) if isinstance(tags, list) else str(tags)
 
-    context = f"""## Issue Details
-- ID: {issue.get('id', 'unknown')}
-- Title: {issue.get('title', 'Untitled')}
-- Description: {issue.get('description', 'No description')}
-- Tags: {tags_str}
-- Priority: {issue.get('priority', 'P2')}
+    # bd stores priority as an int (0-4); show it as "P<n>" like the
+    # Beads UI. Pre-formatted strings such as "P1" are kept as-is.
+    priority = issue.get("priority", 2)
+    priority_str = f"P{priority}" if isinstance(priority, int) else str(priority)
+
+    return _CONTEXT_TEMPLATE.format(
+        id=issue.get("id", "unknown"),
+        title=issue.get("title", "Untitled"),
+        description=issue.get("description", "No description"),
+        tags=tags_str,
+        priority=priority_str,
+        agent_prompt=agent_prompt,
+        task_instructions=task_instructions,
+    )
 
-{agent_prompt}
 
-## Your Task
-{task_instructions}
+# Statuses that count as closed for verify_issue_closed()
+_CLOSED_STATUSES: frozenset[str] = frozenset({"done", "closed", "complete", "completed"})
 
-**Required Steps:**
-1. Claim this issue: `bd update {issue.get('id', 'unknown')} --status in_progress`
-2. Implement the solution
-3. Write tests for your implementation
-4. Close the issue: `bd close {issue.get('id', 'unknown')}`
-"""
 
-    return context
+def _query_issue_status(
+    issue_id: str,
+    project_dir: Path,
+    timeout_seconds: int = 10
+) -> str:
+    """
+    Query only the status of a Beads issue.
+
+    Runs `bd show {issue_id} --json` like load_issue_from_beads(), but reads
+    the single status field instead of building the normalized issue dict.
+
+    Args:
+        issue_id: The beads issue ID
+        project_dir: Project directory with .beads folder
+        timeout_seconds: Command timeout
+
+    Returns:
+        Lowercased status string, or "" if the issue could not be read
+    """
+    data = _run_bd_json(["show", issue_id], project_dir, timeout_seconds)
+    status = data.get("status", "") if isinstance(data, dict) else ""
+    return status.lower() if isinstance(status, str) else ""
 
 
 def verify_issue_closed(
@@ -307,10 +519,4 @@ def verify_issue_closed(
     Returns:
         True if issue is closed/done, False otherwise
     """
-    issue = load_issue_from_beads(issue_id, project_dir, timeout_seconds)
-
-    if issue is None:
-        return False
-
-    status = issue.get("status", "").lower()
-    return status in ("done", "closed", "complete", "completed")
+    return _query_issue_status(issue_id, project_dir, timeout_seconds) in _CLOSED_STATUSES
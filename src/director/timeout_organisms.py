@@ -15,6 +15,8 @@ This organism provides:
 
 import asyncio
 import logging
+import math
+import time
 from typing import TypeVar, Callable, Awaitable, Optional, Any
 
 from .timeout_atoms import (
@@ -39,6 +41,8 @@ class TimeoutError(Exception):
         partial_result: Any partial result available before timeout
     """
 
+    __slots__ = ("operation_name", "timeout_seconds", "partial_result")
+
     def __init__(
         self,
         operation_name: str,
@@ -68,6 +72,9 @@ class TimeoutResult:
         elapsed_seconds: How long the operation ran
     """
 
+    # One instance per awaited operation; slots keep them small
+    __slots__ = ("success", "result", "timed_out", "error", "elapsed_seconds")
+
     def __init__(
         self,
         success: bool,
@@ -109,7 +116,7 @@ async def run_with_timeout(
 
     Args:
         coro: The awaitable to execute (coroutine or task)
-        timeout_seconds: Maximum time to wait for completion
+        timeout_seconds: Maximum time to wait for completion (math.inf for no limit)
         operation_name: Descriptive name for logging and errors
         cleanup_callback: Optional async function to call on timeout
         raise_on_timeout: If True, raises TimeoutError; if False, returns TimeoutResult
@@ -120,6 +127,7 @@ async def run_with_timeout(
 
     Raises:
         TimeoutError: If operation times out and raise_on_timeout=True
+            (immediately, without running coro, if timeout_seconds <= 0)
         Exception: Any exception from the coroutine is re-raised
 
     Example:
@@ -148,93 +156,208 @@ async def run_with_timeout(
         if result.timed_out:
             handle_timeout(result)
     """
-    import time
+    if timeout_seconds <= 0:
+        return await _expire_without_running(
+            coro, timeout_seconds, operation_name, cleanup_callback, raise_on_timeout
+        )
+    if raise_on_timeout:
+        return await _run_with_timeout_raising(
+            coro, timeout_seconds, operation_name, cleanup_callback
+        )
+    return await _run_with_timeout_result(
+        coro, timeout_seconds, operation_name, cleanup_callback
+    )
+
+
+async def _expire_without_running(
+    coro: Awaitable[T],
+    timeout_seconds: float,
+    operation_name: str,
+    cleanup_callback: Optional[Callable[[], Awaitable[None]]],
+    raise_on_timeout: bool,
+) -> TimeoutResult:
+    """
+    Report a timeout for a limit that has already passed (<= 0 seconds).
+
+    The awaitable is closed (coroutine) or cancelled (task/future) instead
+    of being started, so no event-loop timer is set up for it.
+
+    Raises:
+        TimeoutError: If raise_on_timeout=True
+    """
+    logger.warning(
+        "Operation '%s' not started: timeout %ss is not positive",
+        operation_name, timeout_seconds,
+    )
+    if asyncio.iscoroutine(coro):
+        coro.close()
+    elif isinstance(coro, asyncio.Future):
+        coro.cancel()
+
+    await _run_cleanup(cleanup_callback, operation_name)
+
+    error = TimeoutError(operation_name, timeout_seconds)
+    if raise_on_timeout:
+        raise error
+    return TimeoutResult(success=False, timed_out=True, error=error)
+
+
+async def _run_cleanup(
+    cleanup_callback: Optional[Callable[[], Awaitable[None]]],
+    operation_name: str,
+) -> None:
+    """
+    Run a timeout cleanup callback within the grace period.
+
+    Failures and overruns of the callback are logged, never raised, so
+    the caller still reports the original timeout.
+
+    Args:
+        cleanup_callback: Async function to call, or None for no cleanup
+        operation_name: Descriptive name for logging
+    """
+    if cleanup_callback is None:
+        return
+
+    logger.debug("Running cleanup callback for '%s'", operation_name)
+    try:
+        # Give cleanup a grace period to complete
+        async with asyncio.timeout(CLEANUP_GRACE_PERIOD_SECONDS):
+            await cleanup_callback()
+        logger.debug("Cleanup completed for '%s'", operation_name)
+    except asyncio.TimeoutError:
+        logger.warning(
+            "Cleanup callback for '%s' also timed out", operation_name
+        )
+    except Exception as cleanup_error:
+        logger.error(
+            "Cleanup callback for '%s' failed: %s", operation_name, cleanup_error
+        )
+
+
+async def _run_with_timeout_raising(
+    coro: Awaitable[T],
+    timeout_seconds: float,
+    operation_name: str,
+    cleanup_callback: Optional[Callable[[], Awaitable[None]]],
+) -> T:
+    """
+    run_with_timeout() for raise_on_timeout=True.
+
+    Returns the bare coroutine result, raises TimeoutError on timeout and
+    re-raises any other exception from the coroutine.
+    """
     start_time = time.monotonic()
 
     logger.debug(
-        f"Starting operation '{operation_name}' with {timeout_seconds}s timeout"
+        "Starting operation '%s' with %ss timeout", operation_name, timeout_seconds
     )
 
     try:
-        # Use asyncio.timeout context manager (Python 3.11+)
-        async with asyncio.timeout(timeout_seconds):
+        # Use asyncio.timeout context manager (Python 3.11+). An infinite
+        # limit becomes None so no timer handle is scheduled on the loop.
+        async with asyncio.timeout(None if math.isinf(timeout_seconds) else timeout_seconds):
             result = await coro
 
-        elapsed = time.monotonic() - start_time
         logger.debug(
-            f"Operation '{operation_name}' completed successfully in {elapsed:.2f}s"
+            "Operation '%s' completed successfully in %.2fs",
+            operation_name, time.monotonic() - start_time,
         )
+        return result
 
-        if raise_on_timeout:
-            return result
-        else:
-            return TimeoutResult(
-                success=True,
-                result=result,
-                elapsed_seconds=elapsed,
-            )
+    except asyncio.TimeoutError:
+        logger.warning(
+            "Operation '%s' timed out after %.2fs (limit: %ss)",
+            operation_name, time.monotonic() - start_time, timeout_seconds,
+        )
+        await _run_cleanup(cleanup_callback, operation_name)
+        raise TimeoutError(
+            operation_name=operation_name,
+            timeout_seconds=timeout_seconds,
+        )
+
+    except asyncio.CancelledError:
+        # Task was cancelled externally - re-raise to preserve semantics
+        logger.info(
+            "Operation '%s' was cancelled after %.2fs",
+            operation_name, time.monotonic() - start_time,
+        )
+        raise
+
+    except Exception as e:
+        logger.error(
+            "Operation '%s' failed after %.2fs: %s",
+            operation_name, time.monotonic() - start_time, e,
+        )
+        raise
+
+
+async def _run_with_timeout_result(
+    coro: Awaitable[T],
+    timeout_seconds: float,
+    operation_name: str,
+    cleanup_callback: Optional[Callable[[], Awaitable[None]]],
+) -> TimeoutResult:
+    """
+    run_with_timeout() for raise_on_timeout=False.
+
+    Reports success, timeout and coroutine errors as a TimeoutResult.
+    External cancellation is still re-raised.
+    """
+    start_time = time.monotonic()
+
+    logger.debug(
+        "Starting operation '%s' with %ss timeout", operation_name, timeout_seconds
+    )
+
+    try:
+        # See _run_with_timeout_raising() for the math.inf handling
+        async with asyncio.timeout(None if math.isinf(timeout_seconds) else timeout_seconds):
+            result = await coro
+
+        elapsed = time.monotonic() - start_time
+        logger.debug(
+            "Operation '%s' completed successfully in %.2fs", operation_name, elapsed
+        )
+        return TimeoutResult(
+            success=True,
+            result=result,
+            elapsed_seconds=elapsed,
+        )
 
     except asyncio.TimeoutError:
         elapsed = time.monotonic() - start_time
         logger.warning(
-            f"Operation '{operation_name}' timed out after {elapsed:.2f}s "
-            f"(limit: {timeout_seconds}s)"
+            "Operation '%s' timed out after %.2fs (limit: %ss)",
+            operation_name, elapsed, timeout_seconds,
+        )
+        await _run_cleanup(cleanup_callback, operation_name)
+        return TimeoutResult(
+            success=False,
+            timed_out=True,
+            error=TimeoutError(operation_name, timeout_seconds),
+            elapsed_seconds=elapsed,
         )
-
-        # Run cleanup callback if provided
-        if cleanup_callback is not None:
-            logger.debug(f"Running cleanup callback for '{operation_name}'")
-            try:
-                # Give cleanup a grace period to complete
-                async with asyncio.timeout(CLEANUP_GRACE_PERIOD_SECONDS):
-                    await cleanup_callback()
-                logger.debug(f"Cleanup completed for '{operation_name}'")
-            except asyncio.TimeoutError:
-                logger.warning(
-                    f"Cleanup callback for '{operation_name}' also timed out"
-                )
-            except Exception as cleanup_error:
-                logger.error(
-                    f"Cleanup callback for '{operation_name}' failed: {cleanup_error}"
-                )
-
-        if raise_on_timeout:
-            raise TimeoutError(
-                operation_name=operation_name,
-                timeout_seconds=timeout_seconds,
-            )
-        else:
-            return TimeoutResult(
-                success=False,
-                timed_out=True,
-                error=TimeoutError(operation_name, timeout_seconds),
-                elapsed_seconds=elapsed,
-            )
 
     except asyncio.CancelledError:
         # Task was cancelled externally - re-raise to preserve semantics
-        elapsed = time.monotonic() - start_time
         logger.info(
-            f"Operation '{operation_name}' was cancelled after {elapsed:.2f}s"
+            "Operation '%s' was cancelled after %.2fs",
+            operation_name, time.monotonic() - start_time,
         )
         raise
 
     except Exception as e:
-        # Other exceptions - log and re-raise or return in result
         elapsed = time.monotonic() - start_time
         logger.error(
-            f"Operation '{operation_name}' failed after {elapsed:.2f}s: {e}"
+            "Operation '%s' failed after %.2fs: %s", operation_name, elapsed, e
+        )
+        return TimeoutResult(
+            success=False,
+            timed_out=False,
+            error=e,
+            elapsed_seconds=elapsed,
         )
-
-        if raise_on_timeout:
-            raise
-        else:
-            return TimeoutResult(
-                success=False,
-                timed_out=False,
-                error=e,
-                elapsed_seconds=elapsed,
-            )
 
 
 async def run_with_timeout_and_cancel(
@@ -271,11 +394,10 @@ async def run_with_timeout_and_cancel(
         elif result.success:
             process_result(result.result)
     """
-    import time
     start_time = time.monotonic()
 
     logger.debug(
-        f"Monitoring task '{operation_name}' with {timeout_seconds}s timeout"
+        "Monitoring task '%s' with %ss timeout", operation_name, timeout_seconds
     )
 
     try:
@@ -284,7 +406,7 @@ async def run_with_timeout_and_cancel(
 
         elapsed = time.monotonic() - start_time
         logger.debug(
-            f"Task '{operation_name}' completed successfully in {elapsed:.2f}s"
+            "Task '%s' completed successfully in %.2fs", operation_name, elapsed
         )
 
         return TimeoutResult(
@@ -296,7 +418,7 @@ async def run_with_timeout_and_cancel(
     except asyncio.TimeoutError:
         elapsed = time.monotonic() - start_time
         logger.warning(
-            f"Task '{operation_name}' timed out after {elapsed:.2f}s - cancelling"
+            "Task '%s' timed out after %.2fs - cancelling", operation_name, elapsed
         )
 
         # Cancel the task
@@ -307,15 +429,15 @@ async def run_with_timeout_and_cancel(
             async with asyncio.timeout(CLEANUP_GRACE_PERIOD_SECONDS):
                 await task
         except asyncio.CancelledError:
-            logger.debug(f"Task '{operation_name}' cancelled successfully")
+            logger.debug("Task '%s' cancelled successfully", operation_name)
         except asyncio.TimeoutError:
             logger.warning(
-                f"Task '{operation_name}' did not respond to cancellation"
+                "Task '%s' did not respond to cancellation", operation_name
             )
         except Exception as e:
             # Task raised an exception during cancellation - log it
             logger.debug(
-                f"Task '{operation_name}' raised during cancellation: {e}"
+                "Task '%s' raised during cancellation: %s", operation_name, e
             )
 
         return TimeoutResult(
@@ -328,7 +450,7 @@ async def run_with_timeout_and_cancel(
     except asyncio.CancelledError:
         elapsed = time.monotonic() - start_time
         logger.info(
-            f"Task '{operation_name}' was externally cancelled after {elapsed:.2f}s"
+            "Task '%s' was externally cancelled after %.2fs", operation_name, elapsed
         )
         return TimeoutResult(
             success=False,
@@ -340,7 +462,7 @@ async def run_with_timeout_and_cancel(
     except Exception as e:
         elapsed = time.monotonic() - start_time
         logger.error(
-            f"Task '{operation_name}' failed after {elapsed:.2f}s: {e}"
+            "Task '%s' failed after %.2fs: %s", operation_name, elapsed, e
         )
 
         return TimeoutResult(
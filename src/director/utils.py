@@ -6,7 +6,9 @@ Pure utility functions for path resolution and validation (atoms),
 plus composed helpers for command execution (molecules).
 """
 
+import functools
 import logging
+import os
 import subprocess
 from pathlib import Path
 from typing import List
@@ -20,19 +22,28 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
-def resolve_absolute_path(path: Path | str) -> Path:
+def resolve_absolute_path(path: Path | str, resolve_symlinks: bool = True) -> Path:
     """
     Resolve a path to its absolute, canonical form.
 
     This atom converts any path (relative or absolute, string or Path)
     to an absolute Path with all symlinks resolved.
 
+    Callers that only need an absolute path (e.g. to hand to git -C or
+    open()) can pass resolve_symlinks=False: the path is then normalized
+    as a string (os.path.abspath), without the lstat() per component that
+    resolve() performs. ".." is collapsed lexically in that mode.
+
     Args:
         path: A path as string or Path object
+        resolve_symlinks: Resolve symlinks (default True); False for a
+            purely lexical absolute path
 
     Returns:
         Resolved absolute Path
     """
+    if not resolve_symlinks:
+        return Path(os.path.abspath(path))
     if isinstance(path, str):
         path = Path(path)
     return path.resolve()
@@ -54,20 +65,51 @@ def validate_path_is_absolute(path: Path) -> bool:
     return path.is_absolute()
 
 
+@functools.cache
 def get_harness_root() -> Path:
     """
-    Get the resolved harness root directory.
+    Get the absolute harness root directory.
 
     This atom returns the root directory of the Linear-Coding-Agent-Harness
-    project. It matches the BEADS_ROOT constant from beads_config.py.
+    project. It matches the HARNESS_ROOT constant from beads_config.py,
+    including its BEADS_RESOLVE_SYMLINKS policy: symlinks are only resolved
+    when that variable is set. The location of this file never changes at
+    runtime, so the path is computed once and cached.
 
     Returns:
-        Absolute resolved path to harness root
+        Absolute path to harness root
     """
     # Navigate from this file to the harness root
     # This file is at: src/director/utils.py
     # Harness root is 3 levels up: src/director/ -> src/ -> harness/
-    return Path(__file__).parent.parent.parent.resolve()
+    root = Path(__file__).parents[2]
+    if os.environ.get("BEADS_RESOLVE_SYMLINKS"):
+        return root.resolve()
+    return Path(os.path.abspath(root))
+
+
+# Characters that make an argument ambiguous in a logged command line:
+# whitespace, quotes, and shell expansion/redirection characters
+_LOG_QUOTE_CHARS = frozenset(" \t\n'\"\\$`|&;<>*?!")
+
+# Characters that stay special inside double quotes and need a backslash
+_LOG_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "$": "\\$", "`": "\\`"})
+
+
+def _quote_for_logging(text: str) -> str:
+    """
+    Double-quote one argument if it would be ambiguous unquoted.
+
+    Args:
+        text: Argument text
+
+    Returns:
+        text unchanged, or wrapped in double quotes with \\ " $ ` escaped
+    """
+    # isdisjoint() scans the string in C; most arguments need no quoting
+    if text and _LOG_QUOTE_CHARS.isdisjoint(text):
+        return text
+    return '"' + text.translate(_LOG_ESCAPES) + '"'
 
 
 def format_command_for_logging(cmd: list) -> str:
@@ -76,7 +118,8 @@ def format_command_for_logging(cmd: list) -> str:
 
     This atom takes a command list (as used by subprocess.run)
     and formats it as a string suitable for logging. Arguments
-    containing spaces are quoted.
+    containing spaces, quotes or shell metacharacters ($, `, |, ;,
+    globs, ...) are double-quoted, as are empty arguments.
 
     Args:
         cmd: List of command arguments
@@ -84,18 +127,9 @@ def format_command_for_logging(cmd: list) -> str:
     Returns:
         Formatted command string
     """
-    if not cmd:
-        return ""
-
-    formatted_parts = []
-    for part in cmd:
-        # Quote arguments that contain spaces
-        if " " in str(part):
-            formatted_parts.append(f'"{part}"')
-        else:
-            formatted_parts.append(str(part))
-
-    return " ".join(formatted_parts)
+    # A list comprehension rather than a generator: str.join() builds a
+    # list from a generator anyway.
+    return " ".join([_quote_for_logging(str(part)) for part in cmd])
 
 
 # =============================================================================
@@ -145,25 +179,53 @@ def run_command(
     # First element is the executable, remaining are arguments
     absolute_cmd = [cmd[0]] if cmd else []
 
+    # Names in project_dir, listed on the first bare argument so that
+    # many arguments cost one directory read instead of a stat() each.
+    # The listing is only a fast positive check: an exact-name miss still
+    # goes to the filesystem, which may match case-insensitively or
+    # normalize Unicode (macOS, Windows)
+    entries = None
+
     for arg in cmd[1:]:
-        # Check if arg looks like a path (contains / or is a relative path)
-        # Heuristic: if it doesn't start with - (not a flag) and could be a path
-        if not arg.startswith("-") and ("/" in arg or not arg.startswith("-")):
-            # Try to resolve as path relative to project_dir
-            potential_path = project_dir_resolved / arg
-            if potential_path.exists() or "/" in arg:
-                # Use the absolute path
-                absolute_cmd.append(str(resolve_absolute_path(potential_path)))
-            else:
-                # Not a path, keep as-is
-                absolute_cmd.append(arg)
-        else:
-            # Flags and other arguments pass through unchanged
+        if arg.startswith("-"):
+            # Flags pass through unchanged
             absolute_cmd.append(arg)
-
-    # Log the full command for debugging
-    formatted_cmd = format_command_for_logging(absolute_cmd)
-    logger.debug(f"Executing command: {formatted_cmd}")
+            continue
+
+        potential_path = project_dir_resolved / arg
+        if "/" in arg:
+            # Explicit path: always made absolute, whether or not it exists
+            absolute_cmd.append(str(resolve_absolute_path(potential_path)))
+            continue
+
+        if entries is None:
+            try:
+                entries = set(os.listdir(project_dir_resolved))
+            except OSError:
+                entries = set()
+
+        # "", "." and ".." always exist but are never listed
+        if arg in entries or arg in ("", ".", ".."):
+            # project_dir_resolved is canonical, so a single plain component
+            # only needs resolve() (a walk of every path component) when it
+            # is itself a symlink
+            if arg != ".." and not os.path.islink(potential_path):
+                absolute_cmd.append(str(potential_path))
+                continue
+            if os.path.exists(potential_path):
+                absolute_cmd.append(str(resolve_absolute_path(potential_path)))
+                continue
+            # Dangling symlink: listed, but not an existing path
+        elif os.path.exists(potential_path):
+            absolute_cmd.append(str(resolve_absolute_path(potential_path)))
+            continue
+
+        # Not a path in project_dir, keep as-is
+        absolute_cmd.append(arg)
+
+    # Log the full command for debugging (formatted only if it will be shown)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Executing command: %s", format_command_for_logging(absolute_cmd))
 
     # Execute without cwd parameter
     return subprocess.run(absolute_cmd, **kwargs)
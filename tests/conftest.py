@@ -0,0 +1,15 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+from src.director.bv_robot_plan import _resolve_bv
+
+
+@pytest.fixture(autouse=True)
+def clear_bv_resolution_cache():
+    """Keep the memoized BV PATH lookup from leaking between tests that mock shutil.which."""
+    _resolve_bv.cache_clear()
+    yield
+    _resolve_bv.cache_clear()
@@ -11,6 +11,7 @@ from unittest.mock import patch
 
 import pytest
 
+import beads_config
 from src.director.utils import (
     resolve_absolute_path,
     validate_path_is_absolute,
@@ -84,6 +85,29 @@ class TestResolveAbsolutePath:
         assert ".." not in str(result)
         assert result == tmp_path.resolve()
 
+    def test_lexical_mode_keeps_symlinks(self, tmp_path):
+        """resolve_symlinks=False makes the path absolute without following links."""
+        # Arrange
+        target = tmp_path / "target"
+        target.mkdir()
+        link = tmp_path / "link"
+        link.symlink_to(target)
+
+        # Act
+        lexical = resolve_absolute_path(str(link / "sub" / ".."), resolve_symlinks=False)
+        resolved = resolve_absolute_path(link)
+
+        # Assert
+        assert lexical == link
+        assert resolved == target.resolve()
+
+    def test_lexical_mode_makes_relative_paths_absolute(self):
+        """resolve_symlinks=False anchors relative paths at the current directory."""
+        result = resolve_absolute_path("some/relative/path", resolve_symlinks=False)
+
+        assert result.is_absolute()
+        assert result == Path.cwd() / "some" / "relative" / "path"
+
 
 # =============================================================================
 # Tests for validate_path_is_absolute()
@@ -172,6 +196,21 @@ class TestGetHarnessRoot:
         # Assert: Should contain key project files/directories
         assert (result / "src").exists() or (result / "tests").exists()
 
+    def test_matches_beads_config_harness_root(self):
+        """get_harness_root() agrees with beads_config.HARNESS_ROOT."""
+        assert get_harness_root() == beads_config.HARNESS_ROOT
+
+    def test_resolves_symlinks_only_when_requested(self):
+        """BEADS_RESOLVE_SYMLINKS switches to the canonical path."""
+        get_harness_root.cache_clear()
+        try:
+            with patch.dict("os.environ", {"BEADS_RESOLVE_SYMLINKS": "1"}):
+                result = get_harness_root()
+        finally:
+            get_harness_root.cache_clear()
+
+        assert result == result.resolve()
+
 
 # =============================================================================
 # Tests for format_command_for_logging()
@@ -236,3 +275,64 @@ class TestFormatCommandForLogging:
         # Assert
         assert "123" in result
         assert result == "python -c print(42) 123"
+
+    def test_quotes_and_escapes_shell_metacharacters(self):
+        """format_command_for_logging() double-quotes metacharacters and escapes \\ " $ `."""
+        # Arrange
+        cmd = ["sh", "-c", "echo $HOME", 'say "hi"', "*.py", "a;b", ""]
+
+        # Act
+        result = format_command_for_logging(cmd)
+
+        # Assert
+        assert result == 'sh -c "echo \\$HOME" "say \\"hi\\"" "*.py" "a;b" ""'
+
+
+# =============================================================================
+# Tests for src.director package exports
+# =============================================================================
+
+
+class TestDirectorPackageExports:
+    """Tests for the lazily-loaded src.director re-exports."""
+
+    def test_all_exports_resolve(self):
+        """Every name in __all__ is importable from the package."""
+        import src.director as director
+
+        for name in director.__all__:
+            assert getattr(director, name) is not None, name
+
+    def test_export_matches_submodule_object(self):
+        """Lazy exports are the submodule objects, not copies."""
+        from src.director import attempt_automatic_merge
+        from src.director.conflict_handler import (
+            attempt_automatic_merge as direct,
+        )
+
+        assert attempt_automatic_merge is direct
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names raise AttributeError like a normal module."""
+        import src.director as director
+
+        with pytest.raises(AttributeError):
+            director.does_not_exist
+
+    def test_package_import_defers_submodules(self):
+        """Importing the package alone does not import heavy submodules."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, src.director; "
+            "print(any(m.startswith('src.director.') for m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.stdout.strip() == "False"
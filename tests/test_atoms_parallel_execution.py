@@ -7,14 +7,19 @@ These are unit tests with no mocking needed - atoms have no dependencies.
 """
 
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 
 from src.director.parallel_atoms import (
     sort_by_priority,
+    top_k_by_priority,
+    merge_sorted_by_priority,
     recommend_parallelism,
+    AdaptiveParallelismController,
     create_execution_record,
     calculate_success_rate,
+    SuccessRateTracker,
 )
 
 
@@ -68,6 +73,58 @@ class TestSortByPriority:
         assert result[0]["id"] == "only"
 
 
+    def test_equal_priorities_keep_original_order(self):
+        """Ties keep their input order (stable sort)."""
+        issues = [{"id": "a", "priority": 1}, {"id": "b"}, {"id": "c", "priority": 1}]
+
+        result = sort_by_priority(issues)
+
+        assert [i["id"] for i in result] == ["a", "c", "b"]
+
+
+class TestTopKByPriority:
+    """Tests for top_k_by_priority() atom."""
+
+    def test_matches_head_of_full_sort(self):
+        """Returns the first k issues of sort_by_priority()."""
+        issues = [
+            {"id": "a", "priority": 3},
+            {"id": "b"},
+            {"id": "c", "priority": 0},
+            {"id": "d", "priority": 3},
+            {"id": "e", "priority": 1},
+        ]
+
+        for k in range(len(issues) + 2):
+            assert top_k_by_priority(issues, k) == sort_by_priority(issues)[:k]
+
+
+class TestMergeSortedByPriority:
+    """Tests for merge_sorted_by_priority() atom."""
+
+    def test_merges_presorted_streams_like_a_full_sort(self):
+        """Merging sorted streams matches sorting their concatenation."""
+        ready = sort_by_priority([{"id": "a", "priority": 0}, {"id": "b", "priority": 3}, {"id": "c"}])
+        unblocked = sort_by_priority([{"id": "d", "priority": 1}, {"id": "e", "priority": 3}])
+
+        merged = list(merge_sorted_by_priority(ready, unblocked))
+
+        assert merged == sort_by_priority(ready + unblocked)
+
+    def test_is_lazy(self):
+        """Yields the first issue without consuming whole streams."""
+        def endless():
+            priority = 0
+            while True:
+                yield {"priority": priority}
+                priority += 1
+
+        merged = merge_sorted_by_priority(endless(), [{"id": "x", "priority": 0}])
+
+        assert next(merged) == {"priority": 0}
+        assert next(merged) == {"id": "x", "priority": 0}
+
+
 class TestRecommendParallelism:
     """Tests for recommend_parallelism() atom."""
 
@@ -101,6 +158,86 @@ class TestRecommendParallelism:
         """Default current_parallel is 2."""
         assert recommend_parallelism(0.95) == 3  # 2 + 1
 
+    def test_custom_thresholds_and_bounds(self):
+        """Thresholds and bounds are parameters of the single implementation."""
+        assert recommend_parallelism(0.85, 4, up_threshold=0.8, max_p=5) == 5
+        assert recommend_parallelism(0.6, 2, down_threshold=0.5) == 2
+        assert recommend_parallelism(0.0, 2, min_p=2) == 2
+
+    def test_grow_below_limits_scale_up(self):
+        """With grow_below, high success only scales up below that load."""
+        assert recommend_parallelism(0.95, 2, grow_below=3) == 3
+        assert recommend_parallelism(0.95, 3, grow_below=3) == 3
+        assert recommend_parallelism(0.10, 3, grow_below=3) == 2
+
+    def test_strict_up_excludes_the_threshold(self):
+        """With strict_up, a rate exactly at up_threshold maintains."""
+        assert recommend_parallelism(0.8, 2, up_threshold=0.8) == 3
+        assert recommend_parallelism(0.8, 2, up_threshold=0.8, strict_up=True) == 2
+        assert recommend_parallelism(0.81, 2, up_threshold=0.8, strict_up=True) == 3
+
+
+class TestAdaptiveParallelismController:
+    """Tests for AdaptiveParallelismController (AIMD with slow start)."""
+
+    @staticmethod
+    def _run_window(controller, successes, latency=1.0, size=4):
+        """Record one full window with `successes` successful outcomes."""
+        limit = None
+        for i in range(size):
+            limit = controller.record_outcome(i < successes, latency)
+        return limit
+
+    def test_limit_only_changes_at_window_end(self):
+        """Outcomes inside a window do not move the limit."""
+        controller = AdaptiveParallelismController(window_ops=4)
+
+        for _ in range(3):
+            assert controller.record_outcome(True, 1.0) == 1
+
+        assert controller.record_outcome(True, 1.0) == 2
+
+    def test_slow_start_doubles_up_to_max(self):
+        """Healthy windows double the limit during slow start, capped at max."""
+        controller = AdaptiveParallelismController(window_ops=4, max_limit=6)
+
+        limits = [self._run_window(controller, successes=4) for _ in range(4)]
+
+        assert limits == [2, 4, 6, 6]
+        assert controller.in_slow_start is True
+
+    def test_stress_halves_then_grows_additively(self):
+        """Low success halves the limit and ends slow start; then +1 per window."""
+        controller = AdaptiveParallelismController(initial_limit=4, window_ops=4, max_limit=8)
+
+        assert self._run_window(controller, successes=2) == 2
+        assert controller.in_slow_start is False
+        assert self._run_window(controller, successes=4) == 3
+        assert self._run_window(controller, successes=4) == 4
+
+    def test_latency_inflation_counts_as_stress(self):
+        """p95 latency above factor x best window is treated as stress."""
+        controller = AdaptiveParallelismController(
+            initial_limit=2, window_ops=4, latency_inflation_factor=1.5
+        )
+
+        assert self._run_window(controller, successes=4, latency=1.0) == 4
+        assert self._run_window(controller, successes=4, latency=2.0) == 2
+
+    def test_never_drops_below_min(self):
+        """Repeated stress bottoms out at min_limit."""
+        controller = AdaptiveParallelismController(initial_limit=2, min_limit=1, window_ops=4)
+
+        for _ in range(3):
+            assert self._run_window(controller, successes=0) == 1
+
+    def test_rejects_invalid_configuration(self):
+        """Inverted bounds or a one-op window are rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveParallelismController(min_limit=3, max_limit=2)
+        with pytest.raises(ValueError):
+            AdaptiveParallelismController(window_ops=1)
+
 
 class TestCreateExecutionRecord:
     """Tests for create_execution_record() atom."""
@@ -131,6 +268,15 @@ class TestCreateExecutionRecord:
         # Should be ISO format
         datetime.fromisoformat(record["timestamp"])  # Validates format
 
+    def test_records_in_same_second_share_timestamp(self):
+        """Auto timestamps are second-granular local time, shared within a second."""
+        with patch("src.director.parallel_atoms.time.time", return_value=1_700_000_000.25):
+            first = create_execution_record(parallel_count=1, conflicts=0, success=True)
+            second = create_execution_record(parallel_count=2, conflicts=1, success=False)
+
+        expected = datetime.fromtimestamp(1_700_000_000).isoformat(timespec="seconds")
+        assert first["timestamp"] == second["timestamp"] == expected
+
     def test_success_false_is_preserved(self):
         """Success=False is correctly stored."""
         record = create_execution_record(
@@ -203,3 +349,35 @@ class TestCalculateSuccessRate:
         rate = calculate_success_rate(executions)
 
         assert rate == pytest.approx(2 / 3)
+
+    def test_window_larger_than_history_uses_all(self):
+        """A window longer than the history averages every record."""
+        executions = [{"success": True}, {"success": False}]
+
+        assert calculate_success_rate(executions, window=50) == 0.5
+
+
+class TestSuccessRateTracker:
+    """Tests for SuccessRateTracker incremental success rate."""
+
+    def test_empty_tracker_rate_is_zero(self):
+        """No records gives 0.0, like calculate_success_rate([])."""
+        assert SuccessRateTracker().rate == 0.0
+
+    def test_matches_calculate_success_rate_on_every_append(self):
+        """Rate after each record equals a full recomputation over the window."""
+        outcomes = [True, False, True, True, False, False, True, True, True, False, True]
+        tracker = SuccessRateTracker(window=4)
+        history = []
+
+        for outcome in outcomes:
+            tracker.record(outcome)
+            history.append({"success": outcome})
+            assert tracker.rate == pytest.approx(calculate_success_rate(history, window=4))
+
+        assert len(tracker) == 4
+
+    def test_rejects_non_positive_window(self):
+        """A window below 1 is rejected."""
+        with pytest.raises(ValueError):
+            SuccessRateTracker(window=0)
@@ -9,6 +9,7 @@ These are unit tests with no mocking needed - atoms have no dependencies.
 import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -21,16 +22,15 @@ from src.director.utils import (
 )
 
 # Import beads_config atoms
+import beads_config
 from beads_config import (
     HARNESS_ROOT,
     BEADS_ROOT,
-    PRODUCT_DOCS_DIR,
-    SPECS_DIR,
-    DIRECTOR_PROMPTS_DIR,
     validate_beads_location,
 )
 
 # Import progress atoms
+import progress
 from progress import detect_rogue_beads_dirs
 
 
@@ -127,28 +127,22 @@ class TestFormatCommandForLogging:
         assert '"/path/with spaces/script.py"' in result or "'/path/with spaces/script.py'" in result
 
 
-class TestPathConstants:
-    """Tests for path constants in beads_config.py."""
-
-    def test_product_docs_dir_is_absolute(self):
-        """PRODUCT_DOCS_DIR is an absolute path."""
-        assert PRODUCT_DOCS_DIR.is_absolute()
+# Directory constants derived from HARNESS_ROOT in beads_config.py
+DIR_CONSTANTS = ["PRODUCT_DOCS_DIR", "SPECS_DIR", "DIRECTOR_PROMPTS_DIR"]
 
-    def test_product_docs_dir_under_harness_root(self):
-        """PRODUCT_DOCS_DIR is under HARNESS_ROOT."""
-        assert str(PRODUCT_DOCS_DIR).startswith(str(HARNESS_ROOT))
 
-    def test_specs_dir_is_absolute(self):
-        """SPECS_DIR is an absolute path."""
-        assert SPECS_DIR.is_absolute()
+class TestPathConstants:
+    """Tests for path constants in beads_config.py."""
 
-    def test_specs_dir_under_harness_root(self):
-        """SPECS_DIR is under HARNESS_ROOT."""
-        assert str(SPECS_DIR).startswith(str(HARNESS_ROOT))
+    @pytest.mark.parametrize("name", DIR_CONSTANTS)
+    def test_dir_constant_is_absolute(self, name):
+        """Directory constants are absolute paths."""
+        assert getattr(beads_config, name).is_absolute()
 
-    def test_director_prompts_dir_is_absolute(self):
-        """DIRECTOR_PROMPTS_DIR is an absolute path."""
-        assert DIRECTOR_PROMPTS_DIR.is_absolute()
+    @pytest.mark.parametrize("name", DIR_CONSTANTS)
+    def test_dir_constant_under_harness_root(self, name):
+        """Directory constants live under HARNESS_ROOT."""
+        assert getattr(beads_config, name).is_relative_to(HARNESS_ROOT)
 
     def test_beads_root_defaults_to_harness_root(self):
         """BEADS_ROOT defaults to HARNESS_ROOT when env var not set."""
@@ -173,45 +167,174 @@ class TestValidateBeadsLocation:
         result2 = validate_beads_location()
         assert result1 == result2
 
+    def test_returns_false_when_rogue_beads_present(self, tmp_path):
+        """Returns False as soon as a spec-level .beads/ exists."""
+        (tmp_path / "spec-a" / ".beads").mkdir(parents=True)
+
+        with patch("progress.SPECS_DIR", tmp_path):
+            assert validate_beads_location() is False
+            assert progress.has_rogue_beads_dirs() is True
+
+
+@pytest.fixture
+def rogue_beads_dir(tmp_path):
+    """
+    A spec with a rogue .beads/ in an isolated SPECS_DIR.
+
+    Keeps the detection test out of the real agent-os/specs tree, so a
+    crashed run cannot leave a rogue directory behind in the repo.
+    """
+    rogue = tmp_path / "_test_rogue_spec" / ".beads"
+    rogue.mkdir(parents=True)
+    with patch("progress.SPECS_DIR", tmp_path):
+        yield rogue
+
+
+@pytest.fixture
+def clean_specs_dir(tmp_path):
+    """
+    A spec without .beads/ in an isolated SPECS_DIR.
+
+    The scan sees only this one-directory tree, so results do not depend
+    on what is checked out under the real agent-os/specs.
+    """
+    (tmp_path / "spec-a").mkdir()
+    with patch("progress.SPECS_DIR", tmp_path):
+        yield tmp_path
+
 
 class TestDetectRogueBeadsDirs:
     """Tests for detect_rogue_beads_dirs() atom in progress.py."""
 
-    def test_returns_empty_list_when_no_rogue_dirs(self):
+    def test_returns_empty_list_when_no_rogue_dirs(self, clean_specs_dir):
         """Returns empty list when no spec-level .beads/ exist."""
         result = detect_rogue_beads_dirs()
         assert isinstance(result, list)
-        # In current state, should be empty
         assert len(result) == 0, f"Expected no rogue dirs, found: {result}"
 
-    def test_returns_list_of_paths(self):
+    def test_returns_list_of_paths(self, rogue_beads_dir):
         """Return type is list[Path]."""
         result = detect_rogue_beads_dirs()
+        assert result, "Expected the fixture's rogue dir to be found"
         assert isinstance(result, list)
         for item in result:
             assert isinstance(item, Path), f"Expected Path, got {type(item)}"
 
-    def test_detects_rogue_directory_when_present(self):
+    def test_detects_rogue_directory_when_present(self, rogue_beads_dir):
         """Detects .beads/ directory inside specs folder."""
-        # Create a temporary rogue .beads/ directory for testing
-        specs_dir = SPECS_DIR
-        if specs_dir.exists():
-            # Create a temporary spec with a rogue .beads
-            test_spec_dir = specs_dir / "_test_rogue_spec"
-            rogue_beads_dir = test_spec_dir / ".beads"
-
-            try:
-                test_spec_dir.mkdir(exist_ok=True)
-                rogue_beads_dir.mkdir(exist_ok=True)
-
-                result = detect_rogue_beads_dirs()
-
-                assert rogue_beads_dir in result, (
-                    f"Should detect rogue .beads/ at {rogue_beads_dir}"
-                )
-            finally:
-                # Cleanup
-                if rogue_beads_dir.exists():
-                    rogue_beads_dir.rmdir()
-                if test_spec_dir.exists():
-                    test_spec_dir.rmdir()
+        result = detect_rogue_beads_dirs()
+
+        assert rogue_beads_dir in result, (
+            f"Should detect rogue .beads/ at {rogue_beads_dir}"
+        )
+
+    def test_detects_nested_rogue_directory(self, tmp_path):
+        """Detects .beads/ nested below a spec's top level."""
+        nested = tmp_path / "spec-a" / "implementation" / ".beads"
+        nested.mkdir(parents=True)
+
+        with patch("progress.SPECS_DIR", tmp_path):
+            result = detect_rogue_beads_dirs()
+
+        assert result == [nested]
+
+    def test_skips_hidden_and_vendored_directories(self, tmp_path):
+        """Does not descend into hidden, node_modules or __pycache__ dirs."""
+        spec = tmp_path / "spec-a"
+        (spec / ".git" / ".beads").mkdir(parents=True)
+        (spec / "node_modules" / "pkg" / ".beads").mkdir(parents=True)
+        (spec / "__pycache__" / ".beads").mkdir(parents=True)
+
+        with patch("progress.SPECS_DIR", tmp_path):
+            result = detect_rogue_beads_dirs()
+
+        assert result == []
+
+    def test_detects_beads_directly_under_specs(self, tmp_path):
+        """A .beads/ at the top of the specs tree is also a violation."""
+        rogue = tmp_path / ".beads"
+        rogue.mkdir()
+
+        with patch("progress.SPECS_DIR", tmp_path):
+            result = detect_rogue_beads_dirs()
+
+        assert result == [rogue]
+
+    def test_ignores_similarly_named_directories(self, tmp_path):
+        """Only an exact .beads name matches; near misses are ignored."""
+        spec = tmp_path / "spec-a"
+        for name in ("beads", ".beads_old", "my.beads", ".beads.bak"):
+            (spec / name).mkdir(parents=True)
+
+        with patch("progress.SPECS_DIR", tmp_path):
+            result = detect_rogue_beads_dirs()
+
+        assert result == []
+
+    def test_ignores_beads_file(self, tmp_path):
+        """A regular file named .beads is not a rogue database."""
+        spec = tmp_path / "spec-a"
+        spec.mkdir()
+        (spec / ".beads").write_text("not a directory")
+
+        with patch("progress.SPECS_DIR", tmp_path):
+            result = detect_rogue_beads_dirs()
+
+        assert result == []
+
+
+class TestRogueScanCache:
+    """Tests for the cached result of detect_rogue_beads_dirs()."""
+
+    @staticmethod
+    def _age_tree(root: Path) -> None:
+        """Backdate every directory under root outside the racy mtime window."""
+        old = os.stat(root).st_mtime - 3600
+        for dirpath, _, _ in os.walk(root):
+            os.utime(dirpath, (old, old))
+
+    def test_unchanged_tree_is_served_from_cache(self, tmp_path):
+        """A second scan of an unchanged tree does not list directories."""
+        (tmp_path / "spec-a" / "implementation").mkdir(parents=True)
+        self._age_tree(tmp_path)
+
+        with patch("progress.SPECS_DIR", tmp_path):
+            assert detect_rogue_beads_dirs() == []
+
+            with patch("progress.os.scandir", side_effect=AssertionError("rescanned")):
+                assert detect_rogue_beads_dirs() == []
+
+    def test_nested_change_invalidates_cache(self, tmp_path):
+        """Creating a nested .beads/ after a cached scan is still detected."""
+        implementation = tmp_path / "spec-a" / "implementation"
+        implementation.mkdir(parents=True)
+        self._age_tree(tmp_path)
+
+        with patch("progress.SPECS_DIR", tmp_path):
+            assert detect_rogue_beads_dirs() == []
+
+            rogue = implementation / ".beads"
+            rogue.mkdir()
+
+            assert detect_rogue_beads_dirs() == [rogue]
+
+    def test_recently_modified_tree_is_not_cached(self, tmp_path):
+        """Directories touched within the racy window are always rescanned."""
+        (tmp_path / "spec-a").mkdir()
+
+        with patch("progress.SPECS_DIR", tmp_path):
+            detect_rogue_beads_dirs()
+
+            assert progress._rogue_scan_cache is None
+
+    def test_invalidate_forces_rescan(self, tmp_path):
+        """invalidate_rogue_scan_cache() drops the cached result."""
+        (tmp_path / "spec-a").mkdir()
+        self._age_tree(tmp_path)
+
+        with patch("progress.SPECS_DIR", tmp_path):
+            detect_rogue_beads_dirs()
+            assert progress._rogue_scan_cache is not None
+
+            progress.invalidate_rogue_scan_cache()
+            assert progress._rogue_scan_cache is None
@@ -324,3 +324,29 @@ class TestAgentPromptSelectionEdgeCases:
 
             # Back to False
             assert is_beads_initialized() is False
+
+
+class TestSpecMarkerCache:
+    """
+    Integration tests for the memoized spec marker read behind
+    is_spec_initialized().
+    """
+
+    def test_unchanged_marker_is_not_reparsed(self, tmp_path):
+        """A second check of an unchanged marker is served from cache."""
+        spec_marker = tmp_path / BEADS_PROJECT_MARKER
+        spec_marker.write_text(json.dumps({"meta_issue_id": "cached-1"}))
+
+        assert is_spec_initialized(tmp_path) is True
+
+        with patch("progress.open", side_effect=AssertionError("re-read")):
+            assert is_spec_initialized(tmp_path) is True
+
+    def test_rewritten_marker_is_reparsed(self, tmp_path):
+        """Rewriting the marker with different content is picked up."""
+        spec_marker = tmp_path / BEADS_PROJECT_MARKER
+        spec_marker.write_text(json.dumps({"meta_issue_id": None}))
+        assert is_spec_initialized(tmp_path) is False
+
+        spec_marker.write_text(json.dumps({"meta_issue_id": "meta-2"}))
+        assert is_spec_initialized(tmp_path) is True
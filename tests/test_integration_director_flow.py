@@ -99,8 +99,8 @@ Phase 2: Implementation
             mock_run.return_value = subprocess.CompletedProcess(
                 args=["bv", "robot", "--plan"],
                 returncode=0,
-                stdout=mock_plan_output,
-                stderr="",
+                stdout=mock_plan_output.encode(),
+                stderr=b"",
             )
 
             # Step 1: Query BV plan
@@ -128,8 +128,8 @@ Phase 2: Implementation
             mock_run.return_value = subprocess.CompletedProcess(
                 args=["git", "diff", "--name-only", "--diff-filter=U"],
                 returncode=0,
-                stdout="",  # No conflicts
-                stderr="",
+                stdout=b"",  # No conflicts
+                stderr=b"",
             )
 
             conflicts = detect_merge_conflicts(project_dir)
@@ -198,17 +198,17 @@ Phase 2: Implementation
                     return subprocess.CompletedProcess(
                         args=cmd,
                         returncode=1,
-                        stdout="",
-                        stderr="CONFLICT (content): Merge conflict in api.py\n",
+                        stdout=b"",
+                        stderr=b"CONFLICT (content): Merge conflict in api.py\n",
                     )
                 elif "diff" in cmd:
                     return subprocess.CompletedProcess(
                         args=cmd,
                         returncode=0,
-                        stdout="src/api.py\nconfig/settings.json\n",
-                        stderr="",
+                        stdout=b"src/api.py\nconfig/settings.json\n",
+                        stderr=b"",
                     )
-                return subprocess.CompletedProcess(args=cmd, returncode=0, stdout="", stderr="")
+                return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=b"", stderr=b"")
 
             mock_run.side_effect = mock_git_commands
 
@@ -273,8 +273,8 @@ class TestErrorPropagationE2E:
             mock_run.return_value = subprocess.CompletedProcess(
                 args=["git", "merge", "branch"],
                 returncode=128,
-                stdout="",
-                stderr="fatal: not a git repository",
+                stdout=b"",
+                stderr=b"fatal: not a git repository",
             )
 
             result = attempt_automatic_merge(
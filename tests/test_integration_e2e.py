@@ -38,7 +38,6 @@ from progress import (
 )
 from beads_config import (
     BEADS_ROOT,
-    SPECS_DIR,
     HARNESS_ROOT,
 )
 
@@ -249,42 +248,38 @@ class TestMigrationWorkflowIntegration:
         3. Verify enforce_single_beads_database raises
         4. Clean up and verify both pass
         """
-        # We need to use the real SPECS_DIR for this test
-        if not SPECS_DIR.exists():
-            pytest.skip("SPECS_DIR does not exist")
-
-        test_spec_dir = SPECS_DIR / "_integration_test_spec"
+        # Isolated specs dir, so parallel test runs never see this rogue dir
+        specs_dir = tmp_path / "specs"
+        test_spec_dir = specs_dir / "_integration_test_spec"
         rogue_beads = test_spec_dir / ".beads"
 
-        try:
-            # Create rogue directory
-            test_spec_dir.mkdir(exist_ok=True)
-            rogue_beads.mkdir(exist_ok=True)
+        with patch("progress.SPECS_DIR", specs_dir):
+            try:
+                # Create rogue directory
+                rogue_beads.mkdir(parents=True)
 
-            # Step 1: Detection should find it
-            rogue_dirs = detect_rogue_beads_dirs()
-            assert rogue_beads in rogue_dirs, "Detection should find rogue .beads/"
+                # Step 1: Detection should find it
+                rogue_dirs = detect_rogue_beads_dirs()
+                assert rogue_beads in rogue_dirs, "Detection should find rogue .beads/"
 
-            # Step 2: Enforcement should fail
-            with pytest.raises(RuntimeError) as exc_info:
-                enforce_single_beads_database()
+                # Step 2: Enforcement should fail
+                with pytest.raises(RuntimeError) as exc_info:
+                    enforce_single_beads_database()
 
-            assert "violation" in str(exc_info.value).lower()
-            assert str(rogue_beads) in str(exc_info.value)
+                assert "violation" in str(exc_info.value).lower()
+                assert str(rogue_beads) in str(exc_info.value)
 
-        finally:
-            # Cleanup
-            if rogue_beads.exists():
-                rogue_beads.rmdir()
-            if test_spec_dir.exists():
-                test_spec_dir.rmdir()
+            finally:
+                # Cleanup
+                if rogue_beads.exists():
+                    rogue_beads.rmdir()
 
-        # Step 3: After cleanup, both should pass
-        rogue_dirs = detect_rogue_beads_dirs()
-        assert rogue_beads not in rogue_dirs
+            # Step 3: After cleanup, both should pass
+            rogue_dirs = detect_rogue_beads_dirs()
+            assert rogue_beads not in rogue_dirs
 
-        # Should not raise now
-        enforce_single_beads_database()
+            # Should not raise now
+            enforce_single_beads_database()
 
     def test_harness_root_consistency_across_modules(self):
         """
@@ -386,52 +381,41 @@ class TestMigrationScriptDryRun:
         """
         E2E: Dry run makes zero filesystem changes.
         """
-        if not SPECS_DIR.exists():
-            pytest.skip("SPECS_DIR does not exist")
-
-        test_spec_dir = SPECS_DIR / "_dry_run_integration_test"
+        # Isolated specs dir, so parallel test runs never see this rogue dir
+        specs_dir = tmp_path / "specs"
+        test_spec_dir = specs_dir / "_dry_run_integration_test"
         rogue_beads = test_spec_dir / ".beads"
         test_file = rogue_beads / "test_data.json"
 
-        try:
-            # Create rogue directory with content
-            test_spec_dir.mkdir(exist_ok=True)
-            rogue_beads.mkdir(exist_ok=True)
-            test_file.write_text('{"test": "data"}')
-
-            # Record state before
-            state_before = {
-                "spec_exists": test_spec_dir.exists(),
-                "beads_exists": rogue_beads.exists(),
-                "file_exists": test_file.exists(),
-                "file_content": test_file.read_text() if test_file.exists() else None,
-            }
-
-            # Run migration in dry-run mode (import the function)
-            import sys
-            sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-            from migrate_beads import migrate_beads
+        # Create rogue directory with content
+        rogue_beads.mkdir(parents=True)
+        test_file.write_text('{"test": "data"}')
 
-            exit_code = migrate_beads(dry_run=True)
+        # Record state before
+        state_before = {
+            "spec_exists": test_spec_dir.exists(),
+            "beads_exists": rogue_beads.exists(),
+            "file_exists": test_file.exists(),
+            "file_content": test_file.read_text() if test_file.exists() else None,
+        }
 
-            # Record state after
-            state_after = {
-                "spec_exists": test_spec_dir.exists(),
-                "beads_exists": rogue_beads.exists(),
-                "file_exists": test_file.exists(),
-                "file_content": test_file.read_text() if test_file.exists() else None,
-            }
-
-            # State should be identical
-            assert state_before == state_after, (
-                f"Dry run modified state!\nBefore: {state_before}\nAfter: {state_after}"
-            )
+        # Run migration in dry-run mode (import the function)
+        import sys
+        sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+        from migrate_beads import migrate_beads
 
-        finally:
-            # Cleanup
-            if test_file.exists():
-                test_file.unlink()
-            if rogue_beads.exists():
-                rogue_beads.rmdir()
-            if test_spec_dir.exists():
-                test_spec_dir.rmdir()
+        with patch("progress.SPECS_DIR", specs_dir):
+            exit_code = migrate_beads(dry_run=True)
+
+        # Record state after
+        state_after = {
+            "spec_exists": test_spec_dir.exists(),
+            "beads_exists": rogue_beads.exists(),
+            "file_exists": test_file.exists(),
+            "file_content": test_file.read_text() if test_file.exists() else None,
+        }
+
+        # State should be identical
+        assert state_before == state_after, (
+            f"Dry run modified state!\nBefore: {state_before}\nAfter: {state_after}"
+        )
@@ -18,7 +18,12 @@ from unittest.mock import patch
 import pytest
 
 # Import the functions under test
-from progress import is_beads_initialized, load_beads_project_state
+from progress import (
+    is_beads_initialized,
+    load_beads_project_state,
+    print_progress_summary,
+    print_session_header,
+)
 from prompts import get_director_prompt, get_coding_prompt
 from beads_config import BEADS_ROOT, BEADS_PROJECT_MARKER
 
@@ -110,6 +115,90 @@ class TestIsBeadsInitializedIntegration:
                 "Should return False when marker has initialized=False"
             )
 
+    def test_returns_false_when_beads_is_a_file(self, tmp_path):
+        """
+        E2E: is_beads_initialized returns False when .beads is not a directory.
+        """
+        with patch("progress.BEADS_ROOT", tmp_path):
+            (tmp_path / ".beads").write_text("")
+
+            marker_file = tmp_path / BEADS_PROJECT_MARKER
+            marker_file.write_text(json.dumps({"initialized": True}))
+
+            assert is_beads_initialized() is False
+
+
+class TestLoadBeadsProjectStateCache:
+    """
+    Integration test: load_beads_project_state() in-process caching.
+
+    Repeated loads reuse the parsed marker; rewrites are picked up via
+    the file's mtime/size.
+    """
+
+    def test_repeated_loads_return_cached_state(self, tmp_path):
+        """Unchanged marker is parsed once and reused."""
+        with patch("progress.BEADS_ROOT", tmp_path):
+            marker_file = tmp_path / BEADS_PROJECT_MARKER
+            marker_file.write_text(json.dumps({"initialized": True}))
+
+            first = load_beads_project_state()
+            second = load_beads_project_state()
+
+            assert first == {"initialized": True}
+            assert second is first
+
+    def test_rewritten_marker_is_reloaded(self, tmp_path):
+        """A marker rewritten with different content is re-parsed."""
+        with patch("progress.BEADS_ROOT", tmp_path):
+            marker_file = tmp_path / BEADS_PROJECT_MARKER
+            marker_file.write_text(json.dumps({"initialized": False}))
+            assert load_beads_project_state() == {"initialized": False}
+
+            marker_file.write_text(json.dumps({"initialized": True, "total_issues": 5}))
+            assert load_beads_project_state() == {"initialized": True, "total_issues": 5}
+
+    def test_removed_marker_returns_none(self, tmp_path):
+        """Deleting the marker is reflected immediately."""
+        with patch("progress.BEADS_ROOT", tmp_path):
+            marker_file = tmp_path / BEADS_PROJECT_MARKER
+            marker_file.write_text(json.dumps({"initialized": True}))
+            assert load_beads_project_state() is not None
+
+            marker_file.unlink()
+            assert load_beads_project_state() is None
+
+
+class TestProgressOutput:
+    """
+    Integration test: session header and progress summary console output.
+    """
+
+    def test_session_header_format(self, capsys):
+        """Header is framed by 70-char rules and followed by a blank line."""
+        print_session_header(3, is_initializer=False)
+
+        rule = "=" * 70
+        assert capsys.readouterr().out == (
+            f"\n{rule}\n  SESSION 3: CODING AGENT\n{rule}\n\n"
+        )
+
+    def test_progress_summary_reads_marker(self, tmp_path, capsys):
+        """Summary reports totals from the root marker file."""
+        with patch("progress.BEADS_ROOT", tmp_path):
+            marker_file = tmp_path / BEADS_PROJECT_MARKER
+            marker_file.write_text(json.dumps({
+                "initialized": True,
+                "meta_issue_id": "test-123",
+                "total_issues": 42
+            }))
+
+            print_progress_summary()
+
+        out = capsys.readouterr().out
+        assert "Total issues created: 42" in out
+        assert "META issue ID: test-123" in out
+
 
 class TestPromptSelectionLogic:
     """
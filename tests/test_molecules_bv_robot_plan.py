@@ -18,6 +18,7 @@ import pytest
 from src.director.bv_robot_plan import (
     query_bv_robot_plan,
     parse_bv_plan_output,
+    BVPlanPhase,
     BVRobotPlan,
 )
 
@@ -47,8 +48,8 @@ Blocked: 0 tasks
             mock_run.return_value = subprocess.CompletedProcess(
                 args=["bv", "robot", "--plan"],
                 returncode=0,
-                stdout=mock_output,
-                stderr="",
+                stdout=mock_output.encode(),
+                stderr=b"",
             )
 
             # Act
@@ -86,8 +87,8 @@ Blocked: 0 tasks
             mock_run.return_value = subprocess.CompletedProcess(
                 args=["bv", "robot", "--plan"],
                 returncode=1,
-                stdout="",
-                stderr="Error running beads viewer: could not open a new TTY: open /dev/tty: no such device",
+                stdout=b"",
+                stderr=b"Error running beads viewer: could not open a new TTY: open /dev/tty: no such device",
             )
 
             # Act
@@ -107,8 +108,8 @@ Blocked: 0 tasks
             mock_run.return_value = subprocess.CompletedProcess(
                 args=["bv", "robot", "--plan"],
                 returncode=0,
-                stdout="",
-                stderr="",
+                stdout=b"",
+                stderr=b"",
             )
 
             # Act
@@ -215,6 +216,19 @@ Phase 2: API Layer
         # No valid phases should be extracted from garbage input
         assert len(phases) == 0
 
+    def test_returns_empty_list_without_phase_keyword(self):
+        """Output that never mentions a phase is rejected before the full parse."""
+        # Arrange: help banner with task-like lines but no phase headers
+        banner = "Usage: bv robot [--plan]\n- --plan  show execution plan\n"
+
+        with patch("src.director.bv_robot_plan._PLAN_LINE_RE") as mock_re:
+            # Act
+            phases = parse_bv_plan_output(banner)
+
+            # Assert
+            assert phases == []
+            mock_re.finditer.assert_not_called()
+
     def test_handles_partial_phase_output(self):
         """parse_bv_plan_output() handles output with partial phases."""
         # Arrange: Output with phase header but no tasks
@@ -234,6 +248,48 @@ Phase 2: API Layer
         assert isinstance(phases, list)
         # May extract empty phases or skip them - implementation choice
 
+    def test_extracts_exact_phases_and_tasks(self):
+        """parse_bv_plan_output() returns phase names and their tasks in order."""
+        # Arrange: Tasks before the first phase are ignored; CRLF is tolerated
+        raw_output = (
+            "- orphan task\r\n"
+            "  Phase 1: Database Layer  \r\n"
+            "-----------------------\r\n"
+            "- Task A\r\n"
+            "   -   Task B  \r\n"
+            "phase 2: API Layer\n"
+            "- Task C\n"
+            "Ready: 2 tasks\n"
+        )
+
+        # Act
+        phases = parse_bv_plan_output(raw_output)
+
+        # Assert
+        assert phases == [
+            BVPlanPhase(name="Phase 1: Database Layer", tasks=["Task A", "Task B"]),
+            BVPlanPhase(name="phase 2: API Layer", tasks=["Task C"]),
+        ]
+
+    def test_phase_supports_dict_style_access(self):
+        """Parsed phases still answer phase["name"] / phase["tasks"]."""
+        # Act
+        (phase,) = parse_bv_plan_output("Phase 1: Setup\n- Task A\n")
+
+        # Assert
+        assert phase["name"] == phase.name == "Phase 1: Setup"
+        assert phase["tasks"] is phase.tasks
+        with pytest.raises(KeyError):
+            phase["priority"]
+
+    def test_phase_header_does_not_span_lines(self):
+        """A 'Phase' word followed by a number on the next line is not a header."""
+        # Act
+        phases = parse_bv_plan_output("Phase\n1: Not a header\n- Task\n")
+
+        # Assert
+        assert phases == []
+
 
 class TestBVRobotPlanDataclass:
     """Tests for BVRobotPlan dataclass structure."""
@@ -323,3 +379,31 @@ class TestFallbackBehavior:
                 # Graceful fallback path
                 assert result.error_message is not None
                 assert len(result.phases) == 0
+
+
+class TestBVExecutableResolution:
+    """Tests for the memoized BV PATH lookup."""
+
+    def test_which_called_once_for_repeated_queries(self, tmp_path):
+        """Repeated queries reuse the first PATH resolution."""
+        with patch("shutil.which", return_value="/usr/bin/bv") as mock_which, \
+             patch("subprocess.run") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess(
+                args=["bv", "robot", "--plan"], returncode=0, stdout=b"", stderr=b""
+            )
+
+            query_bv_robot_plan(project_dir=tmp_path)
+            query_bv_robot_plan(project_dir=tmp_path)
+
+            assert mock_which.call_count == 1
+            assert mock_run.call_args[0][0][0] == "/usr/bin/bv"
+
+    def test_path_change_triggers_new_lookup(self, tmp_path, monkeypatch):
+        """A different $PATH value is resolved afresh."""
+        with patch("shutil.which", return_value=None) as mock_which:
+            monkeypatch.setenv("PATH", "/first")
+            query_bv_robot_plan(project_dir=tmp_path)
+            monkeypatch.setenv("PATH", "/second")
+            query_bv_robot_plan(project_dir=tmp_path)
+
+            assert mock_which.call_count == 2
@@ -79,6 +79,112 @@ class TestRunCommand:
             assert isinstance(result, subprocess.CompletedProcess)
             assert result.returncode == 0
 
+    @patch("src.director.utils.subprocess.run")
+    def test_existing_relative_arg_becomes_absolute(self, mock_run, tmp_path):
+        """run_command() rewrites existing relative paths under project_dir."""
+        # Arrange
+        (tmp_path / "tests").mkdir()
+
+        # Act
+        run_command(["pytest", "tests", "-v", "nonexistent"], tmp_path)
+
+        # Assert
+        expected = [
+            "pytest",
+            str(tmp_path.resolve() / "tests"),
+            "-v",
+            "nonexistent",
+        ]
+        assert mock_run.call_args.args[0] == expected
+
+    @patch("src.director.utils.subprocess.run")
+    def test_symlinked_arg_is_resolved(self, mock_run, tmp_path):
+        """run_command() resolves an argument that is itself a symlink."""
+        # Arrange
+        target = tmp_path / "real_tests"
+        target.mkdir()
+        (tmp_path / "tests").symlink_to(target)
+
+        # Act
+        run_command(["pytest", "tests"], tmp_path)
+
+        # Assert
+        assert mock_run.call_args.args[0] == ["pytest", str(target.resolve())]
+
+    @patch("src.director.utils.subprocess.run")
+    def test_parent_reference_is_resolved(self, mock_run, tmp_path):
+        """run_command() resolves '..' instead of passing it through."""
+        # Arrange
+        project = tmp_path / "project"
+        project.mkdir()
+
+        # Act
+        run_command(["ls", ".."], project)
+
+        # Assert
+        assert mock_run.call_args.args[0] == ["ls", str(tmp_path.resolve())]
+
+    @patch("src.director.utils.subprocess.run")
+    def test_lists_project_dir_once_for_many_args(self, mock_run, tmp_path):
+        """run_command() reads project_dir once, however many bare args there are."""
+        # Arrange
+        for name in ("a.py", "b.py", "c.py"):
+            (tmp_path / name).write_text("")
+
+        # Act
+        with patch("src.director.utils.os.listdir", wraps=os.listdir) as listdir:
+            run_command(["pytest", "a.py", "b.py", "missing", "c.py", "new/file.py"], tmp_path)
+
+        # Assert
+        root = tmp_path.resolve()
+        listdir.assert_called_once()
+        assert mock_run.call_args.args[0] == [
+            "pytest",
+            str(root / "a.py"),
+            str(root / "b.py"),
+            "missing",
+            str(root / "c.py"),
+            str(root / "new" / "file.py"),
+        ]
+
+    @patch("src.director.utils.subprocess.run")
+    def test_unlisted_name_found_by_filesystem_is_rewritten(self, mock_run, tmp_path):
+        """An arg the filesystem matches differently than the listing is still a path."""
+        # Arrange: Emulate a case-insensitive filesystem (macOS/Windows default)
+        (tmp_path / "README.md").write_text("")
+        names = {name.lower() for name in os.listdir(tmp_path)}
+
+        def case_insensitive_exists(path):
+            return os.path.basename(path).lower() in names
+
+        # Act
+        with patch("src.director.utils.os.path.exists", side_effect=case_insensitive_exists):
+            run_command(["cat", "readme.md", "missing"], tmp_path)
+
+        # Assert
+        assert mock_run.call_args.args[0] == [
+            "cat",
+            str(tmp_path.resolve() / "readme.md"),
+            "missing",
+        ]
+
+    @patch("src.director.utils.subprocess.run")
+    def test_dangling_symlink_arg_is_kept_as_is(self, mock_run, tmp_path):
+        """A listed symlink whose target is missing is not treated as a path."""
+        # Arrange
+        (tmp_path / "stale").symlink_to(tmp_path / "gone")
+
+        # Act
+        run_command(["cat", "stale"], tmp_path)
+
+        # Assert
+        assert mock_run.call_args.args[0] == ["cat", "stale"]
+
+    def test_cwd_keyword_is_rejected(self, tmp_path):
+        """run_command() refuses the forbidden cwd= keyword."""
+        with pytest.raises(ValueError):
+            run_command(["ls"], tmp_path, cwd=tmp_path)
+
 
 class TestWorkingDirectoryGuard:
     """Tests for WorkingDirectoryGuard context manager molecule."""
@@ -140,6 +246,35 @@ class TestWorkingDirectoryGuard:
         finally:
             os.chdir(original_cwd)
 
+    def test_entry_does_not_resolve_live_cwd(self, tmp_path):
+        """The live cwd is taken from os.getcwd() without a resolve() round-trip."""
+        original_cwd = Path.cwd().resolve()
+        os.chdir(tmp_path)
+
+        try:
+            # Construction resolves expected_cwd once; enter/exit must not resolve
+            guard = WorkingDirectoryGuard(tmp_path)
+            with patch.object(Path, "resolve", side_effect=AssertionError("resolved")):
+                with guard:
+                    pass
+        finally:
+            os.chdir(original_cwd)
+
+    def test_symlinked_expected_cwd_matches(self, tmp_path):
+        """A symlink to the cwd is accepted; expected_cwd is resolved at construction."""
+        original_cwd = Path.cwd().resolve()
+        real_dir = tmp_path / "real"
+        real_dir.mkdir()
+        link = tmp_path / "link"
+        link.symlink_to(real_dir, target_is_directory=True)
+        os.chdir(real_dir)
+
+        try:
+            with WorkingDirectoryGuard(link):
+                pass
+        finally:
+            os.chdir(original_cwd)
+
 
 class TestValidateCwd:
     """Tests for validate_cwd() function molecule."""
@@ -17,7 +17,9 @@ import pytest
 # Import molecules (to be implemented)
 from src.director.conflict_handler import (
     attempt_automatic_merge,
+    attempt_automatic_merge_async,
     detect_merge_conflicts,
+    merge_many,
     MergeResult,
     MergeStatus,
 )
@@ -36,8 +38,8 @@ class TestAttemptAutomaticMerge:
             mock_run.return_value = subprocess.CompletedProcess(
                 args=["git", "merge", "feature-branch"],
                 returncode=0,
-                stdout="Merge made by the 'ort' strategy.\n",
-                stderr="",
+                stdout=b"Merge made by the 'ort' strategy.\n",
+                stderr=b"",
             )
 
             result = attempt_automatic_merge(
@@ -54,15 +56,21 @@ class TestAttemptAutomaticMerge:
         project_dir = tmp_path / "project"
         project_dir.mkdir()
 
-        with patch("subprocess.run") as mock_run:
-            # Simulate merge conflict
-            mock_run.return_value = subprocess.CompletedProcess(
-                args=["git", "merge", "feature-branch"],
-                returncode=1,
-                stdout="",
-                stderr="CONFLICT (content): Merge conflict in file.txt\nAutomatic merge failed; fix conflicts and then commit the result.\n",
+        def mock_git_commands(cmd, **kwargs):
+            if "merge" in cmd:
+                # Simulate merge conflict
+                return subprocess.CompletedProcess(
+                    args=cmd,
+                    returncode=1,
+                    stdout=b"",
+                    stderr=b"CONFLICT (content): Merge conflict in file.txt\nAutomatic merge failed; fix conflicts and then commit the result.\n",
+                )
+            # git diff --diff-filter=U lists the unmerged path
+            return subprocess.CompletedProcess(
+                args=cmd, returncode=0, stdout=b"file.txt\n", stderr=b""
             )
 
+        with patch("subprocess.run", side_effect=mock_git_commands):
             result = attempt_automatic_merge(
                 branch_name="feature-branch",
                 project_dir=project_dir,
@@ -70,6 +78,47 @@ class TestAttemptAutomaticMerge:
 
             assert result.status == MergeStatus.CONFLICT
             assert "CONFLICT" in result.error_message or "conflict" in result.error_message.lower()
+            assert result.conflicted_files == ["file.txt"]
+
+    def test_conflict_decided_by_unmerged_paths_not_output_text(self, tmp_path):
+        """A failed merge with no unmerged paths is an ERROR even if output says 'conflict'."""
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+
+        def mock_git_commands(cmd, **kwargs):
+            if "merge" in cmd:
+                return subprocess.CompletedProcess(
+                    args=cmd,
+                    returncode=1,
+                    stdout=b"",
+                    stderr=b"error: branch name 'conflict-fix' is ambiguous\n",
+                )
+            return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=b"", stderr=b"")
+
+        with patch("subprocess.run", side_effect=mock_git_commands):
+            result = attempt_automatic_merge(
+                branch_name="conflict-fix",
+                project_dir=project_dir,
+            )
+
+            assert result.status == MergeStatus.ERROR
+
+    def test_merge_does_not_open_editor_or_run_hooks(self, tmp_path):
+        """git merge is invoked with --no-edit and --no-verify."""
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess(
+                args=[], returncode=0, stdout=b"", stderr=b""
+            )
+
+            attempt_automatic_merge(branch_name="feature-branch", project_dir=project_dir)
+
+            cmd = mock_run.call_args[0][0]
+            assert "--no-edit" in cmd
+            assert "--no-verify" in cmd
+            assert cmd[-1] == "feature-branch"
 
     def test_returns_error_on_git_failure(self, tmp_path):
         """attempt_automatic_merge() returns MergeStatus.ERROR on non-conflict git failure."""
@@ -81,8 +130,8 @@ class TestAttemptAutomaticMerge:
             mock_run.return_value = subprocess.CompletedProcess(
                 args=["git", "merge", "nonexistent-branch"],
                 returncode=128,
-                stdout="",
-                stderr="merge: nonexistent-branch - not something we can merge\n",
+                stdout=b"",
+                stderr=b"merge: nonexistent-branch - not something we can merge\n",
             )
 
             result = attempt_automatic_merge(
@@ -122,8 +171,8 @@ class TestAttemptAutomaticMerge:
             mock_run.return_value = subprocess.CompletedProcess(
                 args=["git", "merge", "already-merged-branch"],
                 returncode=0,
-                stdout="Already up to date.\n",
-                stderr="",
+                stdout=b"Already up to date.\n",
+                stderr=b"",
             )
 
             result = attempt_automatic_merge(
@@ -149,8 +198,8 @@ class TestDetectMergeConflicts:
             mock_run.return_value = subprocess.CompletedProcess(
                 args=["git", "diff", "--name-only", "--diff-filter=U"],
                 returncode=0,
-                stdout="",
-                stderr="",
+                stdout=b"",
+                stderr=b"",
             )
 
             conflicts = detect_merge_conflicts(project_dir)
@@ -168,8 +217,8 @@ class TestDetectMergeConflicts:
             mock_run.return_value = subprocess.CompletedProcess(
                 args=["git", "diff", "--name-only", "--diff-filter=U"],
                 returncode=0,
-                stdout="src/main.py\nconfig/settings.json\ntests/test_foo.py\n",
-                stderr="",
+                stdout=b"src/main.py\nconfig/settings.json\ntests/test_foo.py\n",
+                stderr=b"",
             )
 
             conflicts = detect_merge_conflicts(project_dir)
@@ -204,8 +253,8 @@ class TestDetectMergeConflicts:
             mock_run.return_value = subprocess.CompletedProcess(
                 args=["git", "diff", "--name-only", "--diff-filter=U"],
                 returncode=128,
-                stdout="",
-                stderr="fatal: not a git repository (or any of the parent directories): .git\n",
+                stdout=b"",
+                stderr=b"fatal: not a git repository (or any of the parent directories): .git\n",
             )
 
             conflicts = detect_merge_conflicts(project_dir)
@@ -223,8 +272,8 @@ class TestDetectMergeConflicts:
             mock_run.return_value = subprocess.CompletedProcess(
                 args=["git", "diff", "--name-only", "--diff-filter=U"],
                 returncode=0,
-                stdout="  src/main.py  \nconfig/settings.json\n\n",
-                stderr="",
+                stdout=b"  src/main.py  \nconfig/settings.json\n\n",
+                stderr=b"",
             )
 
             conflicts = detect_merge_conflicts(project_dir)
@@ -235,6 +284,23 @@ class TestDetectMergeConflicts:
             # Should not include empty strings
             assert "" not in conflicts
 
+    def test_handles_crlf_line_endings(self, tmp_path):
+        """detect_merge_conflicts() accepts CRLF-terminated output."""
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess(
+                args=["git", "diff", "--name-only", "--diff-filter=U"],
+                returncode=0,
+                stdout=b"src/main.py\r\nconfig/settings.json\r\n",
+                stderr=b"",
+            )
+
+            conflicts = detect_merge_conflicts(project_dir)
+
+            assert conflicts == ["src/main.py", "config/settings.json"]
+
 
 class TestFallbackBehavior:
     """Tests verifying that fallback behavior returns usable objects."""
@@ -317,3 +383,105 @@ class TestFallbackBehavior:
                 # Error path - error_message should be accessible
                 assert result.status == MergeStatus.ERROR
                 assert result.error_message is not None
+
+
+def _git(repo: Path, *args: str) -> None:
+    """Run a git command in repo, failing the test on error."""
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+
+def _make_repo_with_branches(repo: Path) -> Path:
+    """
+    Create a repo with a 'clean' branch (new file) and a 'clash' branch
+    (edits file.txt, which main also edits).
+    """
+    repo.mkdir()
+    _git(repo, "init", "-b", "main")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test User")
+    (repo / "file.txt").write_text("base\n")
+    _git(repo, "add", "file.txt")
+    _git(repo, "commit", "-m", "base")
+
+    _git(repo, "checkout", "-b", "clean")
+    (repo / "new.txt").write_text("new\n")
+    _git(repo, "add", "new.txt")
+    _git(repo, "commit", "-m", "clean")
+
+    _git(repo, "checkout", "-b", "clash", "main")
+    (repo / "file.txt").write_text("theirs\n")
+    _git(repo, "commit", "-am", "clash")
+
+    _git(repo, "checkout", "main")
+    (repo / "file.txt").write_text("ours\n")
+    _git(repo, "commit", "-am", "ours")
+    return repo
+
+
+class TestAsyncMerge:
+    """Tests for the asyncio merge variants against real git repositories."""
+
+    @pytest.mark.asyncio
+    async def test_async_merge_detects_conflict(self, tmp_path):
+        """attempt_automatic_merge_async() reports conflicted files."""
+        repo = _make_repo_with_branches(tmp_path / "repo")
+
+        result = await attempt_automatic_merge_async("clash", repo)
+
+        assert result.status == MergeStatus.CONFLICT
+        assert result.conflicted_files == ["file.txt"]
+
+    @pytest.mark.asyncio
+    async def test_merge_many_returns_results_in_input_order(self, tmp_path):
+        """merge_many() merges across repos and keeps input order."""
+        repo_a = _make_repo_with_branches(tmp_path / "a")
+        repo_b = _make_repo_with_branches(tmp_path / "b")
+
+        results = await merge_many([
+            ("clean", repo_a),
+            ("clash", repo_b),
+            ("missing-branch", repo_a),
+        ])
+
+        assert [r.status for r in results] == [
+            MergeStatus.MERGED,
+            MergeStatus.CONFLICT,
+            MergeStatus.ERROR,
+        ]
+        assert (repo_a / "new.txt").exists()
+
+    @pytest.mark.asyncio
+    async def test_merge_many_serializes_subdirectories_of_one_repo(self, tmp_path):
+        """Pairs naming the repo and a subdirectory of it never merge concurrently."""
+        repo = _make_repo_with_branches(tmp_path / "repo")
+        subdir = repo / "sub"
+        subdir.mkdir()
+
+        results = await merge_many([
+            ("clean", repo),
+            ("clash", subdir),
+        ])
+
+        # Concurrent merges would fail on index.lock instead of conflicting
+        assert [r.status for r in results] == [
+            MergeStatus.MERGED,
+            MergeStatus.CONFLICT,
+        ]
+        assert (repo / "new.txt").exists()
+
+    @pytest.mark.asyncio
+    async def test_merge_many_serializes_symlink_aliases_of_one_repo(self, tmp_path):
+        """A symlink to a repo is grouped with the repo it points at."""
+        repo = _make_repo_with_branches(tmp_path / "repo")
+        alias = tmp_path / "alias"
+        alias.symlink_to(repo, target_is_directory=True)
+
+        results = await merge_many([
+            ("clean", repo),
+            ("clash", alias),
+        ])
+
+        assert [r.status for r in results] == [
+            MergeStatus.MERGED,
+            MergeStatus.CONFLICT,
+        ]
@@ -3,22 +3,51 @@ Test Molecules: Metrics Persistence
 ===================================
 
 Tests for metrics persistence molecules that handle saving and loading
-sub-agent execution metrics in JSON format.
+sub-agent execution metrics in NDJSON format.
 """
 
 import json
+import os
+import threading
+from dataclasses import asdict
+from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 from src.director.metrics_molecules import (
     MetricsData,
     save_metrics,
     load_metrics,
     append_metrics,
+    count_metrics_since,
+    enqueue_metrics,
+    flush_metrics_queue,
+    load_metrics_since,
+    load_metrics_summary,
 )
 
 
+def _metrics(**overrides) -> MetricsData:
+    """Build a MetricsData entry from test defaults; keyword args replace fields."""
+    values = {
+        "start_time": "2025-12-16T10:00:00",
+        "end_time": "2025-12-16T10:05:00",
+        "duration": 300.0,
+        "status": "success",
+        "agent_type": "atom-writer",
+        "issue_id": "bd-1",
+    }
+    values.update(overrides)
+    return MetricsData(**values)
+
+
 class TestMetricsData:
     """Tests for MetricsData dataclass."""
 
@@ -43,11 +72,22 @@ class TestMetricsData:
         assert metrics.issue_id == "bd-123"
 
 
+    def test_metrics_data_has_no_instance_dict(self):
+        """MetricsData is slotted and rejects unknown attributes."""
+        # Arrange
+        metrics = _metrics(issue_id="bd-124")
+
+        # Assert
+        assert not hasattr(metrics, "__dict__")
+        with pytest.raises(AttributeError):
+            metrics.extra = "value"
+
+
 class TestSaveMetrics:
     """Tests for save_metrics() molecule."""
 
     def test_saves_metrics_list_to_json_file(self, tmp_path: Path):
-        """save_metrics() writes valid JSON to file."""
+        """save_metrics() writes one valid JSON object per line."""
         # Arrange
         metrics_file = tmp_path / "metrics.json"
         metrics_list = [
@@ -76,9 +116,9 @@ class TestSaveMetrics:
         assert result is True
         assert metrics_file.exists()
 
-        # Verify JSON content
+        # Verify NDJSON content
         with open(metrics_file, "r") as f:
-            data = json.load(f)
+            data = [json.loads(line) for line in f]
 
         assert len(data) == 2
         assert data[0]["issue_id"] == "bd-100"
@@ -119,11 +159,26 @@ class TestSaveMetrics:
         assert result is True
         assert metrics_file.exists()
 
-        # Verify JSON content is empty array
-        with open(metrics_file, "r") as f:
-            data = json.load(f)
+        # Verify file has no entries
+        assert metrics_file.read_text() == ""
+        assert load_metrics(metrics_file) == []
 
-        assert data == []
+
+    def test_round_trips_without_orjson(self, tmp_path: Path):
+        """save/load use stdlib json when orjson is not installed."""
+        # Arrange
+        metrics_file = tmp_path / "metrics.json"
+        entry = _metrics(issue_id="bd-250")
+
+        # Act
+        with patch("src.director.metrics_molecules.orjson", None), \
+                patch("src.director.metrics_molecules._json_loads", json.loads):
+            saved = save_metrics([entry], metrics_file)
+            loaded = load_metrics(metrics_file)
+
+        # Assert
+        assert saved is True
+        assert loaded == [entry]
 
 
 class TestLoadMetrics:
@@ -181,6 +236,51 @@ class TestLoadMetrics:
         # Assert
         assert result is None
 
+    def test_skips_malformed_lines(self, tmp_path: Path):
+        """load_metrics() keeps valid lines when others are malformed."""
+        # Arrange: Valid entry followed by a torn write
+        metrics_file = tmp_path / "metrics.json"
+        save_metrics([_metrics(issue_id="bd-310")], metrics_file)
+        with open(metrics_file, "a") as f:
+            f.write('{"start_time": "2025-12')
+
+        # Act
+        loaded = load_metrics(metrics_file)
+
+        # Assert
+        assert loaded is not None
+        assert [m.issue_id for m in loaded] == ["bd-310"]
+
+    def test_interns_repeated_status_and_agent_type(self, tmp_path: Path):
+        """Loaded entries share one string object per status/agent_type value."""
+        # Arrange
+        metrics_file = tmp_path / "metrics.json"
+        save_metrics([_metrics(issue_id=f"bd-33{n}") for n in range(2)], metrics_file)
+
+        # Act
+        first, second = load_metrics(metrics_file)
+
+        # Assert
+        assert first.agent_type is second.agent_type
+        assert first.status is second.status
+
+    def test_migrates_legacy_json_array(self, tmp_path: Path):
+        """load_metrics() reads the old array format and rewrites it as NDJSON."""
+        # Arrange: Pretty-printed array as written by older versions
+        metrics_file = tmp_path / "metrics.json"
+        legacy = [asdict(_metrics(issue_id="bd-320"))]
+        metrics_file.write_text(json.dumps(legacy, indent=2))
+
+        # Act
+        loaded = load_metrics(metrics_file)
+
+        # Assert
+        assert loaded is not None
+        assert [m.issue_id for m in loaded] == ["bd-320"]
+        lines = metrics_file.read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0]) == legacy[0]
+
     def test_loads_empty_metrics_list(self, tmp_path: Path):
         """load_metrics() returns empty list for file containing empty array."""
         # Arrange
@@ -283,3 +383,335 @@ class TestAppendMetrics:
         assert loaded is not None
         assert len(loaded) == 1
         assert loaded[0].issue_id == "bd-600"
+
+    def test_append_writes_single_line_without_rewriting(self, tmp_path: Path):
+        """append_metrics() adds one line and leaves existing bytes untouched."""
+        # Arrange
+        metrics_file = tmp_path / "metrics.json"
+        first = _metrics(issue_id="bd-700")
+        append_metrics(first, metrics_file)
+        before = metrics_file.read_bytes()
+
+        # Act
+        result = append_metrics(_metrics(status="failure", issue_id="bd-701"), metrics_file)
+
+        # Assert
+        assert result is True
+        after = metrics_file.read_bytes()
+        assert after.startswith(before)
+        assert after.count(b"\n") == 2
+
+    def test_concurrent_appends_keep_every_entry(self, tmp_path: Path):
+        """append_metrics() from several threads loses no lines."""
+        # Arrange
+        metrics_file = tmp_path / "metrics.json"
+
+        def worker(worker_id: int) -> None:
+            for n in range(25):
+                append_metrics(_metrics(issue_id=f"bd-{worker_id}-{n}"), metrics_file)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+
+        # Act
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # Assert
+        loaded = load_metrics(metrics_file)
+        assert len(loaded) == 100
+        assert len({m.issue_id for m in loaded}) == 100
+
+    def test_appends_to_legacy_json_array(self, tmp_path: Path):
+        """append_metrics() migrates a legacy array file before appending."""
+        # Arrange
+        metrics_file = tmp_path / "metrics.json"
+        metrics_file.write_text(json.dumps([asdict(_metrics(issue_id="bd-800"))], indent=2))
+
+        # Act
+        result = append_metrics(_metrics(issue_id="bd-801"), metrics_file)
+
+        # Assert
+        assert result is True
+        loaded = load_metrics(metrics_file)
+        assert [m.issue_id for m in loaded] == ["bd-800", "bd-801"]
+
+    def test_concurrent_appends_to_legacy_array_keep_every_entry(self, tmp_path: Path):
+        """Appenders racing the legacy migration lose no lines."""
+        # Arrange
+        metrics_file = tmp_path / "metrics.json"
+        metrics_file.write_text(json.dumps([asdict(_metrics(issue_id="bd-legacy"))]))
+
+        def worker(worker_id: int) -> None:
+            for n in range(10):
+                append_metrics(_metrics(issue_id=f"bd-{worker_id}-{n}"), metrics_file)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+
+        # Act
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # Assert
+        loaded = load_metrics(metrics_file)
+        assert len(loaded) == 41
+        assert len({m.issue_id for m in loaded}) == 41
+        assert list(tmp_path.iterdir()) == [metrics_file]
+
+    @pytest.mark.skipif(fcntl is None, reason="flock() not available")
+    def test_append_waiting_on_lock_follows_replaced_file(self, tmp_path: Path):
+        """An appender blocked during a migration writes to the new file."""
+        # Arrange: Hold the lock, as a migration does while it swaps files
+        metrics_file = tmp_path / "metrics.json"
+        metrics_file.write_bytes(b"")
+        replacement = tmp_path / "replacement.json"
+        save_metrics([_metrics(issue_id="bd-820")], replacement)
+        holder = open(metrics_file, "rb")
+        fcntl.flock(holder.fileno(), fcntl.LOCK_EX)
+        appender = threading.Thread(
+            target=append_metrics,
+            args=(_metrics(issue_id="bd-821"), metrics_file),
+        )
+
+        # Act
+        appender.start()
+        appender.join(timeout=0.1)
+        os.replace(replacement, metrics_file)
+        holder.close()
+        appender.join()
+
+        # Assert
+        loaded = load_metrics(metrics_file)
+        assert [m.issue_id for m in loaded] == ["bd-820", "bd-821"]
+
+    def test_refuses_to_append_to_malformed_legacy_array(self, tmp_path: Path):
+        """append_metrics() fails instead of burying entries behind a torn array."""
+        # Arrange: Legacy array cut off mid-write
+        metrics_file = tmp_path / "metrics.json"
+        torn = b'[{"start_time": "2025-12-16T10:00:00", "issue_id": "bd-810"},\n'
+        metrics_file.write_bytes(torn)
+
+        # Act
+        result = append_metrics(_metrics(issue_id="bd-811"), metrics_file)
+
+        # Assert
+        assert result is False
+        assert metrics_file.read_bytes() == torn
+
+
+class TestLoadMetricsCache:
+    """Tests for the mtime/size cache behind load_metrics()."""
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path: Path):
+        """A second load of an unchanged file skips the parse."""
+        # Arrange
+        metrics_file = tmp_path / "metrics.json"
+        save_metrics([_metrics(issue_id="bd-900")], metrics_file)
+        load_metrics(metrics_file)
+
+        # Act
+        with patch("src.director.metrics_molecules._json_loads") as mock_loads:
+            loaded = load_metrics(metrics_file)
+
+        # Assert
+        mock_loads.assert_not_called()
+        assert [m.issue_id for m in loaded] == ["bd-900"]
+
+    def test_append_is_visible_to_next_load(self, tmp_path: Path):
+        """append_metrics() invalidates the cached entry list."""
+        # Arrange
+        metrics_file = tmp_path / "metrics.json"
+        save_metrics([_metrics(issue_id="bd-910")], metrics_file)
+        load_metrics(metrics_file)
+
+        # Act
+        append_metrics(_metrics(issue_id="bd-911"), metrics_file)
+        loaded = load_metrics(metrics_file)
+
+        # Assert
+        assert [m.issue_id for m in loaded] == ["bd-910", "bd-911"]
+
+    def test_returned_list_does_not_alias_cache(self, tmp_path: Path):
+        """Mutating a loaded list does not affect later loads."""
+        # Arrange
+        metrics_file = tmp_path / "metrics.json"
+        save_metrics([_metrics(issue_id="bd-920")], metrics_file)
+
+        # Act
+        load_metrics(metrics_file).clear()
+        loaded = load_metrics(metrics_file)
+
+        # Assert
+        assert [m.issue_id for m in loaded] == ["bd-920"]
+
+    def test_append_extends_cache_without_reparse(self, tmp_path: Path):
+        """Appending to a cached file updates entries and counts in place."""
+        # Arrange
+        metrics_file = tmp_path / "metrics.json"
+        save_metrics([_metrics(issue_id="bd-930")], metrics_file)
+        load_metrics(metrics_file)
+        failed = _metrics(issue_id="bd-931")
+        failed.status = "failure"
+
+        # Act
+        append_metrics(failed, metrics_file)
+        with patch("src.director.metrics_molecules._json_loads") as mock_loads:
+            loaded = load_metrics(metrics_file)
+            summary = load_metrics_summary(metrics_file)
+
+        # Assert
+        mock_loads.assert_not_called()
+        assert [m.issue_id for m in loaded] == ["bd-930", "bd-931"]
+        assert (summary.total, summary.successful) == (2, 1)
+        assert summary.by_agent["atom-writer"] == [2, 1]
+
+    def test_summary_is_a_snapshot(self, tmp_path: Path):
+        """Appends after load_metrics_summary() leave the returned counts alone."""
+        # Arrange
+        metrics_file = tmp_path / "metrics.json"
+        save_metrics([_metrics(issue_id="bd-940")], metrics_file)
+        summary = load_metrics_summary(metrics_file)
+
+        # Act
+        append_metrics(_metrics(issue_id="bd-941"), metrics_file)
+
+        # Assert
+        assert (summary.total, summary.successful) == (1, 1)
+        assert summary.by_agent["atom-writer"] == [1, 1]
+        assert load_metrics_summary(metrics_file).total == 2
+
+
+class TestLoadMetricsSince:
+    """Tests for load_metrics_since() time window loading."""
+
+    def test_returns_entries_at_or_after_cutoff(self, tmp_path: Path):
+        """Entries in time order are cut at the first in-window start time."""
+        # Arrange
+        metrics_file = tmp_path / "metrics.json"
+        base = datetime(2025, 12, 16, 10, 0, 0)
+        save_metrics(
+            [_metrics(start_time=(base + timedelta(hours=h)).isoformat(), issue_id=f"bd-{h}") for h in range(5)],
+            metrics_file,
+        )
+
+        # Act
+        result = load_metrics_since(metrics_file, base + timedelta(hours=3))
+
+        # Assert
+        assert [m.issue_id for m in result] == ["bd-3", "bd-4"]
+
+    def test_handles_out_of_order_and_malformed_entries(self, tmp_path: Path):
+        """Unsorted files are filtered per entry; bad timestamps are excluded."""
+        # Arrange
+        metrics_file = tmp_path / "metrics.json"
+        save_metrics(
+            [
+                _metrics(start_time="2025-12-16T12:00:00", issue_id="bd-late"),
+                _metrics(start_time="not-a-timestamp", issue_id="bd-bad"),
+                _metrics(start_time="2025-12-16T09:00:00", issue_id="bd-early"),
+                _metrics(start_time="2025-12-16T11:00:00", issue_id="bd-mid"),
+            ],
+            metrics_file,
+        )
+
+        # Act
+        result = load_metrics_since(metrics_file, datetime(2025, 12, 16, 10, 0, 0))
+
+        # Assert
+        assert [m.issue_id for m in result] == ["bd-late", "bd-mid"]
+
+    def test_returns_none_for_missing_file(self, tmp_path: Path):
+        """load_metrics_since() returns None when the file doesn't exist."""
+        assert load_metrics_since(tmp_path / "missing.json", datetime.now()) is None
+
+
+class TestCountMetricsSince:
+    """Tests for count_metrics_since() windowed counts."""
+
+    def _write(self, metrics_file: Path, order) -> datetime:
+        base = datetime(2025, 12, 16, 10, 0, 0)
+        rows = [
+            (0, "success", "atom-writer"),
+            (1, "failure", "atom-writer"),
+            (2, "success", "molecule-composer"),
+            (3, "success", "atom-writer"),
+            (4, "failure", "molecule-composer"),
+        ]
+        save_metrics(
+            [
+                _metrics(
+                    start_time=(base + timedelta(hours=hours)).isoformat(),
+                    status=status,
+                    agent_type=agent_type,
+                )
+                for hours, status, agent_type in (rows[i] for i in order)
+            ],
+            metrics_file,
+        )
+        return base
+
+    @pytest.mark.parametrize("order", [[0, 1, 2, 3, 4], [4, 2, 0, 3, 1]])
+    def test_counts_window_with_and_without_agent_filter(self, tmp_path: Path, order):
+        """Sorted (binary search) and unsorted (scan) files give the same counts."""
+        # Arrange
+        metrics_file = tmp_path / "metrics.json"
+        base = self._write(metrics_file, order)
+        cutoff = base + timedelta(hours=1)
+
+        # Act / Assert
+        assert count_metrics_since(metrics_file, cutoff) == (4, 2)
+        assert count_metrics_since(metrics_file, cutoff, "atom-writer") == (2, 1)
+        assert count_metrics_since(metrics_file, cutoff, "molecule-composer") == (2, 1)
+        assert count_metrics_since(metrics_file, cutoff, "unknown") == (0, 0)
+
+    def test_counts_include_appended_entries(self, tmp_path: Path):
+        """Entries appended after the first load are counted."""
+        # Arrange
+        metrics_file = tmp_path / "metrics.json"
+        base = self._write(metrics_file, [0, 1, 2, 3, 4])
+        count_metrics_since(metrics_file, base)
+
+        # Act
+        append_metrics(_metrics(start_time=(base + timedelta(hours=5)).isoformat()), metrics_file)
+
+        # Assert
+        assert count_metrics_since(metrics_file, base + timedelta(hours=3), "atom-writer") == (2, 2)
+
+
+class TestEnqueueMetrics:
+    """Tests for the batched background writer."""
+
+    def test_queued_entries_are_written_after_flush(self, tmp_path: Path):
+        """flush_metrics_queue() waits until queued entries are on disk."""
+        # Arrange
+        metrics_file = tmp_path / "metrics.json"
+
+        # Act
+        for n in range(10):
+            enqueue_metrics(_metrics(issue_id=f"bd-{n}"), metrics_file)
+        flush_metrics_queue()
+
+        # Assert
+        loaded = load_metrics(metrics_file)
+        assert [m.issue_id for m in loaded] == [f"bd-{n}" for n in range(10)]
+
+    def test_burst_is_coalesced_into_fewer_writes(self, tmp_path: Path):
+        """A burst of queued entries is appended in batches, not one by one."""
+        # Arrange
+        metrics_file = tmp_path / "metrics.json"
+
+        # Act
+        with patch(
+            "src.director.metrics_molecules._append_entries", return_value=True
+        ) as mock_append:
+            for n in range(20):
+                enqueue_metrics(_metrics(issue_id=f"bd-{n}"), metrics_file)
+            flush_metrics_queue()
+
+        # Assert
+        written = [m for call in mock_append.call_args_list for m in call.args[1]]
+        assert len(written) == 20
+        assert mock_append.call_count < 20
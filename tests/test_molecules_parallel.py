@@ -17,7 +17,7 @@ import pytest
 from src.director.parallel_molecules import (
     snapshot_file_tree,
     GitSnapshotError,
-    _parse_porcelain_output,
+    _parse_porcelain_v2_output,
 )
 
 
@@ -101,6 +101,33 @@ class TestSnapshotFileTree:
         assert "test.txt" in result["modified_files"]
         assert "M" in result["git_status"] or " M" in result["git_status"]
 
+    def test_git_status_matches_porcelain_v1_for_awkward_names(self, tmp_path):
+        """git_status quotes paths exactly as `git status --porcelain` does."""
+        def git(*args):
+            return subprocess.run(
+                ["git", "-c", "core.quotePath=true", *args],
+                cwd=tmp_path,
+                capture_output=True,
+                check=True,
+            )
+
+        git("init")
+        git("config", "user.email", "test@test.com")
+        git("config", "user.name", "Test User")
+        (tmp_path / "base.txt").write_text("initial content")
+        git("add", ".")
+        git("commit", "-m", "Initial")
+
+        # Names that would break line splitting or the " -> " rename arrow
+        for name in ("new\nline", "a -> b", 'quote"d', "caf\u00e9", "plain.txt"):
+            (tmp_path / name).write_text("")
+        git("mv", "base.txt", "renamed -> here")
+
+        result = snapshot_file_tree(tmp_path)
+
+        assert result["git_status"] == git("status", "--porcelain").stdout.decode()
+        assert "new\nline" in result["modified_files"]
+
     def test_raises_error_for_non_git_directory(self, tmp_path):
         """snapshot_file_tree() raises GitSnapshotError for non-git directory."""
         # tmp_path is not a git repo
@@ -123,34 +150,51 @@ class TestSnapshotFileTree:
         assert "does not exist" in str(exc_info.value)
 
 
-class TestParsePorcelainOutput:
-    """Tests for _parse_porcelain_output() internal helper."""
+class TestParsePorcelainV2Output:
+    """Tests for _parse_porcelain_v2_output() internal helper."""
 
-    def test_parses_modified_file(self):
-        """Parses modified file from porcelain output."""
-        output = " M src/file.py\n"
-        result = _parse_porcelain_output(output)
-        assert result == ["src/file.py"]
+    SHA = "0123456789abcdef0123456789abcdef01234567"
 
-    def test_parses_untracked_file(self):
-        """Parses untracked file from porcelain output."""
-        output = "?? new_file.py\n"
-        result = _parse_porcelain_output(output)
-        assert result == ["new_file.py"]
+    def _header(self, oid: str = SHA) -> bytes:
+        return f"# branch.oid {oid}\0# branch.head main\0".encode()
 
-    def test_parses_multiple_files(self):
-        """Parses multiple files from porcelain output."""
-        output = " M file1.py\n?? file2.py\nA  file3.py\n"
-        result = _parse_porcelain_output(output)
-        assert len(result) == 3
-        assert "file1.py" in result
-        assert "file2.py" in result
-        assert "file3.py" in result
+    def test_reads_head_from_branch_header(self):
+        """HEAD SHA comes from the branch.oid header."""
+        head, entries = _parse_porcelain_v2_output(self._header())
+        assert head == self.SHA
+        assert entries == []
 
-    def test_handles_empty_output(self):
-        """Returns empty list for empty/clean status."""
-        result = _parse_porcelain_output("")
-        assert result == []
+    def test_initial_branch_has_no_head(self):
+        """A repository without commits reports no HEAD."""
+        head, _ = _parse_porcelain_v2_output(self._header("(initial)"))
+        assert head is None
 
-        result = _parse_porcelain_output("   ")
-        assert result == []
+    def test_parses_modified_untracked_and_added(self):
+        """Ordinary and untracked entries map to v1 status codes."""
+        output = self._header() + (
+            b"1 .M N... 100644 100644 100644 aaa bbb src/file.py\0"
+            b"1 A. N... 000000 100644 100644 000 ccc file 3.py\0"
+            b"? new_file.py\0"
+        )
+        _, entries = _parse_porcelain_v2_output(output)
+        assert entries == [
+            (" M", "src/file.py", None),
+            ("A ", "file 3.py", None),
+            ("??", "new_file.py", None),
+        ]
+
+    def test_parses_rename_with_original_path(self):
+        """Renames report the new path and keep the original."""
+        output = self._header() + (
+            b"2 R. N... 100644 100644 100644 aaa aaa R100 new name.py\0old_name.py\0"
+            b"? after.py\0"
+        )
+        _, entries = _parse_porcelain_v2_output(output)
+        assert entries == [
+            ("R ", "new name.py", "old_name.py"),
+            ("??", "after.py", None),
+        ]
+
+    def test_handles_empty_output(self):
+        """Returns no HEAD and no entries for empty output."""
+        assert _parse_porcelain_v2_output(b"") == (None, [])
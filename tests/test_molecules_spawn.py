@@ -10,6 +10,7 @@ These molecules compose 2-3 atoms into cohesive units for:
 """
 
 import json
+import subprocess
 from pathlib import Path
 from subprocess import CompletedProcess
 from unittest.mock import patch
@@ -18,9 +19,12 @@ import pytest
 
 # Molecules to be implemented in src/director/spawn_molecules.py
 from src.director.spawn_molecules import (
+    _extract_yaml_frontmatter,
     load_agent_file,
     load_issue_from_beads,
+    load_issues_from_beads,
     build_delegation_context,
+    verify_issue_closed,
 )
 
 
@@ -55,6 +59,53 @@ Do the test things.""")
         assert "# Test Agent Instructions" in prompt
         assert "Do the test things." in prompt
 
+    def test_reuses_parsed_agent_file_until_it_changes(self, tmp_path: Path):
+        """load_agent_file() parses an unchanged file once and re-reads edits."""
+        # Arrange
+        agents_dir = tmp_path / ".claude" / "agents" / "agent-os"
+        agents_dir.mkdir(parents=True)
+        agent_file = agents_dir / "cached-agent.md"
+        agent_file.write_text("---\nmodel: sonnet\n---\nFirst prompt")
+
+        # Act
+        with patch(
+            "src.director.spawn_molecules._extract_yaml_frontmatter",
+            wraps=_extract_yaml_frontmatter,
+        ) as mock_parse:
+            _, first, _ = load_agent_file("cached-agent", tmp_path)
+            first["model"] = "mutated"
+            _, second, _ = load_agent_file("cached-agent", tmp_path)
+            agent_file.write_text("---\nmodel: opus\n---\nSecond, longer prompt")
+            _, third, prompt = load_agent_file("cached-agent", tmp_path)
+
+        # Assert
+        assert mock_parse.call_count == 2
+        assert second["model"] == "sonnet"
+        assert third["model"] == "opus"
+        assert prompt == "Second, longer prompt"
+
+    def test_identical_agent_files_share_one_parse(self, tmp_path: Path):
+        """load_agent_file() parses identical content once across files."""
+        # Arrange: two templated agents with the same text
+        agents_dir = tmp_path / ".claude" / "agents" / "agent-os"
+        agents_dir.mkdir(parents=True)
+        content = f"---\nmodel: haiku\n---\nTemplated prompt for {tmp_path}"
+        (agents_dir / "writer-a.md").write_text(content)
+        (agents_dir / "writer-b.md").write_text(content)
+
+        # Act
+        with patch(
+            "src.director.spawn_molecules._extract_yaml_frontmatter",
+            wraps=_extract_yaml_frontmatter,
+        ) as mock_parse:
+            path_a, frontmatter_a, _ = load_agent_file("writer-a", tmp_path)
+            path_b, frontmatter_b, _ = load_agent_file("writer-b", tmp_path)
+
+        # Assert
+        assert mock_parse.call_count == 1
+        assert path_a.name == "writer-a.md" and path_b.name == "writer-b.md"
+        assert frontmatter_a == frontmatter_b == {"model": "haiku"}
+
     def test_falls_back_to_implementer_when_agent_not_found(self, tmp_path: Path):
         """load_agent_file() falls back to implementer.md when requested agent missing."""
         # Arrange: Create only implementer fallback, not the requested agent
@@ -136,6 +187,98 @@ class TestLoadIssueFromBeads:
         # Assert
         assert issue is None
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @patch("src.director.spawn_molecules.subprocess.run")
+    def test_parses_bytes_output_with_either_parser(
+        self, mock_run: patch, tmp_path: Path, use_orjson: bool
+    ):
+        """load_issue_from_beads() parses raw bytes with orjson or stdlib json."""
+        # Arrange
+        import src.director.spawn_molecules as spawn_molecules
+
+        loads = spawn_molecules._json_loads if use_orjson else json.loads
+        mock_run.side_effect = [
+            CompletedProcess(args=[], returncode=0, stdout='{"id": "bd-1", "title": "Caf\u00e9"}'.encode()),
+            CompletedProcess(args=[], returncode=0, stdout=b"{not json"),
+        ]
+
+        # Act
+        with patch.object(spawn_molecules, "_json_loads", loads):
+            issue = load_issue_from_beads("bd-1", tmp_path)
+            broken = load_issue_from_beads("bd-1", tmp_path)
+
+        # Assert
+        assert issue["title"] == "Caf\u00e9"
+        assert broken is None
+
+    @patch("src.director.spawn_molecules.subprocess.run")
+    def test_discards_stderr_when_not_debugging(self, mock_run: patch, tmp_path: Path):
+        """load_issue_from_beads() sends bd stderr to DEVNULL outside debug logging."""
+        # Arrange
+        mock_run.return_value = CompletedProcess(args=[], returncode=0, stdout="{}")
+
+        # Act
+        load_issue_from_beads("bd-1", tmp_path)
+
+        # Assert
+        assert mock_run.call_args.kwargs["stderr"] is subprocess.DEVNULL
+        assert mock_run.call_args.kwargs["stdout"] is subprocess.PIPE
+
+
+class TestLoadIssuesFromBeads:
+    """Tests for load_issues_from_beads() molecule.
+
+    This molecule loads many issues with a single bd CLI call.
+    """
+
+    @patch("src.director.spawn_molecules.subprocess.run")
+    def test_loads_all_ids_with_one_bd_show(self, mock_run: patch, tmp_path: Path):
+        """load_issues_from_beads() passes every ID to one bd show call."""
+        # Arrange
+        mock_run.return_value = CompletedProcess(
+            args=[],
+            returncode=0,
+            stdout=json.dumps([
+                {"id": "bd-1", "title": "One", "priority": 1},
+                {"id": "bd-2", "title": "Two", "status": "closed"},
+            ])
+        )
+
+        # Act
+        issues = load_issues_from_beads(["bd-1", "bd-2"], tmp_path)
+
+        # Assert
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0] == ["bd", "show", "bd-1", "bd-2", "--json"]
+        assert issues["bd-1"]["title"] == "One"
+        assert issues["bd-1"]["status"] == "open"
+        assert issues["bd-2"]["status"] == "closed"
+
+    @patch("src.director.spawn_molecules.subprocess.run")
+    def test_falls_back_to_bd_list(self, mock_run: patch, tmp_path: Path):
+        """load_issues_from_beads() filters bd list output when bd show fails."""
+        # Arrange: bd show fails, bd list returns more issues than requested
+        mock_run.side_effect = [
+            CompletedProcess(args=[], returncode=1, stdout="", stderr="unknown"),
+            CompletedProcess(args=[], returncode=0, stdout=json.dumps([
+                {"id": "bd-1", "title": "One"},
+                {"id": "bd-3", "title": "Three"},
+            ])),
+        ]
+
+        # Act
+        issues = load_issues_from_beads(["bd-1", "bd-2"], tmp_path)
+
+        # Assert
+        assert mock_run.call_args.args[0] == ["bd", "list", "--json"]
+        assert list(issues) == ["bd-1"]
+
+    @patch("src.director.spawn_molecules.subprocess.run")
+    def test_empty_id_list_runs_nothing(self, mock_run: patch, tmp_path: Path):
+        """load_issues_from_beads() returns {} without calling bd for no IDs."""
+        assert load_issues_from_beads([], tmp_path) == {}
+        mock_run.assert_not_called()
+
 
 class TestBuildDelegationContext:
     """Tests for build_delegation_context() molecule.
@@ -186,3 +329,89 @@ class TestBuildDelegationContext:
         # Assert: Workflow commands present
         assert "bd update bd-42 --status in_progress" in context
         assert "bd close bd-42" in context
+
+    @pytest.mark.parametrize("priority,expected", [
+        (0, "- Priority: P0"),
+        ("P3", "- Priority: P3"),
+        (None, "- Priority: None"),
+    ])
+    def test_formats_priority(self, priority, expected):
+        """build_delegation_context() shows int priorities as P<n>."""
+        # Arrange
+        issue = {"id": "bd-9", "priority": priority}
+
+        # Act
+        context = build_delegation_context(issue, "prompt", "task")
+
+        # Assert
+        assert expected in context
+
+    def test_missing_priority_defaults_to_p2(self):
+        """build_delegation_context() uses the bd default priority 2 when absent."""
+        context = build_delegation_context({"id": "bd-9"}, "prompt", "task")
+
+        assert "- Priority: P2" in context
+
+    def test_braces_in_prompt_are_not_template_fields(self):
+        """build_delegation_context() copies {braces} in prompt text verbatim."""
+        # Arrange
+        issue = {"id": "bd-5", "title": "Braces"}
+
+        # Act
+        context = build_delegation_context(
+            issue=issue,
+            agent_prompt="Use {id} and {{literal}} as-is.",
+            task_instructions="Return {\"ok\": true}."
+        )
+
+        # Assert
+        assert "Use {id} and {{literal}} as-is." in context
+        assert 'Return {"ok": true}.' in context
+        assert "bd close bd-5" in context
+
+
+class TestVerifyIssueClosed:
+    """Tests for verify_issue_closed() molecule.
+
+    This molecule reads only the issue status from the bd CLI.
+    """
+
+    @pytest.mark.parametrize("status,expected", [
+        ("closed", True),
+        ("Done", True),
+        ("completed", True),
+        ("open", False),
+        ("in_progress", False),
+    ])
+    @patch("src.director.spawn_molecules.subprocess.run")
+    def test_maps_status_to_closed(self, mock_run: patch, tmp_path: Path, status: str, expected: bool):
+        """verify_issue_closed() treats done/closed/complete(d) as closed, case-insensitively."""
+        # Arrange
+        mock_run.return_value = CompletedProcess(
+            args=["bd", "show", "bd-7", "--json"],
+            returncode=0,
+            stdout=json.dumps({"id": "bd-7", "status": status})
+        )
+
+        # Act & Assert
+        assert verify_issue_closed("bd-7", tmp_path) is expected
+        mock_run.assert_called_once()
+
+    @pytest.mark.parametrize("returncode,stdout", [
+        (1, ""),
+        (0, "not json"),
+        (0, "[]"),
+        (0, json.dumps({"id": "bd-7"})),
+    ])
+    @patch("src.director.spawn_molecules.subprocess.run")
+    def test_unreadable_issue_is_not_closed(self, mock_run: patch, tmp_path: Path, returncode: int, stdout: str):
+        """verify_issue_closed() returns False when the status cannot be read."""
+        # Arrange
+        mock_run.return_value = CompletedProcess(
+            args=["bd", "show", "bd-7", "--json"],
+            returncode=returncode,
+            stdout=stdout
+        )
+
+        # Act & Assert
+        assert verify_issue_closed("bd-7", tmp_path) is False
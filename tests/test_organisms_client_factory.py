@@ -20,6 +20,7 @@ from src.director.client_factory import (
     create_subagent_client,
     build_security_settings,
     parse_tools_from_frontmatter,
+    write_settings_file,
     DEFAULT_TOOLS,
     DEFAULT_MCP_SERVERS,
 )
@@ -33,34 +34,36 @@ class TestParseToolsFromFrontmatter:
     """
 
     def test_parses_comma_separated_tools(self):
-        """Comma-separated tools are parsed into a list."""
+        """Comma-separated tools are parsed into a tuple."""
         frontmatter = {"tools": "Read, Write, Bash"}
         result = parse_tools_from_frontmatter(frontmatter)
-        assert result == ["Read", "Write", "Bash"]
+        assert result == ("Read", "Write", "Bash")
 
     def test_returns_defaults_when_tools_missing(self):
         """Returns default tools when 'tools' key is missing."""
         frontmatter = {"model": "sonnet"}
         result = parse_tools_from_frontmatter(frontmatter)
-        assert result == list(DEFAULT_TOOLS)
+        assert result == DEFAULT_TOOLS
+        # The shared immutable default is returned without copying
+        assert result is DEFAULT_TOOLS
 
     def test_strips_whitespace_from_tool_names(self):
         """Whitespace is stripped from individual tool names."""
         frontmatter = {"tools": "  Read  ,   Write  ,Bash"}
         result = parse_tools_from_frontmatter(frontmatter)
-        assert result == ["Read", "Write", "Bash"]
+        assert result == ("Read", "Write", "Bash")
 
     def test_handles_empty_tools_string(self):
-        """Empty tools string returns empty list, not defaults."""
+        """Empty tools string returns empty tuple, not defaults."""
         frontmatter = {"tools": ""}
         result = parse_tools_from_frontmatter(frontmatter)
-        assert result == []
+        assert result == ()
 
     def test_handles_single_tool(self):
         """Single tool without comma is parsed correctly."""
         frontmatter = {"tools": "Read"}
         result = parse_tools_from_frontmatter(frontmatter)
-        assert result == ["Read"]
+        assert result == ("Read",)
 
 
 class TestBuildSecuritySettings:
@@ -101,6 +104,13 @@ class TestBuildSecuritySettings:
         allow_list = settings["permissions"]["allow"]
         assert "Bash(*)" in allow_list
 
+    def test_preserves_order_and_passes_unknown_tools_through(self):
+        """Allow list follows input order; unknown tools are kept verbatim."""
+        settings = build_security_settings(
+            ["Bash", "WebFetch", "Read"], Path("/tmp/project"), enable_mcp=False
+        )
+        assert settings["permissions"]["allow"] == ["Bash(*)", "WebFetch", "Read(./**)"]
+
     def test_excludes_tools_not_in_list(self):
         """Tools not in the allowed list are excluded from permissions."""
         settings = build_security_settings(["Read"], Path("/tmp/project"))
@@ -250,3 +260,87 @@ tools: Read
             settings = json.loads(settings_file.read_text())
             assert "sandbox" in settings
             assert "permissions" in settings
+
+
+class TestWriteSettingsFile:
+    """Tests for write_settings_file() helper.
+
+    Identical settings are not rewritten while the file is untouched.
+    """
+
+    def test_writes_json_settings(self, tmp_path: Path):
+        """Settings are written as JSON to the project directory."""
+        settings = build_security_settings(["Read"], tmp_path)
+
+        settings_file = write_settings_file(settings, tmp_path / "project")
+
+        assert settings_file == tmp_path / "project" / ".claude_subagent_settings.json"
+        assert json.loads(settings_file.read_text()) == settings
+
+    def test_existing_directory_is_not_recreated(self, tmp_path: Path):
+        """No mkdir is attempted when the project directory already exists."""
+        settings = build_security_settings(["Read"], tmp_path)
+
+        with patch.object(Path, "mkdir") as mock_mkdir:
+            write_settings_file(settings, tmp_path)
+
+        mock_mkdir.assert_not_called()
+
+    def test_skips_rewrite_of_identical_settings(self, tmp_path: Path):
+        """A second write of identical settings does not touch the file."""
+        settings = build_security_settings(["Read", "Bash"], tmp_path)
+        write_settings_file(settings, tmp_path)
+
+        with patch.object(Path, "write_bytes") as mock_write:
+            write_settings_file(settings, tmp_path)
+
+        mock_write.assert_not_called()
+
+    def test_rewrites_when_settings_change(self, tmp_path: Path):
+        """Different settings are written even if a previous write was cached."""
+        write_settings_file(build_security_settings(["Read"], tmp_path), tmp_path)
+        changed = build_security_settings(["Read", "Write"], tmp_path)
+
+        settings_file = write_settings_file(changed, tmp_path)
+
+        assert json.loads(settings_file.read_text()) == changed
+
+    def test_rewrites_when_file_removed(self, tmp_path: Path):
+        """A deleted settings file is recreated even with identical content."""
+        settings = build_security_settings(["Read"], tmp_path)
+        settings_file = write_settings_file(settings, tmp_path)
+        settings_file.unlink()
+
+        write_settings_file(settings, tmp_path)
+
+        assert json.loads(settings_file.read_text()) == settings
+
+
+class TestGetOAuthToken:
+    """Tests for _get_oauth_token() cached environment lookup."""
+
+    @pytest.fixture(autouse=True)
+    def reset_cached_token(self, monkeypatch):
+        import src.director.client_factory as client_factory
+        monkeypatch.setattr(client_factory, "_CACHED_TOKEN", None)
+
+    def test_raises_when_token_missing(self, monkeypatch):
+        """A missing token raises ValueError and is not cached."""
+        from src.director.client_factory import _get_oauth_token
+
+        monkeypatch.delenv("CLAUDE_CODE_OAUTH_TOKEN", raising=False)
+        with pytest.raises(ValueError, match="CLAUDE_CODE_OAUTH_TOKEN"):
+            _get_oauth_token()
+
+        monkeypatch.setenv("CLAUDE_CODE_OAUTH_TOKEN", "late-token")
+        assert _get_oauth_token() == "late-token"
+
+    def test_token_read_once(self, monkeypatch):
+        """After the first successful read the environment is not consulted."""
+        from src.director.client_factory import _get_oauth_token
+
+        monkeypatch.setenv("CLAUDE_CODE_OAUTH_TOKEN", "first-token")
+        assert _get_oauth_token() == "first-token"
+
+        monkeypatch.delenv("CLAUDE_CODE_OAUTH_TOKEN")
+        assert _get_oauth_token() == "first-token"
@@ -254,19 +254,19 @@ class TestConflictHandlerIntegration:
                 return subprocess.CompletedProcess(
                     args=cmd,
                     returncode=1,
-                    stdout="",
-                    stderr="CONFLICT (content): Merge conflict in file.txt\nAutomatic merge failed",
+                    stdout=b"",
+                    stderr=b"CONFLICT (content): Merge conflict in file.txt\nAutomatic merge failed",
                 )
             elif "diff" in cmd:
                 # Second call: git diff --diff-filter=U shows conflicts
                 return subprocess.CompletedProcess(
                     args=cmd,
                     returncode=0,
-                    stdout="src/main.py\nconfig.json\n",
-                    stderr="",
+                    stdout=b"src/main.py\nconfig.json\n",
+                    stderr=b"",
                 )
             else:
-                return subprocess.CompletedProcess(args=cmd, returncode=0, stdout="", stderr="")
+                return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=b"", stderr=b"")
 
         with patch("subprocess.run", side_effect=mock_subprocess_run):
             # Act
@@ -295,8 +295,8 @@ class TestConflictHandlerIntegration:
             mock_run.return_value = subprocess.CompletedProcess(
                 args=["git", "merge", "feature"],
                 returncode=0,
-                stdout="Merge made by the 'ort' strategy.",
-                stderr="",
+                stdout=b"Merge made by the 'ort' strategy.",
+                stderr=b"",
             )
 
             # Act
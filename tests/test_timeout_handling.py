@@ -7,6 +7,7 @@ Tests cover: normal completion, timeout triggered, cleanup on timeout.
 """
 
 import asyncio
+import math
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -119,6 +120,25 @@ class TestRunWithTimeoutNormalCompletion:
         assert result.elapsed_seconds < 1.0  # Should not be wildly off
 
 
+    @pytest.mark.asyncio
+    async def test_infinite_timeout_schedules_no_timer(self):
+        """run_with_timeout() with math.inf awaits without a loop timer."""
+        # Arrange
+        loop = asyncio.get_running_loop()
+
+        async def check_no_timer():
+            return len(loop._scheduled)
+
+        # Act
+        scheduled = await run_with_timeout(
+            check_no_timer(),
+            timeout_seconds=math.inf,
+        )
+
+        # Assert
+        assert scheduled == 0
+
+
 class TestRunWithTimeoutTriggered:
     """Tests for run_with_timeout() when timeout is triggered."""
 
@@ -164,6 +184,32 @@ class TestRunWithTimeoutTriggered:
         assert result.result is None
         assert isinstance(result.error, TimeoutError)
 
+    @pytest.mark.parametrize("limit", [0, -1.5])
+    @pytest.mark.asyncio
+    async def test_non_positive_timeout_fails_without_running(self, limit):
+        """run_with_timeout() rejects a timeout <= 0 without starting the coroutine."""
+        # Arrange
+        started = False
+
+        async def never_started():
+            nonlocal started
+            started = True
+            return "unreachable"
+
+        # Act
+        with pytest.raises(TimeoutError):
+            await run_with_timeout(never_started(), timeout_seconds=limit)
+        result = await run_with_timeout(
+            never_started(),
+            timeout_seconds=limit,
+            raise_on_timeout=False,
+        )
+
+        # Assert
+        assert started is False
+        assert result.timed_out is True
+        assert result.elapsed_seconds == 0.0
+
     @pytest.mark.asyncio
     async def test_timeout_error_contains_context(self):
         """TimeoutError includes operation name and timeout value."""
@@ -381,6 +427,14 @@ class TestTimeoutResult:
 
         assert "error=" in repr_str
 
+    def test_uses_slots(self):
+        """TimeoutResult stores its fields in slots, without a __dict__."""
+        result = TimeoutResult(success=True, result=1)
+
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.unexpected = True
+
 
 # =============================================================================
 # TimeoutError Tests